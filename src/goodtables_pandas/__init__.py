@@ -1,9 +1,27 @@
 """Read and validate Frictionless Data Tabular Data Packages with pandas."""
+from . import cache
 from . import check
+from . import geopoint
 from . import json
 from . import options
 from . import parse
+from . import profiling
 from . import read
-from .validate import validate
+from . import schema
+from .schema import compile_schema
+from .validate import validate, validate_frames
 
-__all__ = ["check", "json", "options", "parse", "read", "validate"]
+__all__ = [
+    "cache",
+    "check",
+    "compile_schema",
+    "geopoint",
+    "json",
+    "options",
+    "parse",
+    "profiling",
+    "read",
+    "schema",
+    "validate",
+    "validate_frames",
+]
@@ -0,0 +1,144 @@
+"""Cache table check results on disk."""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, List, Optional
+import zipfile
+
+from typing_extensions import Literal
+
+from . import options as OPTIONS
+from .read import _split_archive
+from .schema import compile_schema
+
+# Version of the cached results, to be incremented when their content changes
+_VERSION = 5
+
+
+def _fingerprint_file(
+    path: str, by: Literal["content", "stat"] = "content", size: int = 2**20
+) -> Optional[List[Any]]:
+    """
+    Fingerprint a local file.
+
+    Files in zip archives (see :func:`read._split_archive`) are fingerprinted by
+    the checksum (CRC-32) and size recorded in the archive.
+
+    Arguments:
+        path: File path.
+        by: Whether to fingerprint the file by its content (SHA-256 hash) or,
+            faster but less safe, by its size and modification time (stat).
+        size: Number of bytes to read at a time.
+
+    Returns:
+        Fingerprint, or `None` if the path is not a local file.
+    """
+    split = _split_archive(path)
+    if split is not None:
+        with zipfile.ZipFile(split[0]) as zip:
+            info = zip.getinfo(split[1])
+        return [info.CRC, info.file_size]
+    if not os.path.isfile(path):
+        return None
+    if by == "stat":
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(size), b""):
+            digest.update(block)
+    return [digest.hexdigest()]
+
+
+def hash_table(
+    resource: dict,
+    path: List[str],
+    by: Literal["content", "stat"] = "content",
+    chunksize: int = None,
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+) -> Optional[str]:
+    """
+    Hash everything that the check results of a table depend on.
+
+    This includes the resource descriptor, the compiled table schema, the relevant
+    options, and a fingerprint of each file.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor.
+        path: Path(s) to files to read.
+        by: Whether to fingerprint files by content or by size and modification time.
+        chunksize: Maximum number of rows read at a time
+            (see :func:`validate.validate`).
+        engine: Parser engine (see :func:`read.read_table`).
+        row_numbers: Whether the rows of invalid values are listed
+            (see :func:`validate.validate`).
+
+    Returns:
+        Hexadecimal digest, or `None` if any of the files is not a local file.
+    """
+    files = [_fingerprint_file(p, by=by) for p in path]
+    if any(f is None for f in files):
+        return None
+    content = {
+        "version": _VERSION,
+        "resource": {k: v for k, v in resource.items() if k != "schema"},
+        "schema": compile_schema(resource.get("schema", {})).key,
+        "options": [
+            OPTIONS.max_values,
+            OPTIONS.parse_unique_ratio,
+            OPTIONS.raise_first_invalid_integer,
+            OPTIONS.raise_first_invalid_number,
+            chunksize,
+            engine,
+            row_numbers,
+        ],
+        "files": files,
+    }
+    text = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def load_result(directory: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load cached table check result.
+
+    Arguments:
+        directory: Cache directory.
+        key: Table hash (see :func:`hash_table`).
+
+    Returns:
+        Cached result, or `None` if not found or not readable.
+    """
+    try:
+        with open(os.path.join(directory, key + ".pickle"), "rb") as file:
+            return pickle.load(file)
+    except Exception:
+        # Unpickling can fail in many ways (e.g. after a pandas upgrade),
+        # so any unreadable result is treated as missing and checked again
+        return None
+
+
+def save_result(directory: str, key: str, result: Dict[str, Any]) -> None:
+    """
+    Save table check result to the cache.
+
+    The file is written under a temporary name and then renamed, so that a result
+    is never read partially written.
+
+    Arguments:
+        directory: Cache directory (created if it does not exist).
+        key: Table hash (see :func:`hash_table`).
+        result: Table check result.
+    """
+    os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, os.path.join(directory, key + ".pickle"))
+    except BaseException:
+        os.remove(temp)
+        raise
@@ -1,10 +1,24 @@
 """Table keys and field constraint checking."""
-from typing import Any, Dict, Iterable, List, Union
+import copy
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 from typing_extensions import Literal
 
 from .errors import (
+    _summarize_values,
     ConstraintError,
     ConstraintTypeError,
     ForeignKeyError,
@@ -12,33 +26,62 @@ from .errors import (
     UniqueKeyError,
 )
 from .parse import parse_field_constraint
+from .profiling import stage
+
+if TYPE_CHECKING:
+    from .schema import CompiledSchema
 
 # ---- Field constraints ----
 
 
 def check_constraints(
-    df: pd.DataFrame, schema: dict
+    df: pd.DataFrame,
+    schema: Union[dict, "CompiledSchema"],
+    codes: Dict[str, Tuple[np.ndarray, int]] = None,
+    error_limit: int = None,
+    fail_fast: bool = False,
+    stats: dict = None,
 ) -> List[Union[ConstraintError, ConstraintTypeError]]:
     """
     Check table field constraints.
 
     Arguments:
         df: Table.
-        schema: Table schema (https://specs.frictionlessdata.io/table-schema).
+        schema: Table schema (https://specs.frictionlessdata.io/table-schema),
+            or the same compiled for reuse (see :func:`schema.compile_schema`).
+        codes: Field codes by field name, for reuse by key checks
+            (see :func:`_factorize_key`).
+        error_limit: If set (at least 1), no more fields are checked once this many
+            errors have been found.
+        fail_fast: Whether to stop checking each field at its first failed
+            constraint (see :func:`check_field_constraints`).
+        stats: If set, the time and memory taken to check each field are added to it
+            (see :func:`profiling.stage`).
 
     Returns:
         A list of errors.
     """
+    if isinstance(schema, dict):
+        fields = [
+            (field["name"], _compile_field_constraints(field))
+            for field in schema.get("fields", [])
+        ]
+    else:
+        fields = [(field.name, field.constraints) for field in schema.fields]
     errors = []
-    for field in schema.get("fields", []):
-        constraints = field.get("constraints", {})
-        result = check_field_constraints(df[field["name"]], **constraints, field=field)
+    for name, constraints in fields:
+        if error_limit is not None and len(errors) >= error_limit:
+            break
+        with stage("constraints", name, stats=stats, data=df[name]):
+            result = _check_field_constraints(
+                df[name], name, codes=codes, fail_fast=fail_fast, **constraints
+            )
         if result:
             errors += result
     return errors
 
 
-def check_field_constraints(  # noqa: C901
+def check_field_constraints(
     x: pd.Series,
     required: bool = False,
     unique: bool = False,
@@ -49,12 +92,18 @@ def check_field_constraints(  # noqa: C901
     pattern: str = None,
     enum: Iterable[Union[str, int, float, bool]] = None,
     field: dict = {},
+    codes: Dict[str, Tuple[np.ndarray, int]] = None,
+    fail_fast: bool = False,
 ) -> List[Union[ConstraintError, ConstraintTypeError]]:
     """
     Check field constraints.
 
     See https://specs.frictionlessdata.io/table-schema/#constraints.
 
+    The field is factorized at most once, and length, pattern, and enum constraints
+    are checked against its unique values only. Range constraints are first checked
+    against the minimum and maximum values.
+
     Arguments:
         x: Field values.
         required: Whether values must not be null.
@@ -67,58 +116,63 @@ def check_field_constraints(  # noqa: C901
         enum: Values which field values must match exactly.
         field: Field descriptor
             (https://specs.frictionlessdata.io/table-schema/#field-descriptors).
+        codes: Field codes by field name, for reuse by key checks
+            (see :func:`_factorize_key`). Codes computed for the field are added to it.
+        fail_fast: Whether to stop at the first failed constraint, in the order
+            `required`, `unique`, `minLength`, `maxLength`, `minimum`, `maximum`,
+            `pattern`, and `enum`.
 
     Returns:
         A list of errors.
     """
+    constraints = {
+        "required": required,
+        "unique": unique,
+        "minLength": minLength,
+        "maxLength": maxLength,
+        "minimum": minimum,
+        "maximum": maximum,
+        "pattern": pattern,
+        "enum": enum,
+    }
+    constraints = _compile_field_constraints({**field, "constraints": constraints})
     name = field.get("name", "field")
-    type = field.get("type", "string")
-    errors = []
-    if required and x.isna().any():
-        errors.append(
-            ConstraintError(
-                fieldName=name,
-                constraintName="required",
-                constraintValue=required,
-                values=[float("nan")],
-            )
+    with stage("constraints", name, data=x):
+        return _check_field_constraints(
+            x, name, codes=codes, fail_fast=fail_fast, **constraints
         )
-    if unique:
-        # NOTE: Pandas considers nulls equal (not unique)
-        invalid = x.duplicated()
-        if invalid.any():
-            errors.append(
-                ConstraintError(
-                    fieldName=name,
-                    constraintName="unique",
-                    constraintValue=unique,
-                    values=list(x[invalid].unique()),
-                )
-            )
-    x = x.dropna()
-    length_types = ("string", "array", "object")
-    if minLength is not None and type in length_types:
-        invalid = x.str.len() < minLength
-        if invalid.any():
-            errors.append(
-                ConstraintError(
-                    fieldName=name,
-                    constraintName="minLength",
-                    constraintValue=minLength,
-                    values=list(x[invalid].unique()),
-                )
-            )
-    if maxLength is not None and type in length_types:
-        invalid = x.str.len() > maxLength
-        if invalid.any():
-            errors.append(
-                ConstraintError(
-                    fieldName=name,
-                    constraintName="minLength",
-                    constraintValue=maxLength,
-                    values=list(x[invalid].unique()),
-                )
-            )
+
+
+def _compile_field_constraints(field: dict) -> Dict[str, Any]:
+    """
+    Prepare field constraints for checking.
+
+    Constraints which do not apply to the field type are dropped,
+    constraint values are parsed to the field type,
+    and `pattern` is compiled (as `regex`).
+
+    Arguments:
+        field: Field descriptor
+            (https://specs.frictionlessdata.io/table-schema/#field-descriptors).
+
+    Returns:
+        Arguments to :func:`_check_field_constraints`. Constraint values which
+        could not be parsed are replaced by the error.
+
+    Examples:
+        >>> field = {'type': 'integer', 'constraints': {'minimum': '1', 'pattern': 'x'}}
+        >>> _compile_field_constraints(field)
+        {'minimum': 1}
+    """
+    type = field.get("type", "string")
+    constraints = {
+        key: value
+        for key, value in field.get("constraints", {}).items()
+        if value is not None
+    }
+    if type not in ("string", "array", "object"):
+        constraints.pop("minLength", None)
+        constraints.pop("maxLength", None)
     minmax_types = (
         "integer",
         "number",
@@ -128,62 +182,120 @@ def check_field_constraints(  # noqa: C901
         "year",
         "yearmonth",
     )
-    if minimum is not None and type in minmax_types:
-        minimum = parse_field_constraint(minimum, "minimum", **field)
-        if isinstance(minimum, ConstraintTypeError):
-            errors.append(minimum)
-        else:
-            invalid = x < minimum
-            if invalid.any():
-                errors.append(
-                    ConstraintError(
-                        fieldName=name,
-                        constraintName="minimum",
-                        constraintValue=minimum,
-                        values=list(x[invalid].unique()),
-                    )
-                )
-    if maximum is not None and type in minmax_types:
-        maximum = parse_field_constraint(maximum, "maximum", **field)
-        if isinstance(maximum, ConstraintTypeError):
-            errors.append(maximum)
-        else:
-            invalid = x > maximum
-            if invalid.any():
-                errors.append(
-                    ConstraintError(
-                        fieldName=name,
-                        constraintName="maximum",
-                        constraintValue=maximum,
-                        values=list(x[invalid].unique()),
-                    )
-                )
-    if pattern and type in ("string",):
-        invalid = ~x.str.match("^" + pattern + "$")
+    if type not in minmax_types:
+        constraints.pop("minimum", None)
+        constraints.pop("maximum", None)
+    if type not in ("string",) or not constraints.get("pattern"):
+        constraints.pop("pattern", None)
+    else:
+        constraints["regex"] = re.compile("^" + constraints["pattern"] + "$")
+    if not constraints.get("enum"):
+        constraints.pop("enum", None)
+    for key in ("minimum", "maximum", "enum"):
+        if key in constraints:
+            constraints[key] = parse_field_constraint(constraints[key], key, **field)
+    return constraints
+
+
+def _check_field_constraints(  # noqa: C901
+    x: pd.Series,
+    name: str,
+    required: bool = False,
+    unique: bool = False,
+    minLength: int = None,
+    maxLength: int = None,
+    minimum: Any = None,
+    maximum: Any = None,
+    pattern: str = None,
+    regex: Pattern = None,
+    enum: List[Any] = None,
+    codes: Dict[str, Tuple[np.ndarray, int]] = None,
+    fail_fast: bool = False,
+) -> List[Union[ConstraintError, ConstraintTypeError]]:
+    """
+    Check field constraints prepared by :func:`_compile_field_constraints`.
+
+    See :func:`check_field_constraints`.
+    """
+    errors = []
+
+    def check(constraint: str, value: Any, values: pd.Series, invalid: Any) -> None:
+        if fail_fast and errors:
+            return
         if invalid.any():
+            kwargs = {}
+            if field_codes is not None and values is not x:
+                # Unique values (by position) are counted by their rows
+                kwargs = {"codes": field_codes, "index": x.index}
             errors.append(
                 ConstraintError(
                     fieldName=name,
-                    constraintName="pattern",
-                    constraintValue=pattern,
-                    values=list(x[invalid].unique()),
+                    constraintName=constraint,
+                    constraintValue=value,
+                    **_summarize_values(values[invalid], **kwargs),
                 )
             )
-    if enum:
-        enum = parse_field_constraint(enum, "enum", **field)
-        if isinstance(enum, ConstraintTypeError):
-            errors.append(enum)
-        else:
-            invalid = ~x.isin(enum)
-            if invalid.any():
-                errors.append(
-                    ConstraintError(
-                        fieldName=name,
-                        constraintName="enum",
-                        constraintValue=enum,
-                        values=list(x[invalid].unique()),
-                    )
-                )
+
+    # Factorize field if any constraint depends only on the unique values
+    if unique or minLength is not None or maxLength is not None or pattern or enum:
+        field_codes, uniques = pd.factorize(x.array)
+        if codes is not None and name not in codes:
+            codes[name] = field_codes.astype(np.int64) + 1, len(uniques) + 1
+        values = pd.Series(uniques, dtype=x.dtype)
+        isna = field_codes < 0
+    else:
+        field_codes, values = None, None
+        isna = x.isna()
+    if required and isna.any():
+        # Missing values are listed as nan, regardless of data type
+        summary = {**_summarize_values(x[np.asarray(isna)]), "values": [float("nan")]}
+        errors.append(
+            ConstraintError(
+                fieldName=name,
+                constraintName="required",
+                constraintValue=required,
+                **summary,
+            )
+        )
+        if fail_fast:
+            return errors
+    if unique:
+        # NOTE: Pandas considers nulls equal (not unique)
+        check("unique", unique, x, pd.Series(field_codes).duplicated().values)
+    if minLength is not None or maxLength is not None:
+        lengths = values.str.len()
+        if minLength is not None:
+            check("minLength", minLength, values, lengths < minLength)
+        if maxLength is not None:
+            check("maxLength", maxLength, values, lengths > maxLength)
+    if fail_fast and errors:
+        return errors
+    if minimum is not None or maximum is not None:
+        if values is None:
+            values = x
+        # Compare all values only if the extreme value is out of range
+        if isinstance(minimum, ConstraintTypeError):
+            errors.append(copy.copy(minimum))
+        elif minimum is not None:
+            least = values.min()
+            if not pd.isna(least) and least < minimum:
+                valid = values.dropna()
+                check("minimum", minimum, valid, valid < minimum)
+        if isinstance(maximum, ConstraintTypeError):
+            errors.append(copy.copy(maximum))
+        elif maximum is not None:
+            greatest = values.max()
+            if not pd.isna(greatest) and greatest > maximum:
+                valid = values.dropna()
+                check("maximum", maximum, valid, valid > maximum)
+    if fail_fast and errors:
+        return errors
+    if pattern:
+        check("pattern", pattern, values, ~values.str.match(regex))
+    if isinstance(enum, ConstraintTypeError):
+        errors.append(copy.copy(enum))
+    elif enum:
+        check("enum", enum, values, ~values.isin(enum))
     return errors
 
 
@@ -211,11 +323,318 @@ def _as_list(x: Any) -> List[Any]:
     return x
 
 
+# Hash of null values, so that nulls hash equal regardless of type or payload
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _hash_column(x: pd.Series) -> np.ndarray:
+    """
+    Hash field values.
+
+    Equal values hash equal regardless of data type: whole numbers hash the same as
+    integers (`1.0` as `1`), `-0.0` hashes as `0.0`, and all nulls hash equal.
+
+    Arguments:
+        x: Field values.
+
+    Returns:
+        One 64-bit hash per value.
+
+    Examples:
+        >>> a = _hash_column(pd.Series([1, 2, None], dtype='Int64'))
+        >>> b = _hash_column(pd.Series([1.0, 2.0, float('nan')]))
+        >>> (a == b).all()
+        True
+    """
+    isna = x.isna().to_numpy(dtype=bool)
+    if pd.api.types.is_bool_dtype(x.dtype):
+        hashes = pd.util.hash_pandas_object(x, index=False, categorize=False).values
+    elif pd.api.types.is_integer_dtype(x.dtype):
+        values = x.to_numpy(dtype=np.int64, na_value=0)
+        hashes = pd.util.hash_array(values, categorize=False)
+    elif pd.api.types.is_float_dtype(x.dtype):
+        values = x.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+        hashes = pd.util.hash_array(values, categorize=False)
+        # Whole numbers are hashed as integers
+        with np.errstate(invalid="ignore"):
+            whole = (np.floor(values) == values) & (np.abs(values) < 2**63)
+        if whole.any():
+            hashes[whole] = pd.util.hash_array(
+                values[whole].astype(np.int64), categorize=False
+            )
+    else:
+        hashes = pd.util.hash_pandas_object(x, index=False, categorize=False).values
+    if isna.any():
+        hashes = hashes.copy()
+        hashes[isna] = _NULL_HASH
+    return hashes
+
+
+def _hash_key(
+    df: pd.DataFrame, key: List[str], hashes: Dict[str, np.ndarray] = None
+) -> np.ndarray:
+    """
+    Hash table key values.
+
+    Each field is hashed with :func:`_hash_column` and field hashes are combined in
+    key order. Nulls hash equal to each other, consistent with
+    :meth:`pd.DataFrame.duplicated`. Hashes only depend on values, not field names.
+
+    Arguments:
+        df: Table.
+        key: Key field names.
+        hashes: Field hashes by field name, for reuse across keys.
+            Hashes not yet computed are added to it.
+
+    Returns:
+        One 64-bit hash per row.
+    """
+    if hashes is None:
+        hashes = {}
+    for name in key:
+        if name not in hashes:
+            hashes[name] = _hash_column(df[name])
+    result = hashes[key[0]]
+    for name in key[1:]:
+        result = (result * np.uint64(0x100000001B3)) ^ hashes[name]
+    return result
+
+
+def _factorize_key(
+    df: pd.DataFrame, key: List[str], codes: Dict[str, Tuple[np.ndarray, int]] = None
+) -> np.ndarray:
+    """
+    Encode table key values as integers.
+
+    Each field is factorized once and field codes are combined in key order.
+    Nulls are equal to each other, consistent with :meth:`pd.DataFrame.duplicated`.
+
+    Arguments:
+        df: Table.
+        key: Key field names.
+        codes: Field codes (starting at 0 for null) and number of codes by field name,
+            for reuse across keys. Codes not yet computed are added to it.
+
+    Returns:
+        One integer per row, equal for rows with equal key values.
+
+    Examples:
+        >>> df = pd.DataFrame({'x': [1, 1, None], 'y': ['a', 'b', 'a']})
+        >>> _factorize_key(df, ['x', 'y']).tolist()
+        [4, 5, 1]
+    """
+    if codes is None:
+        codes = {}
+    for name in key:
+        if name not in codes:
+            field_codes, uniques = pd.factorize(df[name])
+            codes[name] = field_codes.astype(np.int64) + 1, len(uniques) + 1
+    result, size = codes[key[0]]
+    for name in key[1:]:
+        field_codes, field_size = codes[name]
+        if size * field_size > np.iinfo(np.int64).max:
+            result, uniques = pd.factorize(result)
+            size = len(uniques)
+        result, size = result * field_size + field_codes, size * field_size
+    return result
+
+
+def _find_duplicates(
+    df: pd.DataFrame, key: List[str], codes: Dict[str, Tuple[np.ndarray, int]] = None
+) -> np.ndarray:
+    """
+    Find duplicate table key values.
+
+    Equivalent to :meth:`pd.DataFrame.duplicated`, but reuses field codes across keys
+    (see :func:`_factorize_key`).
+
+    Arguments:
+        df: Table.
+        key: Key field names.
+        codes: Field codes by field name (see :func:`_factorize_key`).
+
+    Returns:
+        Whether each row repeats the key values of an earlier row.
+
+    Examples:
+        >>> df = pd.DataFrame({'x': [1, 1, 2, 1], 'y': ['a', 'b', 'a', 'a']})
+        >>> _find_duplicates(df, ['x', 'y']).tolist()
+        [False, False, False, True]
+    """
+    return pd.Series(_factorize_key(df, key, codes)).duplicated().values
+
+
+def _index_key(y: pd.DataFrame) -> List[Tuple[pd.Index, Optional[pd.Index]]]:
+    """
+    Index the unique key values of a table.
+
+    Each field is factorized, and field codes are combined in key order and
+    renumbered by their unique combinations. The index is proportional in size to
+    the number of unique key values, not the number of rows.
+
+    Arguments:
+        y: Table key values.
+
+    Returns:
+        For each field, the unique field values and the unique combinations of codes
+        of the fields so far (`None` for the first field).
+    """
+    index = []
+    codes = None
+    for i in range(y.shape[1]):
+        field_codes, uniques = pd.factorize(y.iloc[:, i])
+        if codes is None:
+            codes, combinations = field_codes, None
+        else:
+            found = (codes >= 0) & (field_codes >= 0)
+            codes = np.where(found, codes * len(uniques) + field_codes, -1)
+            combinations = pd.Index(pd.unique(codes[found]))
+            codes = np.where(found, combinations.get_indexer(codes), -1)
+        index.append((pd.Index(uniques), combinations))
+    return index
+
+
+def _isin_key(
+    x: pd.DataFrame,
+    index: List[Tuple[pd.Index, Optional[pd.Index]]],
+    size: int = 2**20,
+) -> np.ndarray:
+    """
+    Find table key values in an index of key values.
+
+    Rows are looked up in blocks of `size` rows, so that memory use beyond the index
+    and the result is bounded.
+
+    Arguments:
+        x: Table key values.
+        index: Index of key values, with fields in the same order as `x`
+            (see :func:`_index_key`).
+        size: Number of rows per block.
+
+    Returns:
+        Whether the key values of each row of `x` are in the index.
+        Rows with null key values are never found.
+
+    Examples:
+        >>> x = pd.DataFrame({'a': [1, 1, 2, None], 'b': ['a', 'b', 'b', 'b']})
+        >>> y = pd.DataFrame({'c': [1, 2, 2], 'd': ['a', 'a', 'b']})
+        >>> _isin_key(x, _index_key(y)).tolist()
+        [True, False, True, False]
+    """
+    found = np.zeros(len(x), dtype=bool)
+    for start in range(0, len(x), size):
+        block = x.iloc[start : start + size]
+        codes = None
+        for i, (uniques, combinations) in enumerate(index):
+            field_codes = uniques.get_indexer(block.iloc[:, i])
+            if codes is None:
+                codes = field_codes
+            else:
+                valid = (codes >= 0) & (field_codes >= 0)
+                codes = np.where(valid, codes * len(uniques) + field_codes, -1)
+                codes = np.where(valid, combinations.get_indexer(codes), -1)
+        found[start : start + size] = codes >= 0
+    return found
+
+
+def _merge_key_hashes(
+    seen: List[np.ndarray],
+    counts: List[np.ndarray] = None,
+    geometric: bool = False,
+) -> None:
+    """
+    Merge sorted runs of unique key hashes (and their counts), from the last run.
+
+    Runs are expected to share no hash, and each is merged with
+    :func:`np.searchsorted` and :func:`np.insert`, in linear time.
+
+    Arguments:
+        seen: Sorted runs of unique hashes, updated in place.
+        counts: If set, the number of rows of each hash, by run, updated in place.
+        geometric: Whether to only merge runs while the last run is at least as
+            long as the run before it (see :func:`_update_key_hashes`), rather than
+            merge all runs into one.
+
+    Examples:
+        >>> seen = [np.array([1, 4], 'u8'), np.array([2, 5], 'u8'), np.array([3], 'u8')]
+        >>> counts = [np.array([1, 1]), np.array([2, 1]), np.array([3])]
+        >>> _merge_key_hashes(seen, counts, geometric=True)
+        >>> [run.tolist() for run in seen]
+        [[1, 4], [2, 5], [3]]
+        >>> _merge_key_hashes(seen, counts)
+        >>> seen[0].tolist(), counts[0].tolist()
+        ([1, 2, 3, 4, 5], [1, 2, 3, 1, 1])
+    """
+    while len(seen) > 1 and (not geometric or len(seen[-2]) <= len(seen[-1])):
+        new, old = seen.pop(), seen.pop()
+        i = np.searchsorted(old, new)
+        seen.append(np.insert(old, i, new))
+        if counts is not None:
+            new, old = counts.pop(), counts.pop()
+            counts.append(np.insert(old, i, new))
+
+
+def _update_key_hashes(
+    seen: List[np.ndarray], hashes: np.ndarray, counts: List[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Find repeated key hashes and add new ones to those already seen.
+
+    Hashes seen are kept as sorted runs of unique hashes. The distinct new hashes
+    are searched for in each run, and those not found are added as a new run.
+    Runs are then merged while the last run is at least as long as the run before
+    it (see :func:`_merge_key_hashes`), so that there are at most log2(n) runs for
+    n unique hashes, and each hash is merged at most log2(n) times, rather than
+    all hashes sorted again for each update.
+
+    Arguments:
+        seen: Sorted runs of unique hashes seen so far, updated in place.
+        hashes: New hashes.
+        counts: If set, the number of rows of each hash in `seen`, by run,
+            updated in place.
+
+    Returns:
+        Whether each new hash is a repeat (of a hash seen before or earlier in
+        `hashes`).
+
+    Examples:
+        >>> seen, counts = [], []
+        >>> _update_key_hashes(seen, np.array([3, 1, 3], 'u8'), counts).tolist()
+        [False, False, True]
+        >>> _update_key_hashes(seen, np.array([2, 1], 'u8'), counts).tolist()
+        [False, True]
+        >>> [run.tolist() for run in seen], [run.tolist() for run in counts]
+        ([[1, 3], [2]], [[2, 2], [1]])
+    """
+    unique, first, inverse, n = np.unique(
+        hashes, return_index=True, return_inverse=True, return_counts=True
+    )
+    found = np.zeros(len(unique), dtype=bool)
+    for k, run in enumerate(seen):
+        if not len(run):
+            continue
+        i = np.minimum(np.searchsorted(run, unique), len(run) - 1)
+        matched = run[i] == unique
+        found |= matched
+        if counts is not None:
+            counts[k][i[matched]] += n[matched]
+    repeated = np.ones(len(hashes), dtype=bool)
+    repeated[first] = False
+    repeated |= found[inverse]
+    if not found.all():
+        seen.append(unique[~found])
+        if counts is not None:
+            counts.append(n[~found])
+        _merge_key_hashes(seen, counts, geometric=True)
+    return repeated
+
+
 def check_primary_key(
     df: pd.DataFrame,
     primaryKey: Union[str, List[str]],
     skip_required: bool = False,
     skip_single: bool = False,
+    codes: Dict[str, Tuple[np.ndarray, int]] = None,
 ) -> List[Union[ConstraintError, PrimaryKeyError]]:
     """
     Check table primary key.
@@ -225,6 +644,8 @@ def check_primary_key(
         primaryKey: Primary key field names.
         skip_required: Whether to not check for missing values in primary key fields.
         skip_single: Whether to not check for duplicates if primary key is one field.
+        codes: Field codes by field name, for reuse across keys
+            (see :func:`_factorize_key`).
 
     Returns:
         A list of errors.
@@ -239,12 +660,12 @@ def check_primary_key(
                 )
         if skip_single and len(key) < 2:
             return errors
-        invalid = df.duplicated(subset=key)
+        invalid = _find_duplicates(df, key, codes)
         if invalid.any():
             errors.append(
                 PrimaryKeyError(
                     primaryKey=key,
-                    values=df[key][invalid].drop_duplicates().values.tolist(),
+                    **_summarize_values(df[key][invalid]),
                 )
             )
     return errors
@@ -254,6 +675,8 @@ def check_unique_keys(
     df: pd.DataFrame,
     uniqueKeys: Iterable[Union[str, List[str]]],
     skip_single: bool = False,
+    codes: Dict[str, Tuple[np.ndarray, int]] = None,
+    stats: dict = None,
 ) -> List[Union[ConstraintError, UniqueKeyError]]:
     """
     Check table unique keys.
@@ -262,23 +685,30 @@ def check_unique_keys(
         df: Table.
         uniqueKeys: Unique key field names.
         skip_single: Whether to not check for duplicates if unique key is one field.
+        codes: Field codes by field name, for reuse across keys
+            (see :func:`_factorize_key`).
+        stats: If set, the time and memory taken to check each key are added to it
+            (see :func:`profiling.stage`), by field names joined by commas.
 
     Returns:
         A list of errors.
     """
     errors = []
+    if codes is None:
+        codes = {}
     for uniqueKey in uniqueKeys:
         key = _as_list(uniqueKey)
         if skip_single and len(key) < 2:
             continue
-        invalid = df.duplicated(subset=key)
-        if invalid.any():
-            errors.append(
-                UniqueKeyError(
-                    uniqueKey=key,
-                    values=df[key][invalid].drop_duplicates().values.tolist(),
+        with stage("uniqueKeys", ",".join(key), stats=stats, data=df, columns=key):
+            invalid = _find_duplicates(df, key, codes)
+            if invalid.any():
+                errors.append(
+                    UniqueKeyError(
+                        uniqueKey=key,
+                        **_summarize_values(df[key][invalid]),
+                    )
                 )
-            )
     return errors
 
 
@@ -287,6 +717,8 @@ def check_foreign_keys(  # noqa: C901
     foreignKeys: Iterable[dict],
     references: Dict[str, pd.DataFrame] = {},
     constraint: Literal["uniquekey", "primarykey"] = None,
+    indexes: Dict[Tuple[str, Tuple[str, ...]], list] = None,
+    stats: dict = None,
 ) -> List[Union[ConstraintError, PrimaryKeyError, UniqueKeyError, ForeignKeyError]]:
     """
     Check table foreign keys.
@@ -298,6 +730,11 @@ def check_foreign_keys(  # noqa: C901
         references: Foreign tables to check against.
         constraint: Whether to treat the key in the foreign table as a
             primary ('primarykey') or unique ('uniquekey') key.
+        indexes: Indexes of foreign table keys (see :func:`_index_key`) by foreign
+            table name and key field names, for reuse across tables.
+            Indexes not yet computed are added to it.
+        stats: If set, the time and memory taken to check each key are added to it
+            (see :func:`profiling.stage`), by local field names joined by commas.
 
     Returns:
         A list of errors.
@@ -332,21 +769,26 @@ def check_foreign_keys(  # noqa: C901
                     )
                 errors.append(e)
         # Check local key in parent key (or has null values)
-        if len(ckey) == 1:
-            x, y = child[ckey], parent[pkey]
-            invalid = ~(x.iloc[:, 0].isin(y.iloc[:, 0]) | x.iloc[:, 0].isna())
-        else:
-            key = range(len(ckey))
-            x, y = child[ckey].set_axis(key, axis=1), parent[pkey].set_axis(key, axis=1)
-            invalid = ~(
-                pd.concat([y, x]).duplicated().iloc[len(y) :] | x.isna().any(axis=1)
-            )
-        if invalid.any():
-            errors.append(
-                ForeignKeyError(
-                    reference=parent_name,
-                    foreignKey=foreignKey,
-                    values=x[invalid].drop_duplicates().values.tolist(),
+        with stage(
+            "foreignKeys", ",".join(ckey), stats=stats, data=child, columns=ckey
+        ):
+            x = child[ckey]
+            if indexes is not None and parent is not child:
+                if (parent_name, tuple(pkey)) not in indexes:
+                    indexes[(parent_name, tuple(pkey))] = _index_key(parent[pkey])
+                invalid = ~_isin_key(x, indexes[(parent_name, tuple(pkey))])
+            elif len(pkey) == 1:
+                invalid = ~x.iloc[:, 0].isin(parent[pkey[0]]).to_numpy(dtype=bool)
+            else:
+                invalid = ~_isin_key(x, _index_key(parent[pkey]))
+            if invalid.any():
+                invalid[invalid] = x[invalid].notna().all(axis=1).values
+            if invalid.any():
+                errors.append(
+                    ForeignKeyError(
+                        reference=parent_name,
+                        foreignKey=foreignKey,
+                        **_summarize_values(x[invalid]),
+                    )
                 )
-            )
     return errors
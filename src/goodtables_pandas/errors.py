@@ -1,7 +1,206 @@
 """Custom error construction."""
-from typing import Any, List
+import contextlib
+import threading
+from typing import Any, Iterator, List, Union
 
 import frictionless
+import numpy as np
+import pandas as pd
+
+from . import options as OPTIONS
+
+_local = threading.local()
+
+# Names of the index levels of tables read with row numbers (see read.read_table)
+_ROW_INDEX = ("file", "row")
+
+
+@contextlib.contextmanager
+def _value_codes(codes: np.ndarray, index: pd.Index) -> Iterator[None]:
+    """
+    Count the rows of the distinct values summarized in this thread.
+
+    Used when parsing only the distinct values of a field (see
+    :func:`parse._parse_unique`), so that :func:`_summarize_values` counts
+    and locates the rows of each invalid value rather than the value once.
+
+    Arguments:
+        codes: Position of the value of each row in the distinct values being
+            parsed, or -1 if null (see :func:`pd.factorize`).
+        index: Row labels.
+    """
+    previous = getattr(_local, "codes", None)
+    _local.codes = codes, index
+    try:
+        yield
+    finally:
+        _local.codes = previous
+
+
+def _cap_row_numbers(ranges: List[list]) -> List[list]:
+    """
+    Limit row number ranges to :data:`options.max_values` rows, merging adjacent ones.
+
+    Arguments:
+        ranges: Row number ranges (file, first row, last row), sorted.
+
+    Returns:
+        Row number ranges.
+
+    Examples:
+        >>> OPTIONS.max_values = 3
+        >>> _cap_row_numbers([[0, 1, 2], [0, 3, 3], [0, 5, 9], [1, 1, 1]])
+        [[0, 1, 3]]
+        >>> OPTIONS.max_values = None
+    """
+    capped, n = [], 0
+    for file, first, last in ranges:
+        if OPTIONS.max_values is not None:
+            if n >= OPTIONS.max_values:
+                break
+            last = min(last, first + OPTIONS.max_values - n - 1)
+        n += last - first + 1
+        if capped and capped[-1][0] == file and capped[-1][2] + 1 == first:
+            capped[-1][2] = last
+        else:
+            capped.append([file, first, last])
+    return capped
+
+
+def _row_numbers(index: pd.MultiIndex) -> List[list]:
+    """
+    Encode the rows of a table read with row numbers as ranges of row numbers.
+
+    Arguments:
+        index: Row labels (file number, row number starting at zero).
+
+    Returns:
+        Row number ranges (file number, first row, last row), with row numbers
+        starting at 1, limited to :data:`options.max_values` rows
+        (see :func:`_cap_row_numbers`).
+
+    Examples:
+        >>> index = pd.MultiIndex.from_tuples([(1, 0), (0, 4), (0, 2), (0, 3)])
+        >>> _row_numbers(index)
+        [[0, 3, 5], [1, 1, 1]]
+    """
+    files = index.get_level_values(0).to_numpy()
+    rows = index.get_level_values(1).to_numpy()
+    order = np.lexsort((rows, files))
+    files, rows = files[order], rows[order]
+    if OPTIONS.max_values is not None:
+        files, rows = files[: OPTIONS.max_values], rows[: OPTIONS.max_values]
+    breaks = np.flatnonzero((np.diff(rows) != 1) | (np.diff(files) != 0)) + 1
+    starts = np.concatenate([[0], breaks]).astype(int)
+    ends = np.concatenate([breaks, [len(rows)]]).astype(int) - 1
+    return [
+        [int(files[i]), int(rows[i]) + 1, int(rows[j]) + 1]
+        for i, j in zip(starts, ends)
+        if len(rows)
+    ]
+
+
+def _index_values(index: pd.Index, x: Union[pd.Series, pd.DataFrame]) -> list:
+    """
+    List distinct field or key values.
+
+    Missing values are listed as they are in `x` (e.g. `None`), since pandas
+    < 1.4 counts them as `NaN`.
+
+    Arguments:
+        index: Distinct values of `x`.
+        x: Values of a field (series) or key (table).
+
+    Returns:
+        Values, as lists of field values if `x` is a table.
+
+    Examples:
+        >>> _index_values(pd.Index(['a', np.nan]), pd.Series(['a', None]))
+        ['a', None]
+    """
+
+    def null(field: pd.Series) -> Any:
+        return field[field.isna().to_numpy(dtype=bool)].iloc[0]
+
+    if isinstance(x, pd.Series):
+        values = index.tolist()
+        for i in np.flatnonzero(index.isna()):
+            values[i] = null(x)
+        return values
+    labels = index.to_frame()
+    values = labels.values.tolist()
+    for j, isna in enumerate(labels.isna().values.T):
+        for i in np.flatnonzero(isna):
+            values[i][j] = null(x.iloc[:, j])
+    return values
+
+
+def _summarize_values(
+    x: Union[pd.Series, pd.DataFrame],
+    weights: np.ndarray = None,
+    codes: np.ndarray = None,
+    index: pd.Index = None,
+) -> dict:
+    """
+    Summarize the invalid values of a field or key, for inclusion in an error.
+
+    The number of invalid rows (`rowCount`) and distinct invalid values
+    (`valueCount`) are always counted. At most :data:`options.max_values` values
+    are listed (`values`), the most frequent first. If the table was read with row
+    numbers (see :func:`read.read_table`), the invalid rows are also listed, as
+    ranges of row numbers (`rowNumbers`, see :func:`_row_numbers`).
+
+    Arguments:
+        x: Invalid values (one per row) of a field (series) or key (table).
+        weights: Number of rows of each value, if `x` is already distinct values.
+            The rows are then not listed.
+        codes: Position in `x.index` of the value of each row, or -1,
+            if `x` is already distinct values (see also :func:`_value_codes`).
+        index: Row labels, if `codes` is given.
+
+    Returns:
+        Error properties `values`, `rowCount`, `valueCount`, and
+        (if the table was read with row numbers) `rowNumbers`.
+
+    Examples:
+        >>> x = pd.Series(['b', 'a', 'b', None])
+        >>> _summarize_values(x)
+        {'values': ['b', 'a', None], 'rowCount': 4, 'valueCount': 3}
+        >>> OPTIONS.max_values = 1
+        >>> _summarize_values(pd.Series(['a', 'b']), weights=np.array([1, 2]))
+        {'values': ['b'], 'rowCount': 3, 'valueCount': 2}
+        >>> OPTIONS.max_values = None
+        >>> _summarize_values(pd.DataFrame({'x': [1, 1], 'y': ['a', 'a']}))
+        {'values': [[1, 'a']], 'rowCount': 2, 'valueCount': 1}
+    """
+    rows = None if weights is not None else x.index
+    if weights is None and codes is None and isinstance(x, pd.Series):
+        codes, index = getattr(_local, "codes", None) or (None, None)
+    if codes is not None:
+        positions = x.index.to_numpy()
+        weights = np.bincount(codes[codes >= 0])[positions]
+        rows = index[np.isin(codes, positions)]
+    if weights is not None:
+        labels = (
+            pd.MultiIndex.from_frame(x)
+            if isinstance(x, pd.DataFrame)
+            else pd.Index(x.array)
+        )
+        counts = pd.Series(weights, index=labels, dtype=np.int64)
+    elif isinstance(x, pd.DataFrame):
+        # Keys in order of appearance
+        counts = x.groupby(list(x.columns), sort=False, dropna=False).size()
+    else:
+        counts = x.value_counts(dropna=False, sort=False)
+        # NOTE: Nullable data types may count missing values as zero
+        counts = counts[counts > 0].astype(np.int64)
+    summary = {"rowCount": int(counts.sum()), "valueCount": len(counts)}
+    if OPTIONS.max_values is not None and len(counts) > OPTIONS.max_values:
+        counts = counts.nlargest(OPTIONS.max_values)
+    summary = {"values": _index_values(counts.index, x), **summary}
+    if rows is not None and tuple(rows.names) == _ROW_INDEX:
+        summary["rowNumbers"] = _row_numbers(rows)
+    return summary
 
 
 class Error(frictionless.errors.Error):
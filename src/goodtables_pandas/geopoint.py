@@ -0,0 +1,257 @@
+"""Geopoint data type for pandas."""
+import numbers
+from typing import Any, Iterable, Iterator, Sequence, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+from typing_extensions import Literal
+
+
+@register_extension_dtype
+class GeopointDtype(ExtensionDtype):
+    """Geopoint (longitude, latitude) data type."""
+
+    name: str = "geopoint"
+    type: type = tuple
+    kind: str = "O"
+    na_value: float = np.nan
+
+    @classmethod
+    def construct_array_type(cls: Type["GeopointDtype"]) -> type:
+        """Return the array type associated with this data type."""
+        return GeopointArray
+
+
+# Not-a-number with a payload distinct from np.nan, used to hash null geopoints
+_NULL = np.array(0x7FF800000000F00D, dtype=np.uint64).view(np.float64)
+
+
+def _is_geopoint(x: Any) -> bool:
+    return isinstance(x, (tuple, list, np.ndarray)) and len(x) == 2
+
+
+class GeopointArray(ExtensionArray):
+    """
+    Array of geopoints.
+
+    Geopoints are stored as an `(n, 2)` array of floats (longitude, latitude) and a
+    mask of nulls, rather than as an object array of tuples. Because null cannot be
+    represented as `NaN`, a geopoint may be `(nan, nan)`.
+    Individual geopoints are returned as a :class:`tuple` (lon, lat), or `nan` if null.
+
+    Arguments:
+        values: Coordinates (longitude, latitude).
+        mask: Whether each geopoint is null.
+        copy: Whether to copy `values` and `mask`.
+
+    Examples:
+        >>> x = pd.Series([(0.0, 1.0), None, (0.0, 1.0)], dtype='geopoint')
+        >>> x[0], x[1]
+        ((0.0, 1.0), nan)
+        >>> x.array.lat
+        array([ 1., nan,  1.])
+        >>> x.duplicated().tolist()
+        [False, False, True]
+    """
+
+    def __init__(  # noqa: D107
+        self: "GeopointArray",
+        values: np.ndarray,
+        mask: np.ndarray = None,
+        copy: bool = False,
+    ) -> None:
+        array = np.array if copy else np.asarray
+        self._data = array(values, dtype=float).reshape(-1, 2)
+        if mask is None:
+            mask = np.zeros(len(self._data), dtype=bool)
+        self._mask = array(mask, dtype=bool)
+
+    @classmethod
+    def _from_sequence(
+        cls: Type["GeopointArray"],
+        scalars: Iterable,
+        dtype: Any = None,
+        copy: bool = False,
+    ) -> "GeopointArray":
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        scalars = list(scalars)
+        mask = np.array([not _is_geopoint(xi) for xi in scalars], dtype=bool)
+        for xi, m in zip(scalars, mask):
+            if m and not (pd.api.types.is_scalar(xi) and pd.isna(xi)):
+                raise TypeError(f"Not a geopoint (lon, lat) or null: {xi!r}")
+        values = np.full((len(scalars), 2), np.nan)
+        if not mask.all():
+            values[~mask] = [xi for xi, m in zip(scalars, mask) if not m]
+        return cls(values, mask)
+
+    @classmethod
+    def _from_factorized(
+        cls: Type["GeopointArray"], values: np.ndarray, original: "GeopointArray"
+    ) -> "GeopointArray":
+        return cls(np.column_stack([values.real, values.imag]))
+
+    @property
+    def dtype(self: "GeopointArray") -> GeopointDtype:
+        """Data type."""
+        return GeopointDtype()
+
+    @property
+    def nbytes(self: "GeopointArray") -> int:
+        """Number of bytes used to store the array."""
+        return self._data.nbytes + self._mask.nbytes
+
+    @property
+    def lon(self: "GeopointArray") -> np.ndarray:
+        """Longitudes (`nan` if null)."""
+        return np.where(self._mask, np.nan, self._data[:, 0])
+
+    @property
+    def lat(self: "GeopointArray") -> np.ndarray:
+        """Latitudes (`nan` if null)."""
+        return np.where(self._mask, np.nan, self._data[:, 1])
+
+    def __len__(self: "GeopointArray") -> int:
+        """Number of geopoints."""
+        return len(self._data)
+
+    def __getitem__(
+        self: "GeopointArray", item: Any
+    ) -> Union["GeopointArray", Tuple[float, float], float]:
+        """Select geopoints by position."""
+        if isinstance(item, numbers.Integral):
+            if self._mask[item]:
+                return self.dtype.na_value
+            return tuple(self._data[item].tolist())
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._data[item], self._mask[item])
+
+    def __setitem__(self: "GeopointArray", key: Any, value: Any) -> None:
+        """Set geopoints by position."""
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if not isinstance(value, type(self)):
+            if _is_geopoint(value) or pd.api.types.is_scalar(value):
+                value = self._from_sequence([value])
+                value = type(self)(value._data[0], value._mask[0])
+            else:
+                value = self._from_sequence(value)
+        self._data[key] = value._data
+        self._mask[key] = value._mask
+
+    def __iter__(self: "GeopointArray") -> Iterator[Union[Tuple[float, float], float]]:
+        """Iterate over geopoints."""
+        na_value = self.dtype.na_value
+        for xi, mask in zip(self._data.tolist(), self._mask):
+            yield na_value if mask else tuple(xi)
+
+    def __array__(self: "GeopointArray", dtype: Any = None) -> np.ndarray:
+        """Convert to an object array of geopoints."""
+        array = np.empty(len(self), dtype=object)
+        array[:] = list(self)
+        return array
+
+    def __eq__(self: "GeopointArray", other: Any) -> np.ndarray:  # type: ignore
+        """Whether each geopoint is equal to another."""
+        if not isinstance(other, type(self)):
+            other = self._from_sequence([other] if _is_geopoint(other) else other)
+        return (self._data == other._data).all(axis=1) & ~(self._mask | other._mask)
+
+    def isna(self: "GeopointArray") -> np.ndarray:
+        """Whether each geopoint is null."""
+        return self._mask.copy()
+
+    def copy(self: "GeopointArray") -> "GeopointArray":
+        """Return a copy of the array."""
+        return type(self)(self._data, self._mask, copy=True)
+
+    def take(
+        self: "GeopointArray",
+        indices: Sequence[int],
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> "GeopointArray":
+        """
+        Take geopoints by position.
+
+        See :meth:`pandas.api.extensions.ExtensionArray.take`.
+        """
+        if allow_fill and _is_geopoint(fill_value):
+            result = self.take(indices, allow_fill=True)
+            result[np.asarray(indices) == -1] = fill_value
+            return result
+        values = take(
+            self._data, indices, allow_fill=allow_fill, fill_value=np.nan, axis=0
+        )
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=True)
+        return type(self)(values, mask)
+
+    @classmethod
+    def _concat_same_type(
+        cls: Type["GeopointArray"], to_concat: Sequence["GeopointArray"]
+    ) -> "GeopointArray":
+        return cls(
+            np.concatenate([x._data for x in to_concat]),
+            np.concatenate([x._mask for x in to_concat]),
+        )
+
+    def _values_for_factorize(self: "GeopointArray") -> Tuple[np.ndarray, Any]:
+        # NOTE: Used by pandas for hashing, which hashes the bits of each value.
+        # Zeros and nans are made canonical, and nulls use a distinct nan payload
+        # so that null does not hash as (nan, nan).
+        values = self._data + 0.0
+        values[np.isnan(values)] = np.nan
+        values[self._mask] = _NULL
+        return values.view(np.complex128).ravel(), complex(np.nan, np.nan)
+
+    def factorize(
+        self: "GeopointArray", na_sentinel: int = -1, use_na_sentinel: bool = True
+    ) -> Tuple[np.ndarray, "GeopointArray"]:
+        """
+        Encode the array as an enumerated type.
+
+        Geopoints are equal if both of their coordinates are equal, with `nan`
+        considered equal to `nan`.
+        Unique geopoints are returned in order of appearance.
+
+        See :meth:`pandas.api.extensions.ExtensionArray.factorize`.
+        """
+        codes = np.full(len(self), -1, dtype=np.int64)
+        valid = ~self._mask
+        values = self._data[valid]
+        if np.isnan(values).any():
+            # Coordinate codes are in [-1, n), so pairs map to unique integers
+            lon = pd.factorize(values[:, 0])[0].astype(np.int64)
+            lat = pd.factorize(values[:, 1])[0].astype(np.int64)
+            codes[valid] = pd.factorize((lon + 1) * (len(self) + 1) + lat)[0]
+        else:
+            # Complex numbers are hashed as pairs of floats (with 0.0 == -0.0)
+            codes[valid] = pd.factorize(values.view(np.complex128).ravel())[0]
+        first = np.flatnonzero(valid)[~pd.Series(codes[valid]).duplicated().values]
+        uniques = self.take(first)
+        if na_sentinel is None or not use_na_sentinel:
+            if self._mask.any():
+                codes[self._mask] = len(uniques)
+                uniques = self._concat_same_type([uniques, self.take([-1], True)])
+        elif na_sentinel != -1:
+            codes[self._mask] = na_sentinel
+        return codes, uniques
+
+    def duplicated(
+        self: "GeopointArray", keep: Literal["first", "last", False] = "first"
+    ) -> np.ndarray:
+        """Whether each geopoint (or null) is a duplicate."""
+        codes, _ = self.factorize(use_na_sentinel=False)
+        return pd.Series(codes).duplicated(keep=keep).values
+
+    def isin(self: "GeopointArray", values: Iterable) -> np.ndarray:
+        """Whether each geopoint (or null) is in `values`."""
+        if not isinstance(values, type(self)):
+            values = self._from_sequence(values)
+        codes, _ = self._concat_same_type([self, values]).factorize()
+        return np.isin(codes[: len(self)], codes[len(self) :])
@@ -2,14 +2,36 @@
 
 raise_first_invalid_integer = False
 """
-bool: Whether to only report the first invalid value of an integer field.
-  Provides a large speed increase at the expense of a less informative error.
-  Only used if `bareNumber` is `True` (the default).
+bool: Deprecated, use `fail_fast=True` (see :func:`validate.validate`) instead.
+  If `True`, integer fields are parsed as with `fail_fast=True`.
 """
 
 raise_first_invalid_number = False
 """
-bool: Whether to only report the first invalid value of a number field.
-  Provides a large speed increase at the expense of a less informative error.
-  Only used if `bareNumber` is `True` (the default).
+bool: Deprecated, use `fail_fast=True` (see :func:`validate.validate`) instead.
+  If `True`, number fields are parsed as with `fail_fast=True`.
+"""
+
+max_values = None
+"""
+int: Maximum number of invalid values listed in an error, the most frequent first.
+  The number of invalid rows (`rowCount`) and of distinct invalid values
+  (`valueCount`) are reported regardless. Set to `None` to list all values.
+  When reading in chunks, values are listed in the order of the chunks they were
+  found in, and the number of distinct values may be underestimated.
+"""
+
+parse_unique_ratio = 0.1
+"""
+float: Maximum ratio of unique to total values for a field to be parsed by unique
+  value (with the result broadcast to all values) rather than value by value.
+  The ratio is estimated from a sample of values.
+  Set to `0` to always parse value by value.
+"""
+
+schema_cache_size = 128
+"""
+int: Maximum number of compiled table schemas to keep for reuse
+  (see :func:`schema.compile_schema`), dropping the least recently used first.
+  Set to `0` to not keep any.
 """
@@ -1,53 +1,155 @@
 """Parse and validate table fields."""
-import base64
+import concurrent.futures
 import datetime
+import functools
+import itertools
 import re
-from typing import Any, Iterable, List, Tuple, Union
+import string
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TYPE_CHECKING, Union
+import warnings
 
 import numpy as np
 import pandas as pd
 from typing_extensions import Literal
 
 from . import options as OPTIONS
-from .errors import ConstraintTypeError
+from .errors import _summarize_values, _value_codes, ConstraintTypeError
 from .errors import TypeError as ValueTypeError
+from .geopoint import GeopointArray
+from .profiling import stage
+
+if TYPE_CHECKING:
+    from .schema import CompiledSchema
 
 
 def parse_table(
-    df: pd.DataFrame, schema: dict
+    df: pd.DataFrame,
+    schema: Union[dict, "CompiledSchema"],
+    workers: int = None,
+    error_limit: int = None,
+    fail_fast: bool = False,
+    stats: dict = None,
 ) -> Union[pd.DataFrame, List[ValueTypeError]]:
     """
     Parse table.
 
     Arguments:
         df: Table.
-        schema: Table schema (https://specs.frictionlessdata.io/table-schema).
+        schema: Table schema (https://specs.frictionlessdata.io/table-schema),
+            or the same compiled for reuse (see :func:`schema.compile_schema`).
+        workers: If set, fields are parsed concurrently in up to this many threads.
+            Errors are returned in field order regardless.
+        error_limit: If set (at least 1), no more fields are parsed once this many
+            fields have failed to parse. Fields already being parsed are finished.
+        fail_fast: Whether to stop parsing each field at its first invalid values
+            (see :func:`parse_field`).
+        stats: If set, the time and memory taken to parse each field are added to it
+            (see :func:`profiling.stage`).
 
     Returns:
         Either a table of parsed fields and values, or a list of errors.
     """
+    if isinstance(schema, dict):
+        fields = [
+            (field["name"], _bind_parser(**field)) for field in schema.get("fields", [])
+        ]
+    else:
+        fields = [(field.name, field.parse) for field in schema.fields]
+
+    # Names of fields that failed to parse so far
+    failed = []
+
+    def parse(
+        field: Tuple[str, Callable[..., Union[pd.Series, ValueTypeError]]]
+    ) -> Union[pd.Series, ValueTypeError, None]:
+        name, parser = field
+        if error_limit is not None and len(failed) >= error_limit:
+            return None
+        with stage("parse", name, stats=stats, data=df[name]):
+            result = parser(df[name], fail_fast=fail_fast)
+        if isinstance(result, ValueTypeError):
+            failed.append(name)
+        return result
+
+    if workers and len(fields) > 1:
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            results = list(executor.map(parse, fields))
+    else:
+        results = map(parse, fields)
     errors = []
-    for field in schema.get("fields", []):
-        result = parse_field(df[field["name"]], **field)
+    for (name, _), result in zip(fields, results):
         if isinstance(result, ValueTypeError):
             # HACK: Add field name to parsing error
-            result["fieldName"] = field["name"]
+            result["fieldName"] = name
             result["message"] = result.template.format(**result)
             errors.append(result)
-        else:
-            df[field["name"]] = result
+        elif result is not None:
+            df[name] = result
     return errors or df
 
 
-def parse_field(
-    x: pd.Series, type: str = "string", **field: Any
+def _is_repetitive(x: pd.Series, ratio: float, size: int = 2**12) -> bool:
+    """
+    Estimate whether values are repeated often enough to parse only unique values.
+
+    The ratio of unique to total values is computed for a sample of evenly spaced
+    values. This overestimates the ratio for the whole series.
+
+    Arguments:
+        x: Values.
+        ratio: Maximum ratio of unique to total values.
+        size: Sample size.
+
+    Returns:
+        Whether the sample ratio of unique to total values is at most `ratio`.
+    """
+    if not ratio or len(x) < size:
+        return False
+    sample = x.iloc[:: len(x) // size]
+    return sample.nunique(dropna=False) <= ratio * len(sample)
+
+
+def _parse_unique(
+    parser: Callable[..., Union[pd.Series, ValueTypeError]], x: pd.Series, **kwargs: Any
 ) -> Union[pd.Series, ValueTypeError]:
     """
-    Parse table field.
+    Parse unique values, then broadcast the result to all values.
 
     Arguments:
+        parser: Field parser (e.g. :func:`parse_date`).
         x: Field values.
+        **kwargs: Additional arguments to `parser`.
+
+    Returns:
+        Either a series of parsed field values, or an error.
+    """
+    codes, uniques = pd.factorize(x)
+    if not len(uniques):
+        return parser(x, **kwargs)
+    # Unique values are in order of appearance, so invalid values are as well
+    y = pd.Series(uniques)
+    # Count (and locate) the rows of invalid values (see errors._summarize_values)
+    with _value_codes(codes, x.index):
+        result = parser(y, **kwargs)
+    if isinstance(result, ValueTypeError):
+        return result
+    if result is y:
+        # Parser returned values unchanged
+        return x
+    result = result.iloc[np.maximum(codes, 0)].where(codes >= 0)
+    result.index, result.name = x.index, x.name
+    return result
+
+
+def _bind_parser(
+    type: str = "string", factorize: bool = None, **field: Any
+) -> Callable[[pd.Series], Union[pd.Series, ValueTypeError]]:
+    """
+    Bind field parser to field attributes.
+
+    Arguments:
         type: Field type.
+        factorize: Whether to parse only unique values (see :func:`parse_field`).
         field: Additional field attributes
             (https://specs.frictionlessdata.io/table-schema/#field-descriptors).
 
@@ -55,14 +157,295 @@ def parse_field(
         NotImplementedError: Field type not supported.
 
     Returns:
-        Either a series of parsed field values, or an error.
+        Function which parses field values.
+
+    Examples:
+        >>> parser = _bind_parser(type='integer', name='x', bareNumber=False)
+        >>> parser.keywords
+        {'type': 'integer', 'factorize': None, 'bareNumber': False}
     """
     parser = globals().get(f"parse_{type}", None)
     if not parser:
         raise NotImplementedError(f"Field type not supported: {type}")
     argnames = parser.__code__.co_varnames[1 : parser.__code__.co_argcount]
     field = {key: field[key] for key in argnames if key in field}
-    return parser(x, **field)
+    if factorize is None:
+        # Strings in the default format are returned as is
+        if type == "string" and field.get("format", "default") == "default":
+            factorize = False
+    return functools.partial(
+        _apply_parser, parser, type=type, factorize=factorize, **field
+    )
+
+
+def _as_object(x: pd.Series) -> pd.Series:
+    """
+    Convert strings to an object series of Python strings, with `nan` for null.
+
+    If the values are repetitive (see :func:`_is_repetitive`), they are factorized
+    first so that each unique value is converted to a Python string only once.
+
+    Arguments:
+        x: Strings (e.g. of type `string[pyarrow]`).
+
+    Returns:
+        Object series.
+
+    Examples:
+        >>> x = pd.Series(['a', None, 'a'], dtype='string')
+        >>> _as_object(x).tolist()
+        ['a', nan, 'a']
+    """
+    if _is_repetitive(x, ratio=OPTIONS.parse_unique_ratio):
+        codes, uniques = pd.factorize(x)
+        uniques = np.append(uniques.to_numpy(dtype=object), np.nan)
+        values = uniques[codes]
+    else:
+        values = x.to_numpy(dtype=object, na_value=np.nan)
+    return pd.Series(values, index=x.index, name=x.name)
+
+
+def _decode_categories(x: pd.Series) -> pd.Series:
+    """
+    Decode categorical field values to the data type of their categories.
+
+    Integer categories are decoded to a nullable integer data type if values are
+    missing, rather than cast to float.
+
+    Examples:
+        >>> _decode_categories(pd.Series(['a', None], dtype='category')).tolist()
+        ['a', nan]
+        >>> _decode_categories(pd.Series([2**62 + 1, None], dtype='category')).tolist()
+        [4611686018427387905, <NA>]
+    """
+    categories = x.cat.categories
+    nullable = {"i": "Int64", "u": "UInt64"}.get(categories.dtype.kind)
+    if nullable and x.hasnans:
+        values = pd.array(categories, dtype=nullable).take(
+            x.cat.codes.values, allow_fill=True
+        )
+        return pd.Series(values, index=x.index, name=x.name)
+    return x.astype(categories.dtype)
+
+
+def _is_typed(x: pd.Series) -> bool:
+    """
+    Whether field values are already typed, rather than strings to parse.
+
+    Examples:
+        >>> _is_typed(pd.Series(['1'])), _is_typed(pd.Series(['1'], dtype='string'))
+        (False, False)
+        >>> _is_typed(pd.Series([1]))
+        True
+    """
+    return not (
+        pd.api.types.is_object_dtype(x.dtype) or isinstance(x.dtype, pd.StringDtype)
+    )
+
+
+def _check_typed(  # noqa: C901
+    x: pd.Series, type: str
+) -> Union[pd.Series, ValueTypeError]:
+    """
+    Check already-typed field values (e.g. read from Parquet) against a field type.
+
+    Values are accepted based on their data type, rather than parsed, and converted
+    to the data type returned by the field parser (e.g. integers to `Int64`).
+    Floats are accepted as integers (or years) if they have no fractional part,
+    and (timezone-naive) datetimes as dates if they have no time. As when parsing
+    integers (see :func:`parse_integer`), integers must fit in 64 bits.
+
+    Arguments:
+        x: Field values.
+        type: Field type.
+
+    Returns:
+        Either field values, or an error.
+
+    Examples:
+        >>> _check_typed(pd.Series([1.0, None]), 'integer').tolist()
+        [1, <NA>]
+        >>> _check_typed(pd.Series([1.0, 1.5]), 'integer')['values']
+        [1.5]
+        >>> _check_typed(pd.Series([1.0, 1e20]), 'integer')['values']
+        [1e+20]
+        >>> _check_typed(pd.Series([True]), 'number')['note']
+        'Values of data type bool are not of type number'
+    """
+    kind = x.dtype.kind
+    invalid = None
+    if type in ("integer", "year") and kind in "iuf":
+        if kind == "i":
+            return x.astype("Int64")
+        invalid = x.notna() & (x >= 2**63)
+        if kind == "f":
+            invalid |= x.notna() & ((x % 1 != 0) | (x < -(2**63)))
+        if not invalid.any():
+            return x.astype("Int64")
+    elif type == "number" and kind in "iuf":
+        return x.astype(float)
+    elif type == "boolean" and kind == "b":
+        # As returned by parse_boolean
+        return x.astype("Int64")
+    elif type == "datetime" and kind == "M":
+        return x
+    elif type == "date" and kind == "M" and x.dt.tz is None:
+        invalid = x.notna() & (x != x.dt.normalize())
+        if not invalid.any():
+            return x
+    elif type == "geopoint" and isinstance(x.array, GeopointArray):
+        return x
+    if invalid is not None:
+        return ValueTypeError(fieldType=type, **_summarize_values(x[invalid]))
+    return ValueTypeError(
+        fieldType=type, note=f"Values of data type {x.dtype} are not of type {type}"
+    )
+
+
+def _parse_until_invalid(
+    parse: Callable[[pd.Series], Union[pd.Series, ValueTypeError]],
+    x: pd.Series,
+    size: int = 2**10,
+) -> Union[pd.Series, ValueTypeError]:
+    """
+    Parse field values in blocks, stopping at the first block with invalid values.
+
+    Blocks double in size (starting from `size`), so that invalid values near the
+    start of a field are found quickly, while a valid field is parsed in few blocks.
+
+    Arguments:
+        parse: Function that parses field values.
+        x: Field values.
+        size: Size of the first block.
+
+    Returns:
+        Either a series of parsed field values, or an error listing only the
+        invalid values of the first block with invalid values.
+
+    Examples:
+        >>> x = pd.Series(['1', 'x', '2', 'y'])
+        >>> error = _parse_until_invalid(parse_integer, x, size=1)
+        >>> error['values'], error['rowCount']
+        (['x'], 1)
+        >>> _parse_until_invalid(parse_integer, x[[0, 2]], size=1).tolist()
+        [1, 2]
+    """
+    if len(x) <= size:
+        return parse(x)
+    parsed, start = [], 0
+    while start < len(x):
+        stop = min(start + size, len(x))
+        result = parse(x.iloc[start:stop])
+        if isinstance(result, ValueTypeError):
+            result.setdefault("note", "Stopped at the first invalid values")
+            return result
+        parsed.append(result)
+        start, size = stop, 2 * size
+    return pd.concat(parsed)
+
+
+# Deprecated options replaced by fail_fast, by field type
+_FAIL_FAST_OPTIONS = {
+    "integer": "raise_first_invalid_integer",
+    "number": "raise_first_invalid_number",
+}
+
+
+def _deprecated_fail_fast(type: Optional[str]) -> bool:
+    """
+    Whether deprecated options ask to stop parsing fields of a type early.
+
+    Warns (:class:`DeprecationWarning`) if so.
+
+    Arguments:
+        type: Field type.
+    """
+    option = _FAIL_FAST_OPTIONS.get(type)
+    if option and getattr(OPTIONS, option):
+        warnings.warn(
+            f"options.{option} is deprecated, use fail_fast=True instead",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        return True
+    return False
+
+
+def _apply_parser(
+    parser: Callable[..., Union[pd.Series, ValueTypeError]],
+    x: pd.Series,
+    type: str = None,
+    factorize: bool = None,
+    fail_fast: bool = False,
+    **kwargs: Any,
+) -> Union[pd.Series, ValueTypeError]:
+    """
+    Parse field values, by unique value if repetitive.
+
+    Values that are already typed (see :func:`_is_typed`) are checked against the
+    field type instead (see :func:`_check_typed`), after decoding categorical values
+    (see :func:`_decode_categories`).
+
+    Arguments:
+        parser: Field parser (e.g. :func:`parse_date`).
+        x: Field values.
+        type: Field type.
+        factorize: Whether to parse only unique values (see :func:`parse_field`).
+        fail_fast: Whether to stop at the first invalid values
+            (see :func:`_parse_until_invalid`).
+        **kwargs: Additional arguments to `parser`.
+
+    Returns:
+        Either a series of parsed field values, or an error.
+    """
+    if type and isinstance(x.dtype, pd.CategoricalDtype):
+        x = _decode_categories(x)
+    if type and _is_typed(x):
+        return _check_typed(x, type)
+    if fail_fast or _deprecated_fail_fast(type):
+        return _parse_until_invalid(
+            functools.partial(_apply_parser, parser, factorize=factorize, **kwargs), x
+        )
+    if isinstance(x.dtype, pd.StringDtype):
+        # Strings (e.g. Arrow-backed, see read.read_table) are parsed as objects
+        x = _as_object(x)
+    if factorize is None:
+        factorize = _is_repetitive(x, ratio=OPTIONS.parse_unique_ratio)
+    if factorize:
+        return _parse_unique(parser, x, **kwargs)
+    return parser(x, **kwargs)
+
+
+def parse_field(
+    x: pd.Series,
+    type: str = "string",
+    factorize: bool = None,
+    fail_fast: bool = False,
+    **field: Any,
+) -> Union[pd.Series, ValueTypeError]:
+    """
+    Parse table field.
+
+    Arguments:
+        x: Field values.
+        type: Field type.
+        factorize: Whether to parse only unique values and broadcast the result
+            to all values. If `None`, this is done if the values are estimated
+            to be repetitive enough (see :data:`options.parse_unique_ratio`).
+        fail_fast: Whether to stop parsing at the first invalid values. Values are
+            then parsed in blocks of increasing size, and an error lists only the
+            invalid values of the first block with invalid values.
+        field: Additional field attributes
+            (https://specs.frictionlessdata.io/table-schema/#field-descriptors).
+
+    Raises:
+        NotImplementedError: Field type not supported.
+
+    Returns:
+        Either a series of parsed field values, or an error.
+    """
+    with stage("parse", field.get("name"), data=x):
+        return _bind_parser(type, factorize, **field)(x, fail_fast=fail_fast)
 
 
 def parse_field_constraint(
@@ -105,12 +488,42 @@ def parse_field_constraint(
 # ---- Field parsers ----
 
 
-def _validate_string_binary(xi: str) -> bool:
-    try:
-        base64.b64decode(xi)
+_BASE64_CHARACTERS = (string.ascii_letters + string.digits + "+/=").encode()
+_BASE64_PATTERN = re.compile(
+    r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$"
+)
+
+
+def _validate_string_binary(xi: str) -> Optional[bool]:
+    if _BASE64_PATTERN.match(re.sub(r"\s", "", xi)):
         return True
-    except Exception:
-        return False
+    return None
+
+
+def _validate_string_binary_block(xs: np.ndarray, size: int = 2**20) -> np.ndarray:
+    """
+    Validate strings as base64 without whitespace, without decoding them.
+
+    Strings are joined into texts of about `size` characters, which are checked with
+    string methods that run in C.
+
+    Raises:
+        ValueError: Some strings are not base64 without whitespace.
+    """
+    lengths = np.fromiter(map(len, xs), dtype=int, count=len(xs))
+    stripped = map(str.rstrip, xs, itertools.repeat("="))
+    pads = lengths - np.fromiter(map(len, stripped), dtype=int, count=len(xs))
+    if (lengths % 4).any() or (pads > 2).any():
+        raise ValueError("Invalid length or padding")
+    breaks = np.searchsorted(np.cumsum(lengths), np.arange(size, lengths.sum(), size))
+    for part, part_pads in zip(np.split(xs, breaks), np.split(pads, breaks)):
+        text = "".join(part)
+        # Padding may only appear at the end of each string
+        if text.count("=") != part_pads.sum():
+            raise ValueError("Invalid padding")
+        if text.encode("ascii").translate(None, _BASE64_CHARACTERS):
+            raise ValueError("Invalid characters")
+    return np.ones(len(xs), dtype=bool)
 
 
 def parse_string(
@@ -164,7 +577,13 @@ def parse_string(
     if format != "default":
         mask = ~x.isna()
         if format == "binary":
-            invalid = ~x[mask].apply(_validate_string_binary)
+            _, _, failed = _parse_blocks(
+                x[mask],
+                parse_block=_validate_string_binary_block,
+                parse_value=_validate_string_binary,
+                dtype=bool,
+            )
+            invalid = pd.Series(failed, index=x[mask].index)
         else:
             pattern = patterns[format]
             invalid = ~x[mask].str.contains(pattern, flags=re.IGNORECASE)
@@ -172,32 +591,136 @@ def parse_string(
             return ValueTypeError(
                 fieldType="string",
                 fieldFormat=format,
-                values=x[mask][invalid].dropna().unique().tolist(),
+                **_summarize_values(x[mask][invalid]),
             )
     return x
 
 
+def _parse_blocks(
+    x: pd.Series,
+    parse_block: Callable[[np.ndarray], np.ndarray],
+    parse_value: Callable[[str], Any],
+    dtype: type,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse strings in blocks.
+
+    Blocks are parsed by `parse_block`, which parses all values in C but fails on the
+    first invalid value. Blocks that fail are split up until small enough to parse
+    value by value with `parse_value`, so that every invalid value is found without
+    giving up the fast path for the rest of the values.
+
+    Arguments:
+        x: Strings.
+        parse_block: Function that parses an array of strings or raises an error.
+        parse_value: Function that parses a string or returns `None`.
+        dtype: Data type of the parsed values.
+
+    Returns:
+        Parsed values (zero where null or invalid),
+        whether each value is null, and whether each value failed to parse.
+    """
+    isna = x.isna().values
+    invalid = np.zeros(len(x), dtype=bool)
+    values = np.zeros(len(x), dtype=dtype)
+    notna = np.flatnonzero(~isna)
+    strings = x.values[notna]
+    blocks = [
+        (i, min(i + 2**16, len(strings))) for i in range(0, len(strings), 2**16)
+    ]
+    while blocks:
+        start, stop = blocks.pop()
+        index = notna[start:stop]
+        try:
+            values[index] = parse_block(strings[start:stop])
+        except (TypeError, ValueError, OverflowError):
+            if stop - start > 2**8:
+                step = -(-(stop - start) // 2**4)
+                blocks += [(i, min(i + step, stop)) for i in range(start, stop, step)]
+                continue
+            parsed = np.array(list(map(parse_value, strings[start:stop])), dtype=object)
+            failed = np.equal(parsed, None)
+            values[index[~failed]] = parsed[~failed]
+            invalid[index[failed]] = True
+    return values, isna, invalid
+
+
+def _check_bare_text(xs: np.ndarray) -> None:
+    """
+    Check that strings parsed by :class:`int` or :class:`float` are bare numbers.
+
+    Unlike `_INTEGER_PATTERN` and `_NUMBER_PATTERN`, :class:`int` and :class:`float`
+    also accept `_` and non-ascii digits.
+
+    Arguments:
+        xs: Strings.
+
+    Raises:
+        ValueError: Strings contain `_` or non-ascii characters.
+    """
+    text = "".join(xs)
+    text.encode("ascii")
+    if "_" in text:
+        raise ValueError("Number contains an underscore")
+
+
+def _replace_chars(x: pd.Series, old: str, new: str) -> pd.Series:
+    """
+    Replace substrings in strings.
+
+    Values are joined and replaced as a single string, then split.
+    This is much faster than :meth:`pd.Series.str.replace`.
+
+    Arguments:
+        x: Strings.
+        old: Substring to replace.
+        new: Replacement.
+
+    Returns:
+        Strings with substrings replaced.
+    """
+    sep = "\x00"
+    mask = x.notna().values
+    strings = x.values[mask]
+    try:
+        text = sep.join(strings)
+    except TypeError:
+        return x.str.replace(old, new, regex=False)
+    if sep in old or sep in new or text.count(sep) != max(len(strings) - 1, 0):
+        return x.str.replace(old, new, regex=False)
+    values = x.values.copy()
+    if len(strings):
+        values[mask] = text.replace(old, new).split(sep)
+    return pd.Series(values, index=x.index, name=x.name)
+
+
 _NUMBER_PATTERN = re.compile(
     r"([+-]?(?:nan|inf(?:inity)?|(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:e[+-]?[0-9]+)?))",
     flags=re.IGNORECASE,
 )
 
 
-def _extract_number(xi: Union[str, float]) -> str:
+def _extract_number(xi: str) -> Optional[float]:
     try:
         parts = _NUMBER_PATTERN.findall(xi)
         if len(parts) == 1:
             return _parse_number(parts[0])
-        return "NULL"
+        return None
     except TypeError:
-        return "NULL"
+        return None
 
 
-def _parse_number(xi: Union[str, float]) -> Union[float, str]:
+def _parse_number(xi: str) -> Optional[float]:
     try:
         return float(xi)
     except ValueError:
-        return "NULL"
+        return None
+
+
+def _parse_number_block(xs: np.ndarray, bareNumber: bool = True) -> np.ndarray:
+    if not bareNumber:
+        _check_bare_text(xs)
+    return np.fromiter(map(float, xs), dtype=float, count=len(xs))
 
 
 def parse_number(
@@ -220,47 +743,73 @@ def parse_number(
     """
     parsed = x
     if groupChar:
-        parsed = parsed.str.replace(groupChar, "", regex=False)
+        parsed = _replace_chars(parsed, groupChar, "")
     if decimalChar != ".":
-        parsed = parsed.str.replace(decimalChar, ".", regex=False)
-    if OPTIONS.raise_first_invalid_number:
-        try:
-            return parsed.astype(float)
-        except ValueError as e:
-            return ValueTypeError(fieldType="number", note=str(e))
-    if bareNumber:
-        parsed = parsed.apply(_parse_number, convert_dtype=False)
-    else:
-        parsed = parsed.apply(_extract_number, convert_dtype=False)
-    # HACK: Use 'NULL' to distinguish values parsed as NaN from parsing failures
-    # Use isin (not ==) to avoid warning that elementwise comparison failed
-    unparsed = parsed.isin(["NULL"])
-    invalid = ~x.isna() & unparsed
+        parsed = _replace_chars(parsed, decimalChar, ".")
+    values, isna, invalid = _parse_blocks(
+        parsed,
+        parse_block=functools.partial(_parse_number_block, bareNumber=bareNumber),
+        parse_value=_parse_number if bareNumber else _extract_number,
+        dtype=float,
+    )
     if invalid.any():
-        invalids = x[invalid].unique().tolist()
-        return ValueTypeError(fieldType="number", values=invalids)
-    # Replace 'NULL' with NaN
-    return parsed.where(~unparsed).astype(float)
+        return ValueTypeError(fieldType="number", **_summarize_values(x[invalid]))
+    values[isna] = np.nan
+    return pd.Series(values, index=x.index, name=x.name)
 
 
 _INTEGER_PATTERN = re.compile(r"([+-]?[0-9]+)")
 
 
-def _extract_integer(xi: Union[str, float]) -> Union[str, float]:
+def _extract_integer(xi: str) -> Optional[int]:
     try:
         parts = _INTEGER_PATTERN.findall(xi)
         if len(parts) == 1:
             return _parse_integer(parts[0])
-        return np.nan
+        return None
     except TypeError:
-        return np.nan
+        return None
 
 
-def _parse_integer(xi: Union[str, float]) -> Union[int, float]:
+def _parse_integer(xi: str) -> Optional[int]:
     try:
-        return int(xi)
+        xi = int(xi)
     except ValueError:
-        return np.nan
+        return None
+    # NOTE: Integers outside the int64 range are treated as invalid
+    if -(2**63) <= xi < 2**63:
+        return xi
+    return None
+
+
+def _parse_integer_block(xs: np.ndarray, bareNumber: bool = True) -> np.ndarray:
+    if not bareNumber:
+        _check_bare_text(xs)
+    return np.fromiter(map(int, xs), dtype=np.int64, count=len(xs))
+
+
+def _parse_integers(
+    x: pd.Series, bareNumber: bool = True
+) -> Tuple[pd.Series, np.ndarray]:
+    """
+    Parse strings as integers.
+
+    Arguments:
+        x: Strings.
+        bareNumber: Whether the numbers are bare, or padded with non-numeric text.
+
+    Returns:
+        Parsed integers (as :class:`pd.Int64Dtype`, null where parsing failed),
+        and whether each value failed to parse.
+    """
+    values, isna, invalid = _parse_blocks(
+        x,
+        parse_block=functools.partial(_parse_integer_block, bareNumber=bareNumber),
+        parse_value=_parse_integer if bareNumber else _extract_integer,
+        dtype=np.int64,
+    )
+    parsed = pd.arrays.IntegerArray(values, isna | invalid)
+    return pd.Series(parsed, index=x.index, name=x.name), invalid
 
 
 def parse_integer(
@@ -276,23 +825,10 @@ def parse_integer(
     Returns:
         Either parsed integers or a parsing error.
     """
-    if OPTIONS.raise_first_invalid_integer:
-        isna = x.isna()
-        try:
-            x = x.where(isna, x[~isna].astype(int))
-            return x.astype("Int64")
-        except ValueError as e:
-            return ValueTypeError(fieldType="integer", note=str(e))
-    parsed = x
-    if bareNumber:
-        parsed = parsed.apply(_parse_integer, convert_dtype=False)
-    else:
-        parsed = parsed.apply(_extract_integer, convert_dtype=False)
-    invalid = ~x.isna() & parsed.isna()
+    parsed, invalid = _parse_integers(x, bareNumber=bareNumber)
     if invalid.any():
-        invalids = x[invalid].unique().tolist()
-        return ValueTypeError(fieldType="integer", values=invalids)
-    return parsed.astype("Int64")
+        return ValueTypeError(fieldType="integer", **_summarize_values(x[invalid]))
+    return parsed
 
 
 def parse_boolean(
@@ -316,8 +852,7 @@ def parse_boolean(
     na = x.isna()
     invalid = ~(true | false | na)
     if invalid.any():
-        invalids = x[invalid].unique().tolist()
-        return ValueTypeError(fieldType="boolean", values=invalids)
+        return ValueTypeError(fieldType="boolean", **_summarize_values(x[invalid]))
     x = true.astype(int).astype("Int64")
     x[na] = np.nan
     return x
@@ -347,8 +882,9 @@ def parse_date(
     )
     invalid = ~x.isna() & parsed.isna()
     if invalid.any():
-        invalids = x[invalid].unique().tolist()
-        return ValueTypeError(fieldType="date", fieldFormat=format, values=invalids)
+        return ValueTypeError(
+            fieldType="date", fieldFormat=format, **_summarize_values(x[invalid])
+        )
     return parsed
 
 
@@ -376,8 +912,9 @@ def parse_datetime(
     )
     invalid = ~x.isna() & parsed.isna()
     if invalid.any():
-        invalids = x[invalid].unique().tolist()
-        return ValueTypeError(fieldType="datetime", fieldFormat=format, values=invalids)
+        return ValueTypeError(
+            fieldType="datetime", fieldFormat=format, **_summarize_values(x[invalid])
+        )
     return parsed
 
 
@@ -395,54 +932,81 @@ def parse_year(x: pd.Series) -> Union[pd.Series, ValueTypeError]:
     Returns:
         Either parsed years (as :class:`pd.Int64Dtype`) or a parsing error.
     """
-    parsed = x.apply(_extract_integer, convert_dtype=False)
-    invalid = ~x.isna() & parsed.isna()
+    parsed, invalid = _parse_integers(x, bareNumber=False)
     if invalid.any():
-        invalids = x[invalid].unique().tolist()
-        return ValueTypeError(fieldType="year", values=invalids)
-    return parsed.astype("Int64")
-
-
-_GEOPOINT_PATTERN_DEFAULT = re.compile(r"^([^, ]+), ?([^ ]+)$")
-
+        return ValueTypeError(fieldType="year", **_summarize_values(x[invalid]))
+    return parsed
 
-def _extract_geopoint_default(xi: str) -> Union[Tuple[float, float], float]:
-    parts = _GEOPOINT_PATTERN_DEFAULT.findall(xi)
-    try:
-        return float(parts[0][0]), float(parts[0][1])
-    except (ValueError, IndexError):
-        return np.nan
 
+_GEOPOINT_PATTERNS = {
+    "default": re.compile(r"^([^, ]+), ?([^ ]+)$"),
+    "array": re.compile(r"^\s*\[\s*(.+),\s*(.+)\s*\]\s*$"),
+    "object": re.compile(
+        r'^\s*\{\s*"lon":\s*(.+),\s*"lat":\s*(.+)\s*\}\s*$'
+        r'|^\s*\{\s*"lat":\s*(.+),\s*"lon":\s*(.+)\s*\}\s*$'
+    ),
+}
+# Equivalent patterns for strings without line breaks, joined by line breaks
+_GEOPOINT_LINE_PATTERNS = {
+    "default": r"([^, \n]+), ?([^ \n]+)",
+    "array": r"[^\S\n]*\[[^\S\n]*(.+),[^\S\n]*(.+)[^\S\n]*\][^\S\n]*",
+    "object": (
+        r'[^\S\n]*\{[^\S\n]*"lon":[^\S\n]*(.+),[^\S\n]*"lat":[^\S\n]*(.+)'
+        r"[^\S\n]*\}[^\S\n]*"
+        r'|[^\S\n]*\{[^\S\n]*"lat":[^\S\n]*(.+),[^\S\n]*"lon":[^\S\n]*(.+)'
+        r"[^\S\n]*\}[^\S\n]*"
+    ),
+}
+
+
+def _findall_lines(x: pd.Series, pattern: str, groups: int) -> Optional[np.ndarray]:
+    """
+    Match strings to a pattern as a single string of lines.
 
-_GEOPOINT_PATTERN_ARRAY = re.compile(r"^\s*\[\s*(.+),\s*(.+)\s*\]\s*$")
+    Runs :func:`re.findall` once rather than once per string, which is much faster
+    than :meth:`pd.Series.str.extract`.
 
+    Arguments:
+        x: Strings.
+        pattern: Pattern for a whole line. Must not match line breaks.
+        groups: Number of groups in `pattern`.
 
-def _extract_geopoint_array(xi: str) -> Union[Tuple[float, float], float]:
-    parts = _GEOPOINT_PATTERN_ARRAY.findall(xi)
+    Returns:
+        Groups of each string (empty if not matched) as an array of shape
+        (n, `groups`), or `None` if the strings contain line breaks.
+    """
     try:
-        return float(parts[0][0]), float(parts[0][1])
-    except (ValueError, IndexError):
-        return np.nan
+        text = "\n".join(x.values)
+    except TypeError:
+        return None
+    if text.count("\n") != max(len(x) - 1, 0):
+        return None
+    matches = re.findall(rf"^(?:{pattern}|.*)$", text, flags=re.MULTILINE)
+    return np.array(matches, dtype=object).reshape(-1, groups)
 
 
-_GEOPOINT_PATTERN_LONLAT = re.compile(
-    r'^\s*\{\s*"lon":\s*(.+),\s*"lat":\s*(.+)\s*\}\s*$'
-)
-_GEOPOINT_PATTERN_LATLON = re.compile(
-    r'^\s*\{\s*"lat":\s*(.+),\s*"lon":\s*(.+)\s*\}\s*$'
-)
+def _extract_geopoint_parts(
+    x: pd.Series, format: Literal["default", "array", "object"] = "default"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract longitude and latitude strings from geopoint strings.
 
+    Arguments:
+        x: Strings.
+        format: Geopoint format (see :func:`parse_geopoint`).
 
-def _extract_geopoint_object(xi: str) -> Union[Tuple[float, float], float]:
-    parts = _GEOPOINT_PATTERN_LONLAT.findall(xi)
-    if not parts:
-        parts = _GEOPOINT_PATTERN_LATLON.findall(xi)
-        if parts:
-            parts[0] = parts[0][1], parts[0][0]
-    try:
-        return float(parts[0][0]), float(parts[0][1])
-    except (IndexError, ValueError):
-        return np.nan
+    Returns:
+        Longitude and latitude strings (empty if the geopoint does not match the
+        format).
+    """
+    pattern = _GEOPOINT_PATTERNS[format]
+    parts = _findall_lines(x, _GEOPOINT_LINE_PATTERNS[format], pattern.groups)
+    if parts is None:
+        parts = x.str.extract(pattern).fillna("").values
+    if format == "object":
+        # Groups are lon, lat (lon first) or lat, lon (lat first)
+        return parts[:, 0] + parts[:, 3], parts[:, 1] + parts[:, 2]
+    return parts[:, 0], parts[:, 1]
 
 
 def parse_geopoint(
@@ -451,10 +1015,6 @@ def parse_geopoint(
     """
     Parse strings as geopoints.
 
-    Per XML Schema, permits negative years and years greater than 9999.
-    However, time zones are not supported
-    (https://www.w3.org/TR/xmlschema-2/#timeZonePermited).
-
     Arguments:
         x: Strings.
         format: Either 'default' ('<lon>,<lat>' or '<lon>, <lat>'),
@@ -464,17 +1024,28 @@ def parse_geopoint(
             where `<lon>` and `<lat>` are any values accepted by :class:`float`.
 
     Returns:
-        Either parsed geopoints (as :class:`tuple`: lon, lat) or a parsing error.
+        Either parsed geopoints (as :class:`geopoint.GeopointDtype`) or a parsing
+        error.
     """
-    mask = ~x.isna()
-    functions = {
-        "default": _extract_geopoint_default,
-        "array": _extract_geopoint_array,
-        "object": _extract_geopoint_object,
-    }
-    parsed = x[mask].apply(functions[format])
-    invalid = parsed.isna()
-    if invalid.any():
-        invalids = x[mask][invalid].unique().tolist()
-        return ValueTypeError(fieldType="geopoint", fieldFormat=format, values=invalids)
-    return parsed.reindex_like(x)
+    mask = x.notna().values
+    values = np.full((len(x), 2), np.nan)
+    if mask.any():
+        y = x[mask]
+        parts = _extract_geopoint_parts(y, format=format)
+        invalid = np.zeros(len(y), dtype=bool)
+        for i in range(2):
+            coordinates, isna, failed = _parse_blocks(
+                pd.Series(parts[i], dtype=object),
+                parse_block=_parse_number_block,
+                parse_value=_parse_number,
+                dtype=float,
+            )
+            values[mask, i] = coordinates
+            invalid |= isna | failed
+        if invalid.any():
+            return ValueTypeError(
+                fieldType="geopoint",
+                fieldFormat=format,
+                **_summarize_values(y[invalid]),
+            )
+    return pd.Series(GeopointArray(values, ~mask), index=x.index, name=x.name)
@@ -0,0 +1,279 @@
+"""Measure and trace the stages of validation."""
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+_HOOKS: List[Callable[[dict], None]] = []
+"""Functions called with each stage event (see :func:`add_hook`)."""
+
+_local = threading.local()
+
+
+def add_hook(hook: Callable[[dict], None]) -> None:
+    """
+    Register a function to call at the start and end of each stage of validation.
+
+    Stages are reading a table (`read`), parsing a field (`parse`), checking field
+    constraints (`constraints`), and checking a unique key (`uniqueKeys`) or
+    foreign key (`foreignKeys`). The function is called with an event (`dict`):
+
+    - `event`: Either 'stage_start' or 'stage_end'.
+    - `stage`: Stage name.
+    - `resource`: Name of the resource, if known.
+    - `field`: Name of the field or, for keys, field names joined by commas.
+    - `rows`: Number of rows, if known.
+    - `bytes`: Size of the values in memory (not counting the Python objects they
+      may point to), if known.
+    - `time`: Time of the event (:func:`time.perf_counter`), in seconds.
+    - `thread`: Identifier of the thread running the stage.
+
+    With `workers`, stages run in several threads, so the function may be called
+    concurrently. Exceptions raised by the function are not caught.
+
+    Arguments:
+        hook: Function called with each event.
+
+    Examples:
+        >>> events = []
+        >>> add_hook(events.append)
+        >>> with stage('parse', field='x'):
+        ...     pass
+        >>> remove_hook(events.append)
+        >>> [(e['event'], e['stage'], e['field']) for e in events]
+        [('stage_start', 'parse', 'x'), ('stage_end', 'parse', 'x')]
+    """
+    _HOOKS.append(hook)
+
+
+def remove_hook(hook: Callable[[dict], None]) -> None:
+    """
+    Unregister a function registered with :func:`add_hook`.
+
+    Arguments:
+        hook: Function to unregister.
+    """
+    _HOOKS.remove(hook)
+
+
+@contextlib.contextmanager
+def resource_scope(name: Optional[str]) -> Iterator[None]:
+    """
+    Name the resource of the stages run in this thread.
+
+    Arguments:
+        name: Resource name.
+    """
+    previous = getattr(_local, "resource", None)
+    _local.resource = name
+    try:
+        yield
+    finally:
+        _local.resource = previous
+
+
+def _size(
+    data: Union[pd.DataFrame, pd.Series, Any], columns: List[str] = None
+) -> Optional[int]:
+    """Size of table or field values in memory (see :func:`add_hook`)."""
+    if isinstance(data, pd.DataFrame):
+        if columns is not None:
+            return int(sum(data[c].memory_usage(index=False) for c in columns))
+        return int(data.memory_usage(index=False).sum())
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(index=False))
+    return None
+
+
+def _emit(
+    event: str,
+    name: str,
+    field: Optional[str],
+    resource: Optional[str],
+    data: Any,
+    columns: Optional[List[str]],
+) -> None:
+    """Call registered hooks with a stage event (see :func:`add_hook`)."""
+    sized = isinstance(data, (pd.DataFrame, pd.Series))
+    info = {
+        "event": event,
+        "stage": name,
+        "resource": resource,
+        "field": field,
+        "rows": len(data) if sized else None,
+        "bytes": _size(data, columns) if sized else None,
+        "time": time.perf_counter(),
+        "thread": threading.get_ident(),
+    }
+    for hook in list(_HOOKS):
+        hook(info)
+
+
+@contextlib.contextmanager
+def stage(
+    name: str,
+    field: str = None,
+    stats: dict = None,
+    resource: str = None,
+    data: Union[pd.DataFrame, pd.Series] = None,
+    columns: List[str] = None,
+) -> Iterator[dict]:
+    """
+    Measure a stage of validation, and call hooks at its start and end.
+
+    The time taken (`time`, in seconds, with :func:`time.perf_counter`) is always
+    measured. If :mod:`tracemalloc` is tracing, so is the memory left allocated by
+    the stage (`allocated`, in bytes) and the peak memory allocated during the stage
+    (`peak`, in bytes, relative to the start of the stage). With Python 3.9 or
+    later, the traced peak is reset at the start of the stage. Before 3.9, it
+    cannot be reset, so the peak is only known if the stage exceeds the highest
+    peak traced so far, and is otherwise the memory left allocated (a lower bound).
+    Memory allocated outside of Python (e.g. by Arrow) is not traced. Memory is
+    traced for the whole process, so stages running concurrently in other threads
+    are counted as well.
+
+    Measurements of the same stage are added up, except for the peak memory, which
+    is the maximum of the measurements.
+
+    If neither `stats` nor hooks (see :func:`add_hook`) are set, nothing is done.
+
+    Arguments:
+        name: Stage name (e.g. 'parse').
+        field: Name of the field or key being processed, if any.
+        stats: Stage measurements, updated in place by stage (and by field).
+            If `None`, nothing is measured.
+        resource: Name of the resource. If `None`, the name set for the current
+            thread by :func:`resource_scope`, if any.
+        data: Values processed by the stage. Values at the end of the stage can be
+            set as `data` in the yielded dictionary.
+        columns: Columns of `data` processed by the stage, if not all.
+
+    Yields:
+        Dictionary for values at the end of the stage (`data`).
+
+    Examples:
+        >>> stats = {}
+        >>> with stage('parse', 'x', stats=stats):
+        ...     pass
+        >>> list(stats['parse']['x'])
+        ['time']
+        >>> tracemalloc.start()
+        >>> with stage('read', stats=stats):
+        ...     x = list(range(1000))
+        >>> stats['read']['allocated'] > 0
+        True
+        >>> stats['read']['peak'] >= stats['read']['allocated']
+        True
+        >>> tracemalloc.stop()
+    """
+    end = {}
+    if stats is None and not _HOOKS:
+        yield end
+        return
+    if resource is None:
+        resource = getattr(_local, "resource", None)
+    if _HOOKS:
+        _emit("stage_start", name, field, resource, data, columns)
+    tracing = stats is not None and tracemalloc.is_tracing()
+    if tracing:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        before, peak_before = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    try:
+        yield end
+    finally:
+        seconds = time.perf_counter() - start
+        if stats is not None:
+            measures = stats.setdefault(name, {})
+            if field is not None:
+                measures = measures.setdefault(field, {})
+            measures["time"] = measures.get("time", 0) + seconds
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                measures["allocated"] = measures.get("allocated", 0) + current - before
+                # Peak traced before the stage is not reset before Python 3.9
+                peak = peak - before if peak > peak_before else current - before
+                measures["peak"] = max(measures.get("peak", 0), peak)
+        if _HOOKS:
+            if "data" in end:
+                data, columns = end["data"], None
+            _emit("stage_end", name, field, resource, data, columns)
+
+
+class ChromeTrace:
+    """
+    Hook writing stage events to a file in the Chrome trace event format.
+
+    The file can be opened in a trace viewer (e.g. https://ui.perfetto.dev or
+    `chrome://tracing`), where each thread is shown as a track of stages.
+    Events are kept in memory and written to the file when tracing stops.
+
+    Arguments:
+        path: Path of the file to write (JSON).
+
+    Examples:
+        >>> import tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'trace.json')
+        >>> with ChromeTrace(path):
+        ...     with stage('parse', 'x', resource='table'):
+        ...         pass
+        >>> with open(path) as file:
+        ...     trace = json.load(file)
+        >>> [(e['name'], e['ph']) for e in trace['traceEvents']]
+        [('parse table.x', 'B'), ('parse table.x', 'E')]
+    """
+
+    def __init__(self: "ChromeTrace", path: str) -> None:
+        self.path = path
+        self.events: List[dict] = []
+        self.lock = threading.Lock()
+        self.start = time.perf_counter()
+
+    def __call__(self: "ChromeTrace", event: dict) -> None:
+        """Add a stage event (see :func:`add_hook`)."""
+        name = event["stage"]
+        if event["resource"] is not None:
+            name += " " + event["resource"]
+            if event["field"] is not None:
+                name += "." + event["field"]
+        elif event["field"] is not None:
+            name += " " + event["field"]
+        args = {
+            key: event[key]
+            for key in ("resource", "field", "rows", "bytes")
+            if event[key] is not None
+        }
+        trace_event = {
+            "name": name,
+            "cat": event["stage"],
+            "ph": "B" if event["event"] == "stage_start" else "E",
+            "ts": (event["time"] - self.start) * 1e6,
+            "pid": os.getpid(),
+            "tid": event["thread"],
+            "args": args,
+        }
+        with self.lock:
+            self.events.append(trace_event)
+
+    def write(self: "ChromeTrace") -> None:
+        """Write the events added so far to the file."""
+        with self.lock:
+            events = list(self.events)
+        with open(self.path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    def __enter__(self: "ChromeTrace") -> "ChromeTrace":
+        """Start tracing."""
+        add_hook(self)
+        return self
+
+    def __exit__(self: "ChromeTrace", *args: Any) -> None:
+        """Stop tracing and write the events to the file."""
+        remove_hook(self)
+        self.write()
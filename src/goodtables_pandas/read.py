@@ -1,9 +1,38 @@
-"""Read tabular data from csv files."""
+"""Read tabular data from csv, parquet, and feather files."""
+import bz2
+import concurrent.futures
+import contextlib
 import csv
-from typing import Iterable, List, Union
+import gzip
+import io
+import lzma
+import mmap
+import os
+import posixpath
+import struct
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import zipfile
 
 import frictionless
+from frictionless.plugins.local import LocalLoader
+from frictionless.plugins.multipart import MultipartByteStream, MultipartLoader
+import numpy as np
 import pandas as pd
+from typing_extensions import Literal
+
+from .errors import _ROW_INDEX
+from .profiling import stage
 
 
 class CSVDialect(csv.Dialect):
@@ -25,23 +54,36 @@ class CSVDialect(csv.Dialect):
         self.strict = True
 
 
-def read_table(
-    resource: dict, path: Union[str, Iterable[str]] = None
-) -> Union[pd.DataFrame, List[frictionless.errors.SourceError]]:
+def _null_values(resource: dict) -> List[str]:
     """
-    Read table from path(s).
+    Strings read as null.
+
+    Examples:
+        >>> _null_values({'dialect': {'nullSequence': 'NA'}})
+        ['', 'NA']
+    """
+    schema = resource.get("schema", {})
+    dialect = resource.get("dialect", {})
+    values = list(schema.get("missingValues", [""]))
+    if dialect.get("nullSequence") is not None:
+        values.append(dialect["nullSequence"])
+    return values
+
+
+def _read_csv_kwargs(resource: dict) -> dict:
+    """
+    Build :func:`pd.read_csv` arguments from a resource descriptor.
 
     Arguments:
         resource: Tabular Data Resource descriptor
             (https://specs.frictionlessdata.io/tabular-data-resource).
-        path: Path(s) to files to read. If `None`, `resource['path']` is used.
 
     Returns:
-        Table.
+        Keyword arguments for :func:`pd.read_csv`.
     """
     schema = resource.get("schema", {})
     dialect = resource.get("dialect", {})
-    kwargs = dict(
+    return dict(
         header=0 if dialect.get("header", True) else None,
         names=None
         if dialect.get("header", True)
@@ -50,8 +92,7 @@ def read_table(
         squeeze=False,
         dtype=str,
         engine="c",
-        na_values=schema.get("missingValues", [""])
-        + list(dialect.get("nullSequence", [])),
+        na_values=_null_values(resource),
         keep_default_na=False,
         na_filter=True,
         skip_blank_lines=False,
@@ -61,13 +102,1073 @@ def read_table(
         error_bad_lines=True,
         low_memory=True,
     )
+
+
+# Compression names (by resource compression or file extension) used by pandas
+_COMPRESSIONS = {
+    "gz": "gzip",
+    "gzip": "gzip",
+    "bz2": "bz2",
+    "xz": "xz",
+    "zst": "zstd",
+    "zstd": "zstd",
+    "zip": "zip",
+}
+
+
+def _compression(resource: dict, path: str) -> Optional[str]:
+    """
+    Compression of a file.
+
+    The compression is read from `resource['compression']` or else the extension
+    of the path.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+
+    Returns:
+        Compression, as named by :func:`pd.read_csv` (e.g. "gzip"), or `None`
+        if not compressed. Unknown compressions are returned as is.
+
+    Examples:
+        >>> _compression({}, 'x.csv.gz'), _compression({}, 'x.csv')
+        ('gzip', None)
+        >>> _compression({'compression': 'zst'}, 'x')
+        'zstd'
+        >>> _compression({'compression': 'no'}, 'x.csv.gz') is None
+        True
+    """
+    compression = resource.get("compression")
+    if compression is None:
+        return _COMPRESSIONS.get(os.path.splitext(path)[1][1:].lower())
+    compression = str(compression).lower()
+    if compression in ("", "no"):
+        return None
+    return _COMPRESSIONS.get(compression, compression)
+
+
+class _ZstdFile(io.RawIOBase):
+    """
+    Binary file of zstd-decompressed bytes.
+
+    Uses `zstandard` if installed, or else `pyarrow`.
+    Unlike the streams of either, it can be rewound (by decompressing again).
+
+    Arguments:
+        file: Binary file of zstd-compressed bytes.
+    """
+
+    def __init__(self: "_ZstdFile", file: BinaryIO) -> None:  # noqa: D107
+        self._file = file
+        # Streams replaced by rewinding are kept open, since closing a pyarrow
+        # stream also closes the file
+        self._streams = []
+        self.seek(0)
+
+    def readable(self: "_ZstdFile") -> bool:  # noqa: D102
+        return True
+
+    def readinto(self: "_ZstdFile", buffer: Any) -> int:  # noqa: D102
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self: "_ZstdFile", offset: int, whence: int = io.SEEK_SET) -> int:
+        """Rewind to the start (the only position supported)."""
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Can only seek to the start")
+        self._file.seek(0)
+        try:
+            import zstandard
+        except ImportError:
+            import pyarrow
+
+            stream = pyarrow.PythonFile(self._file, mode="r")
+            self._stream = pyarrow.CompressedInputStream(stream, "zstd")
+            self._streams.append(self._stream)
+        else:
+            decompressor = zstandard.ZstdDecompressor()
+            self._stream = decompressor.stream_reader(self._file, closefd=False)
+        return 0
+
+
+def _decompress(file: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """
+    Decompress a binary file as it is read.
+
+    Arguments:
+        file: Binary file.
+        compression: Compression (see :func:`_compression`). If "zstd", either
+            `zstandard` or `pyarrow` is required.
+
+    Raises:
+        ValueError: Compression not supported.
+
+    Returns:
+        Binary file of decompressed bytes.
+    """
+    if compression is None:
+        return file
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=file)
+    if compression == "bz2":
+        return bz2.BZ2File(file)
+    if compression == "xz":
+        return lzma.LZMAFile(file)
+    if compression == "zstd":
+        return _ZstdFile(file)
+    raise ValueError(f"Compression not supported: {compression}")
+
+
+def _split_archive(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Split the path of a file in a zip archive (e.g. `data.zip/table.csv`).
+
+    Arguments:
+        path: File path.
+
+    Returns:
+        Path of the archive and of the file within the archive,
+        or `None` if the path is not in a (local) zip archive.
+
+    Examples:
+        >>> _split_archive('table.csv') is None
+        True
+    """
+    parts = path.replace(os.sep, "/").split("/")
+    for i in range(1, len(parts)):
+        archive = "/".join(parts[:i])
+        if archive.lower().endswith(".zip") and os.path.isfile(archive):
+            return archive, posixpath.normpath("/".join(parts[i:]))
+    return None
+
+
+class _MappedFile(io.RawIOBase):
+    """
+    Binary file of a byte range of a memory-mapped file.
+
+    Arguments:
+        path: Path of the file to map.
+        offset: First byte of the range.
+        size: Number of bytes in the range.
+    """
+
+    def __init__(  # noqa: D107
+        self: "_MappedFile", path: str, offset: int, size: int
+    ) -> None:
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._start, self._end, self._position = offset, offset + size, offset
+
+    def readable(self: "_MappedFile") -> bool:  # noqa: D102
+        return True
+
+    def seekable(self: "_MappedFile") -> bool:  # noqa: D102
+        return True
+
+    def readinto(self: "_MappedFile", buffer: Any) -> int:  # noqa: D102
+        n = max(0, min(len(buffer), self._end - self._position))
+        buffer[:n] = self._map[self._position : self._position + n]
+        self._position += n
+        return n
+
+    def seek(  # noqa: D102
+        self: "_MappedFile", offset: int, whence: int = io.SEEK_SET
+    ) -> int:
+        base = {
+            io.SEEK_SET: self._start,
+            io.SEEK_CUR: self._position,
+            io.SEEK_END: self._end,
+        }[whence]
+        self._position = max(base + offset, self._start)
+        return self._position - self._start
+
+    def tell(self: "_MappedFile") -> int:  # noqa: D102
+        return self._position - self._start
+
+    def close(self: "_MappedFile") -> None:  # noqa: D102
+        if not self.closed:
+            self._map.close()
+        super().close()
+
+
+def _open_file(path: str) -> BinaryIO:
+    """
+    Open a local file, or a file in a zip archive, for reading as bytes.
+
+    Files stored in an archive without compression are read through a memory map
+    of the archive, and others are decompressed as they are read.
+
+    Arguments:
+        path: File path (e.g. `table.csv` or `data.zip/table.csv`).
+
+    Returns:
+        Binary file.
+    """
+    split = _split_archive(path)
+    if split is None:
+        return open(path, "rb")
+    archive, member = split
+    with zipfile.ZipFile(archive) as zip:
+        info = zip.getinfo(member)
+        if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+            with open(archive, "rb") as file:
+                file.seek(info.header_offset)
+                header = file.read(30)
+            if header[:4] == b"PK\x03\x04":
+                # File follows its local header (30 bytes, name, and extra field)
+                name_size, extra_size = struct.unpack("<HH", header[26:30])
+                offset = info.header_offset + 30 + name_size + extra_size
+                return io.BufferedReader(_MappedFile(archive, offset, info.file_size))
+        # Archive is kept open (by the file) until the file is closed
+        return zip.open(info)
+
+
+@contextlib.contextmanager
+def _csv_source(
+    resource: dict, path: str
+) -> Iterator[Tuple[Union[str, BinaryIO], Optional[str]]]:
+    """
+    Open a file for :func:`pd.read_csv`, or else pass the path.
+
+    Files in zip archives are opened with :func:`_open_file`. Files compressed with
+    zstd are decompressed with :func:`_decompress`, since :func:`pd.read_csv`
+    only supports zstd as of pandas 1.4.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: File path.
+
+    Yields:
+        Binary file or path, and its compression (for :func:`pd.read_csv`).
+    """
+    compression = _compression(resource, path)
+    if _split_archive(path) is None and compression != "zstd":
+        yield path, compression
+    else:
+        with _open_file(path) as file:
+            if compression == "zstd":
+                yield _decompress(file, compression), None
+            else:
+                yield file, compression
+
+
+class _LocalLoader(LocalLoader):
+    """Frictionless loader for local files in zip archives or compressed files."""
+
+    def read_byte_stream_create(self: "_LocalLoader") -> BinaryIO:  # noqa: D102
+        return _open_file(self.resource.source)
+
+    def read_byte_stream_decompress(  # noqa: D102
+        self: "_LocalLoader", byte_stream: BinaryIO
+    ) -> BinaryIO:
+        compression = _compression(self.resource, "")
+        if compression in ("bz2", "xz", "zstd"):
+            return _decompress(byte_stream, compression)
+        return super().read_byte_stream_decompress(byte_stream)
+
+
+class _MultipartByteStream(MultipartByteStream):
+    """Byte stream of the files of a table, each decompressed as it is read."""
+
+    def __init__(
+        self: "_MultipartByteStream",
+        path: List[str],
+        compression: Optional[str],
+        headless: bool,
+    ) -> None:
+        self.paths, self.compression, self.headless = path, compression, headless
+        super().__init__(path, remote=False, headless=headless)
+
+    def read_line_stream(self: "_MultipartByteStream") -> Iterator[bytes]:  # noqa: D102
+        for number, path in enumerate(self.paths, start=1):
+            with _open_file(path) as file:
+                lines = io.BufferedReader(_decompress(file, self.compression))
+                for line_number, line in enumerate(lines, start=1):
+                    # Header is only read from the first file
+                    if not self.headless and number > 1 and line_number == 1:
+                        continue
+                    yield line
+
+
+class _MultipartLoader(MultipartLoader):
+    """Frictionless loader for tables split into compressed files."""
+
+    def read_byte_stream_create(  # noqa: D102
+        self: "_MultipartLoader",
+    ) -> _MultipartByteStream:
+        headless = self.resource.get("dialect", {}).get("header") is False
+        headless = headless or self.resource.format != "csv"
+        return _MultipartByteStream(
+            self.resource.source, _compression(self.resource, ""), headless
+        )
+
+    def read_byte_stream_decompress(  # noqa: D102
+        self: "_MultipartLoader", byte_stream: BinaryIO
+    ) -> BinaryIO:
+        return byte_stream
+
+
+class _LocalPlugin(frictionless.Plugin):
+    """
+    Frictionless plugin for reading local files in zip archives or compressed files.
+
+    Frictionless only supports gzip and zip compression, and extracts zip archives
+    to temporary files. With this plugin, :func:`frictionless.validate` can check
+    the headers of files compressed with bz2, xz, or zstd, and reads files in zip
+    archives (see :func:`_split_archive`) directly from the archive. Tables split
+    into files compressed with bz2, xz, or zstd are decompressed file by file,
+    rather than once joined (see :class:`_MultipartLoader`).
+    It is only registered during validation (see :func:`_local_plugin`).
+    """
+
+    def create_loader(  # noqa: D102
+        self: "_LocalPlugin", resource: frictionless.Resource
+    ) -> Optional[frictionless.Loader]:
+        compressed = _compression(resource, "") in ("bz2", "xz", "zstd")
+        if resource.scheme == "multipart" and not resource.remote and compressed:
+            return _MultipartLoader(resource)
+        if resource.scheme != "file" or not isinstance(resource.source, str):
+            return None
+        if compressed or _split_archive(resource.source):
+            return _LocalLoader(resource)
+        return None
+
+
+# Number of active registrations of the plugin (see :func:`_local_plugin`)
+_plugin_users = 0
+_plugin_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _local_plugin() -> Iterator[None]:
+    """
+    Register :class:`_LocalPlugin` with frictionless while in the context.
+
+    Frictionless keeps plugins in a global registry (:data:`frictionless.system`),
+    so the plugin is only registered while needed, and then removed, so that
+    other uses of frictionless are not affected. Frictionless has no method to
+    remove a plugin, so it is removed from the registry directly.
+    """
+    global _plugin_users
+    system = frictionless.system
+    with _plugin_lock:
+        if not _plugin_users:
+            system.register("goodtables_pandas", _LocalPlugin())
+        _plugin_users += 1
+    try:
+        yield
+    finally:
+        with _plugin_lock:
+            _plugin_users -= 1
+            if not _plugin_users:
+                getattr(system, "_System__dynamic_plugins").pop(
+                    "goodtables_pandas", None
+                )
+                # Clear plugins and methods cached by frictionless
+                system.__dict__.pop("plugins", None)
+                system.__dict__.pop("methods", None)
+
+
+def _use_arrow(resource: dict, path: List[str]) -> bool:
+    """
+    Whether a resource can be read with :mod:`pyarrow.csv`.
+
+    Comments (`dialect.commentChar`) and zip compression are not supported by
+    pyarrow, and only local files (including files in zip archives) are read.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Paths to files to read.
+    """
+    dialect = resource.get("dialect", {})
+    return not dialect.get("commentChar") and all(
+        (os.path.isfile(p) or _split_archive(p) is not None)
+        and _compression(resource, p) in (None, "gzip", "bz2", "xz", "zstd")
+        for p in path
+    )
+
+
+@contextlib.contextmanager
+def _open_arrow(resource: dict, path: str) -> Iterator[Any]:
+    """
+    Open a file for reading with :mod:`pyarrow.csv`, decompressing as it is read.
+
+    Compressions supported by pyarrow are decompressed by pyarrow, and others
+    (xz) and files in zip archives with :func:`_open_file` and :func:`_decompress`.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+
+    Yields:
+        Input stream.
+    """
+    import pyarrow
+
+    compression = _compression(resource, path)
+    if compression in (None, "gzip", "bz2", "zstd") and _split_archive(path) is None:
+        with pyarrow.input_stream(path, compression=compression) as stream:
+            yield stream
+    else:
+        with _open_file(path) as file:
+            yield _decompress(file, compression)
+
+
+def _read_arrow_options(resource: dict, path: str) -> Tuple[Any, Any, Any]:
+    """
+    Build :mod:`pyarrow.csv` options from a resource descriptor.
+
+    Column names are read from the header with :class:`CSVDialect`
+    (without any byte order mark), as they are by :func:`pd.read_csv`,
+    so that all columns are read as strings.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+
+    Returns:
+        Read, parse, and convert options.
+    """
+    import pyarrow
+    import pyarrow.csv
+
+    schema = resource.get("schema", {})
+    dialect = resource.get("dialect", {})
+    encoding = resource.get("encoding", "utf-8")
+    if dialect.get("header", True):
+        with _open_file(path) as file:
+            text = io.TextIOWrapper(
+                _decompress(file, _compression(resource, path)),
+                encoding=encoding,
+                newline="",
+            )
+            names = next(csv.reader(text, dialect=CSVDialect(dialect)), [])
+        if names:
+            # Byte order mark is dropped, as it is by pd.read_csv
+            names[0] = names[0].lstrip("\ufeff")
+        skip_rows = 1
+    else:
+        names = [field["name"] for field in schema["fields"]]
+        skip_rows = 0
+    read_options = pyarrow.csv.ReadOptions(
+        column_names=names, skip_rows=skip_rows, encoding=encoding
+    )
+    parse_options = pyarrow.csv.ParseOptions(
+        delimiter=dialect.get("delimiter", ","),
+        quote_char=dialect.get("quoteChar", '"'),
+        double_quote=dialect.get("doubleQuote", True),
+        escape_char=dialect.get("escapeChar", None) or False,
+        newlines_in_values=True,
+        ignore_empty_lines=False,
+    )
+    convert_options = pyarrow.csv.ConvertOptions(
+        column_types={name: pyarrow.string() for name in names},
+        null_values=_null_values(resource),
+        strings_can_be_null=True,
+        quoted_strings_can_be_null=True,
+    )
+    return read_options, parse_options, convert_options
+
+
+def _skips_initial_space(resource: dict, table: Any) -> bool:
+    """
+    Whether a table read by :mod:`pyarrow.csv` has values with spaces to skip.
+
+    Pyarrow cannot skip spaces following a delimiter (`dialect.skipInitialSpace`),
+    and reads a value with leading spaces the same whether or not they were quoted
+    (e.g. ` a` and `" a"`). So tables with such values are read with
+    :func:`pd.read_csv` instead (see :func:`_read_csv_arrow`), which only skips
+    spaces outside quotes. Other tables are read the same by both.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        table: Table read by :mod:`pyarrow.csv`.
+    """
+    import pyarrow.compute
+
+    if not resource.get("dialect", {}).get("skipInitialSpace", True):
+        return False
+    return any(
+        pyarrow.compute.any(pyarrow.compute.starts_with(column, pattern=" ")).as_py()
+        for column in table.columns
+    )
+
+
+def _read_csv(resource: dict, path: str) -> pd.DataFrame:
+    """
+    Read file with :func:`pd.read_csv`.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+
+    Returns:
+        Table.
+    """
+    kwargs = _read_csv_kwargs(resource)
+    with _csv_source(resource, path) as (source, compression):
+        return pd.read_csv(source, compression=compression, **kwargs)
+
+
+def _read_csv_chunks(
+    resource: dict, path: str, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Read file in chunks with :func:`pd.read_csv`.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+        chunksize: Maximum number of rows per chunk.
+
+    Yields:
+        Table chunks.
+    """
+    kwargs = _read_csv_kwargs(resource)
+    with _csv_source(resource, path) as (source, compression):
+        yield from pd.read_csv(
+            source, chunksize=chunksize, compression=compression, **kwargs
+        )
+
+
+def _read_csv_arrow(resource: dict, path: str, names: List[str]) -> Any:
+    """
+    Read file with :func:`pd.read_csv` as a :class:`pyarrow.Table` of strings.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+        names: Column names.
+
+    Returns:
+        Table with columns of type `string`.
+    """
+    import pyarrow
+
+    df = _read_csv(resource, path)
+    df.columns = names
+    schema = pyarrow.schema([(name, pyarrow.string()) for name in names])
+    return pyarrow.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+def _read_arrow(resource: dict, path: str) -> Any:
+    """
+    Read file with :func:`pyarrow.csv.read_csv`.
+
+    If the table has spaces to skip (see :func:`_skips_initial_space`) or pyarrow
+    fails to parse it (e.g. rows with fewer values than columns, which
+    :func:`pd.read_csv` fills with nulls), the file is read with
+    :func:`pd.read_csv` instead (see :func:`_read_csv_arrow`).
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+
+    Returns:
+        Table with columns of type `string`.
+    """
+    import pyarrow
+    import pyarrow.csv
+
+    options = _read_arrow_options(resource, path)
+    with _open_arrow(resource, path) as stream:
+        try:
+            table = pyarrow.csv.read_csv(stream, *options)
+        except pyarrow.ArrowInvalid:
+            table = None
+    if table is None or _skips_initial_space(resource, table):
+        return _read_csv_arrow(resource, path, options[0].column_names)
+    return table
+
+
+def _arrow_to_pandas(table: Any, start: int = 0) -> pd.DataFrame:
+    """
+    Convert a :class:`pyarrow.Table` of strings to a table of Arrow-backed strings.
+
+    Arguments:
+        table: Table read by :mod:`pyarrow.csv`.
+        start: First row number of the index.
+
+    Returns:
+        Table with columns of type `string[pyarrow]`.
+    """
+    import pyarrow
+
+    df = table.to_pandas(types_mapper={pyarrow.string(): pd.StringDtype("pyarrow")}.get)
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+_COLUMNAR_FORMATS = ("parquet", "feather")
+
+
+def _columnar_format(resource: dict, path: List[str]) -> Optional[str]:
+    """
+    Columnar file format of a resource, if any.
+
+    The format is read from `resource['format']` or else the extension of the path.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Paths to files to read.
+
+    Returns:
+        Either "parquet", "feather", or `None` (if not a columnar format).
+
+    Examples:
+        >>> _columnar_format({'format': 'Parquet'}, ['x.bin'])
+        'parquet'
+        >>> _columnar_format({}, ['x.feather']), _columnar_format({}, ['x.csv'])
+        ('feather', None)
+    """
+    format = resource.get("format")
+    if not format and path:
+        format = os.path.splitext(path[0])[1][1:]
+    format = str(format or "").lower()
+    return format if format in _COLUMNAR_FORMATS else None
+
+
+def _read_columnar(
+    resource: dict, path: str, format: str, chunksize: int = None
+) -> Iterator[Any]:
+    """
+    Read a Parquet or Feather file with :mod:`pyarrow`.
+
+    The file is memory-mapped and only the schema fields are read, in schema order.
+    Parquet files are read in batches, while Feather files are sliced once mapped.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+        format: File format ("parquet" or "feather").
+        chunksize: Maximum number of rows per table. If `None`, the file is read
+            as a single table.
+
+    Raises:
+        ValueError: File is missing schema fields.
+
+    Yields:
+        Tables (:class:`pyarrow.Table`).
+    """
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    names = [field["name"] for field in resource.get("schema", {}).get("fields", [])]
+    archived = _split_archive(path) is not None
+    with contextlib.ExitStack() as stack:
+        # Files in zip archives are read as Python files (see _open_file)
+        source = stack.enter_context(_open_file(path)) if archived else path
+        if format == "parquet":
+            file = pyarrow.parquet.ParquetFile(source, memory_map=not archived)
+            columns = file.schema_arrow.names
+        else:
+            mapped = source if archived else pyarrow.memory_map(path)
+            columns = pyarrow.ipc.open_file(mapped).schema.names
+        missing = [name for name in names if name not in columns]
+        if missing:
+            raise ValueError(f"Fields missing from file: {missing}")
+        if format == "parquet" and chunksize:
+            for batch in file.iter_batches(batch_size=chunksize, columns=names):
+                yield pyarrow.Table.from_batches([batch])
+            return
+        if format == "parquet":
+            table = file.read(columns=names)
+        else:
+            if archived:
+                source.seek(0)
+            table = pyarrow.feather.read_table(
+                source, columns=names, memory_map=not archived
+            )
+    if not chunksize:
+        yield table
+        return
+    for start in range(0, len(table), chunksize):
+        yield table.slice(start, chunksize)
+
+
+def _arrow_types_mapper(type: Any) -> Optional[pd.api.extensions.ExtensionDtype]:
+    """
+    Map Arrow data types to pandas extension types.
+
+    Strings are kept in Arrow, and integers and booleans are mapped to nullable
+    types (rather than to floats and objects if they contain nulls).
+    """
+    import pyarrow
+
+    if type == pyarrow.string():
+        return pd.StringDtype("pyarrow")
+    if pyarrow.types.is_integer(type):
+        # e.g. int8 -> Int8, uint64 -> UInt64
+        return pd.api.types.pandas_dtype(str(type).capitalize().replace("Ui", "UI"))
+    if pyarrow.types.is_boolean(type):
+        return pd.BooleanDtype()
+    return None
+
+
+def _columnar_to_pandas(table: Any, start: int = 0) -> pd.DataFrame:
+    """
+    Convert a :class:`pyarrow.Table` of typed columns to a table.
+
+    Arguments:
+        table: Table read by :func:`_read_columnar`.
+        start: First row number of the index.
+
+    Returns:
+        Table with columns typed as in `table` (see :func:`_arrow_types_mapper`),
+        and dates as `datetime64[ns]`.
+    """
+    df = table.to_pandas(date_as_object=False, types_mapper=_arrow_types_mapper)
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+def _source_error(
+    error: Exception, path: List[str], i: int
+) -> frictionless.errors.SourceError:
+    """
+    Build an error for a failure to read one of the files of a table.
+
+    If the table has more than one file, the note names the file that failed.
+
+    Examples:
+        >>> _source_error(ValueError('bad'), ['a.csv', 'b.csv'], 1)['note']
+        'Part 2 of 2 (b.csv): bad'
+    """
+    note = str(error)
+    if len(path) > 1:
+        note = f"Part {i + 1} of {len(path)} ({path[i]}): {note}"
+    return frictionless.errors.SourceError(note=note)
+
+
+def _read_parts(
+    read: Callable[[str], Any], path: List[str], workers: int = None
+) -> Union[List[Any], List[frictionless.errors.SourceError]]:
+    """
+    Read the files of a table, concurrently if requested.
+
+    Reading stops at the first file (in path order) that fails.
+
+    Arguments:
+        read: Function that reads a file.
+        path: Paths to files to read.
+        workers: If set, files are read concurrently in up to this many threads.
+
+    Returns:
+        Either the result of `read` for each file, or a list with an error naming
+        the file that failed (see :func:`_source_error`).
+    """
+    if not workers or len(path) < 2:
+        parts = []
+        for i, p in enumerate(path):
+            try:
+                parts.append(read(p))
+            except Exception as e:
+                return [_source_error(e, path, i)]
+        return parts
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        futures = [executor.submit(read, p) for p in path]
+        for i, future in enumerate(futures):
+            error = future.exception()
+            if error is not None:
+                for f in futures[i + 1 :]:
+                    f.cancel()
+                return [_source_error(error, path, i)]
+    return [future.result() for future in futures]
+
+
+def _index_rows(df: pd.DataFrame, file: int) -> pd.DataFrame:
+    """
+    Index a table read from a file by file number and row number.
+
+    Arguments:
+        df: Table, indexed by row number (starting at zero) in the file.
+        file: File number (position in the paths of the table).
+
+    Returns:
+        The table, with index levels `file` and `row`.
+
+    Examples:
+        >>> _index_rows(pd.DataFrame({'x': [1, 2]}), 1).index.tolist()
+        [(1, 0), (1, 1)]
+    """
+    files = np.full(len(df), file, dtype=np.int64)
+    df.index = pd.MultiIndex.from_arrays([files, df.index], names=_ROW_INDEX)
+    return df
+
+
+def _concat_arrow(
+    tables: List[Any],
+    to_pandas: Callable[[Any], pd.DataFrame],
+    row_numbers: bool = False,
+) -> pd.DataFrame:
+    """
+    Combine the :class:`pyarrow.Table` read from each file of a table.
+
+    Tables with the same Arrow schema are concatenated (without copying) before
+    they are converted, so that values are not copied a second time by
+    :func:`pd.concat`. The index restarts at zero for each file, as it does when
+    reading files with :func:`pd.read_csv`.
+
+    Arguments:
+        tables: Tables read from each file.
+        to_pandas: Function that converts a table to a :class:`pd.DataFrame`.
+        row_numbers: Whether to index the table by file number and row number
+            (see :func:`_index_rows`).
+
+    Returns:
+        Table.
+    """
+    import pyarrow
+
+    if len(tables) > 1 and all(t.schema.equals(tables[0].schema) for t in tables):
+        df = to_pandas(pyarrow.concat_tables(tables))
+        rows = np.concatenate([np.arange(len(t)) for t in tables])
+        if row_numbers:
+            files = np.repeat(np.arange(len(tables)), [len(t) for t in tables])
+            df.index = pd.MultiIndex.from_arrays([files, rows], names=_ROW_INDEX)
+        else:
+            df.index = rows
+        return df
+    dfs = [to_pandas(table) for table in tables]
+    if row_numbers:
+        dfs = [_index_rows(df, i) for i, df in enumerate(dfs)]
+    return pd.concat(dfs)
+
+
+def read_table(
+    resource: dict,
+    path: Union[str, Iterable[str]] = None,
+    engine: Literal["c", "pyarrow"] = "c",
+    workers: int = None,
+    row_numbers: bool = False,
+    stats: dict = None,
+) -> Union[pd.DataFrame, List[frictionless.errors.SourceError]]:
+    """
+    Read table from path(s).
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path(s) to files to read. If `None`, `resource['path']` is used.
+        engine: Parser engine. With "c", :func:`pd.read_csv` is used and values are
+            read as Python strings. With "pyarrow" (if installed),
+            :func:`pyarrow.csv.read_csv` is used (with multiple threads) and values
+            are read as Arrow-backed strings (`string[pyarrow]`), which use much
+            less memory. Comments and remote files are not supported by "pyarrow",
+            so "c" is used instead, as it is for files with spaces to skip after
+            delimiters (see :func:`_skips_initial_space`) and files that pyarrow
+            fails to parse (e.g. with rows of fewer values). Parquet and Feather
+            files (see :func:`_columnar_format`) are always read with
+            :mod:`pyarrow`, with column types preserved
+            (see :func:`_columnar_to_pandas`).
+        workers: If set and the table has more than one file, files are read
+            concurrently in up to this many threads. With :mod:`pyarrow`, files are
+            combined without copying (see :func:`_concat_arrow`).
+        row_numbers: Whether to index the table by file number and row number
+            (starting at zero) in the file (see :func:`_index_rows`), rather than
+            by row number only, so that invalid values can be located in their
+            files (see :func:`errors._summarize_values`).
+        stats: If set, the time and memory taken to read the table are added to it
+            (see :func:`profiling.stage`).
+
+    Returns:
+        Table.
+    """
+    with stage("read", stats=stats, resource=resource.get("name")) as end:
+        end["data"] = _read_table(resource, path, engine, workers, row_numbers)
+    return end["data"]
+
+
+def _read_table(
+    resource: dict,
+    path: Union[str, Iterable[str]] = None,
+    engine: Literal["c", "pyarrow"] = "c",
+    workers: int = None,
+    row_numbers: bool = False,
+) -> Union[pd.DataFrame, List[frictionless.errors.SourceError]]:
+    """Read table from path(s), as described by :func:`read_table`."""
+    path = path if path else resource.get("path")
+    if isinstance(path, str):
+        path = [path]
+    format = _columnar_format(resource, path)
+    if format:
+        tables = _read_parts(
+            lambda p: next(_read_columnar(resource, p, format)), path, workers
+        )
+        if tables and isinstance(tables[0], frictionless.errors.SourceError):
+            return tables
+        return _concat_arrow(tables, _columnar_to_pandas, row_numbers)
+    if engine == "pyarrow" and _use_arrow(resource, path):
+        tables = _read_parts(lambda p: _read_arrow(resource, p), path, workers)
+        if tables and isinstance(tables[0], frictionless.errors.SourceError):
+            return tables
+        return _concat_arrow(tables, _arrow_to_pandas, row_numbers)
+    tables = _read_parts(lambda p: _read_csv(resource, p), path, workers)
+    if tables and isinstance(tables[0], frictionless.errors.SourceError):
+        return tables
+    if row_numbers:
+        tables = [_index_rows(df, i) for i, df in enumerate(tables)]
+    return tables[0] if len(tables) == 1 else pd.concat(tables)
+
+
+def _slice_batches(reader: Any, chunksize: int) -> Iterator[Any]:
+    """
+    Combine record batches (of variable size) and split them into chunks.
+
+    Arguments:
+        reader: Record batch reader (e.g. from :func:`pyarrow.csv.open_csv`).
+        chunksize: Maximum number of rows per chunk.
+
+    Yields:
+        Tables of `chunksize` rows (the last may have fewer).
+    """
+    import pyarrow
+
+    batches, rows = [], 0
+    for batch in reader:
+        batches.append(batch)
+        rows += batch.num_rows
+        while rows >= chunksize:
+            table = pyarrow.Table.from_batches(batches, schema=reader.schema)
+            yield table.slice(0, chunksize)
+            table = table.slice(chunksize)
+            batches, rows = table.to_batches(), len(table)
+    if rows:
+        yield pyarrow.Table.from_batches(batches, schema=reader.schema)
+
+
+def _read_arrow_chunks(
+    resource: dict, path: str, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Read file in chunks with :func:`pyarrow.csv.open_csv`.
+
+    From the first chunk with spaces to skip (see :func:`_skips_initial_space`)
+    or that pyarrow fails to parse (e.g. rows with fewer values than columns, which
+    :func:`pd.read_csv` fills with nulls), the file is read with
+    :func:`pd.read_csv` instead.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path to file to read.
+        chunksize: Maximum number of rows per chunk.
+
+    Yields:
+        Table chunks (see :func:`_arrow_to_pandas`).
+    """
+    import pyarrow
+    import pyarrow.csv
+
+    options = _read_arrow_options(resource, path)
+    start = 0
+    with _open_arrow(resource, path) as stream:
+        try:
+            reader = pyarrow.csv.open_csv(stream, *options)
+            for table in _slice_batches(reader, chunksize):
+                if _skips_initial_space(resource, table):
+                    break
+                yield _arrow_to_pandas(table, start=start)
+                start += len(table)
+            else:
+                return
+        except pyarrow.ArrowInvalid:
+            pass
+    # Previous chunks are read again, as pd.read_csv cannot start at a given row
+    for i, chunk in enumerate(_read_csv_chunks(resource, path, chunksize)):
+        if i >= start // chunksize:
+            yield chunk.astype(pd.StringDtype("pyarrow"))
+
+
+def read_table_chunks(
+    resource: dict,
+    path: Union[str, Iterable[str]] = None,
+    chunksize: int = 100000,
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+    stats: dict = None,
+) -> Iterator[Union[pd.DataFrame, List[frictionless.errors.SourceError]]]:
+    """
+    Read table from path(s) in chunks.
+
+    Only one chunk is held in memory at a time. Chunks never span two files.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor
+            (https://specs.frictionlessdata.io/tabular-data-resource).
+        path: Path(s) to files to read. If `None`, `resource['path']` is used.
+        chunksize: Maximum number of rows per chunk.
+        engine: Parser engine (see :func:`read_table`).
+        row_numbers: Whether to index chunks by file number and row number
+            (see :func:`read_table`).
+        stats: If set, the time and memory taken to read each chunk are added to it
+            (see :func:`profiling.stage`).
+
+    Yields:
+        Table chunks. If reading fails, a list of errors is yielded last.
+    """
+    chunks = _read_table_chunks(resource, path, chunksize, engine, row_numbers)
+    while True:
+        with stage("read", stats=stats, resource=resource.get("name")) as end:
+            end["data"] = next(chunks, None)
+        if end["data"] is None:
+            return
+        yield end["data"]
+
+
+def _read_table_chunks(  # noqa: C901
+    resource: dict,
+    path: Union[str, Iterable[str]] = None,
+    chunksize: int = 100000,
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+) -> Iterator[Union[pd.DataFrame, List[frictionless.errors.SourceError]]]:
+    """Read table from path(s) in chunks, as described by :func:`read_table_chunks`."""
     path = path if path else resource.get("path")
     if isinstance(path, str):
         path = [path]
-    tables = []
-    for p in path:
+    format = _columnar_format(resource, path)
+    if format:
+        for i, p in enumerate(path):
+            try:
+                start = 0
+                for table in _read_columnar(resource, p, format, chunksize):
+                    chunk = _columnar_to_pandas(table, start=start)
+                    yield _index_rows(chunk, i) if row_numbers else chunk
+                    start += len(table)
+            except Exception as e:
+                yield [_source_error(e, path, i)]
+                return
+        return
+    if engine == "pyarrow" and _use_arrow(resource, path):
+        for i, p in enumerate(path):
+            try:
+                for chunk in _read_arrow_chunks(resource, p, chunksize=chunksize):
+                    yield _index_rows(chunk, i) if row_numbers else chunk
+            except Exception as e:
+                yield [_source_error(e, path, i)]
+                return
+        return
+    for i, p in enumerate(path):
         try:
-            tables.append(pd.read_csv(p, **kwargs))
+            for chunk in _read_csv_chunks(resource, p, chunksize):
+                yield _index_rows(chunk, i) if row_numbers else chunk
         except Exception as e:
-            return [frictionless.errors.SourceError(note=str(e))]
-    return pd.concat(tables)
+            yield [_source_error(e, path, i)]
+            return
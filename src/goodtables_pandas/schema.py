@@ -0,0 +1,159 @@
+"""Compile table schemas for reuse across tables and validations."""
+import collections
+import copy
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Tuple, Union
+
+import pandas as pd
+
+from . import options as OPTIONS
+from .check import _as_list, _compile_field_constraints
+from .errors import TypeError as ValueTypeError
+from .parse import _bind_parser
+
+
+class CompiledField:
+    """
+    Table field prepared for parsing and checking.
+
+    Arguments:
+        field: Field descriptor
+            (https://specs.frictionlessdata.io/table-schema/#field-descriptors).
+
+    Attributes:
+        name: Field name.
+        parse: Function which parses field values (see :func:`parse.parse_field`).
+        constraints: Field constraints, filtered by field type and with values
+            parsed and patterns compiled.
+    """
+
+    def __init__(self: "CompiledField", field: dict) -> None:  # noqa: D107
+        self.name: str = field["name"]
+        self.parse: Callable[
+            [pd.Series], Union[pd.Series, ValueTypeError]
+        ] = _bind_parser(**field)
+        self.constraints: Dict[str, Any] = _compile_field_constraints(field)
+
+    def __repr__(self: "CompiledField") -> str:  # noqa: D105
+        return f"CompiledField({self.name!r})"
+
+
+class CompiledSchema:
+    """
+    Table schema prepared for parsing and checking.
+
+    Compiled schemas are equal (and hash equal) if their schemas have equal content.
+    They are not meant to be modified.
+
+    Arguments:
+        schema: Table schema (https://specs.frictionlessdata.io/table-schema).
+        key: Hash of the schema content.
+
+    Attributes:
+        schema: Copy of the table schema, with keys (`primaryKey`, `uniqueKeys`,
+            and the `fields` of `foreignKeys`) as lists of field names.
+        key: Hash of the schema content.
+        fields: Compiled fields.
+
+    Examples:
+        >>> schema = {'fields': [{'name': 'x', 'type': 'integer'}], 'primaryKey': 'x'}
+        >>> compiled = compile_schema(schema)
+        >>> compiled.schema['primaryKey']
+        ['x']
+        >>> compiled.fields
+        (CompiledField('x'),)
+        >>> compile_schema(dict(schema)) is compiled
+        True
+    """
+
+    def __init__(self: "CompiledSchema", schema: dict, key: str) -> None:  # noqa: D107
+        schema = copy.deepcopy(schema)
+        if "primaryKey" in schema:
+            schema["primaryKey"] = _as_list(schema["primaryKey"])
+        if "uniqueKeys" in schema:
+            schema["uniqueKeys"] = [_as_list(k) for k in schema["uniqueKeys"]]
+        for foreignKey in schema.get("foreignKeys", []):
+            foreignKey["fields"] = _as_list(foreignKey["fields"])
+            foreignKey["reference"]["fields"] = _as_list(
+                foreignKey["reference"]["fields"]
+            )
+        self.schema: dict = schema
+        self.key: str = key
+        self.fields: Tuple[CompiledField, ...] = tuple(
+            CompiledField(field) for field in schema.get("fields", [])
+        )
+
+    def __eq__(self: "CompiledSchema", other: Any) -> bool:  # noqa: D105
+        return isinstance(other, CompiledSchema) and self.key == other.key
+
+    def __hash__(self: "CompiledSchema") -> int:  # noqa: D105
+        return hash(self.key)
+
+    def __repr__(self: "CompiledSchema") -> str:  # noqa: D105
+        return f"CompiledSchema({[field.name for field in self.fields]})"
+
+
+# Compiled schemas by key, in order of use (least recent first)
+_CACHE: "collections.OrderedDict[str, CompiledSchema]" = collections.OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def _serialize_schema(schema: dict) -> Tuple[str, str]:
+    """
+    Serialize table schema content.
+
+    Arguments:
+        schema: Table schema.
+
+    Returns:
+        Schema as JSON (with sorted keys) and its hexadecimal SHA-256 digest.
+
+    Examples:
+        >>> a = _serialize_schema({'a': 1, 'b': [2]})
+        >>> b = _serialize_schema({'b': [2], 'a': 1})
+        >>> a == b
+        True
+        >>> a[0]
+        '{"a": 1, "b": [2]}'
+    """
+    text = json.dumps(schema, sort_keys=True, default=str)
+    return text, hashlib.sha256(text.encode()).hexdigest()
+
+
+def compile_schema(schema: Union[dict, CompiledSchema]) -> CompiledSchema:
+    """
+    Compile table schema for parsing and checking.
+
+    Field parsers are resolved and bound to field attributes, constraint values are
+    parsed to the field type, and patterns are compiled. The result can be passed
+    in place of the schema to :func:`parse.parse_table` and
+    :func:`check.check_constraints`.
+
+    Compiled schemas are cached by schema content
+    (see :data:`options.schema_cache_size`), so compiling the same schema again
+    returns the same object.
+
+    Arguments:
+        schema: Table schema (https://specs.frictionlessdata.io/table-schema).
+
+    Raises:
+        NotImplementedError: Field type not supported.
+
+    Returns:
+        Compiled table schema.
+    """
+    if isinstance(schema, CompiledSchema):
+        return schema
+    text, key = _serialize_schema(schema)
+    with _CACHE_LOCK:
+        if key in _CACHE:
+            _CACHE.move_to_end(key)
+            return _CACHE[key]
+    compiled = CompiledSchema(json.loads(text), key=key)
+    with _CACHE_LOCK:
+        _CACHE[key] = compiled
+        while len(_CACHE) > max(OPTIONS.schema_cache_size, 0):
+            _CACHE.popitem(last=False)
+    return compiled
@@ -1,67 +1,242 @@
 """Validate tabular data packages."""
+import collections
+import concurrent.futures
+import contextlib
+import json
+import os
+import posixpath
+import threading
 import time
-from typing import Any, Dict, Tuple, Union
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import zipfile
 
 import frictionless
+import numpy as np
 import pandas as pd
 from typing_extensions import Literal
 
+from . import options as OPTIONS
+from .cache import hash_table, load_result, save_result
 from .check import (
     _as_list,
+    _check_field_constraints,
+    _factorize_key,
+    _find_duplicates,
+    _hash_key,
+    _index_key,
+    _isin_key,
+    _merge_key_hashes,
+    _update_key_hashes,
     check_constraints,
     check_foreign_keys,
     check_primary_key,
     check_unique_keys,
 )
-from .parse import parse_table
-from .read import read_table
+from .errors import (
+    _cap_row_numbers,
+    _summarize_values,
+    ConstraintError,
+    ForeignKeyError,
+    UniqueKeyError,
+)
+from .parse import _decode_categories, parse_table
+from .profiling import resource_scope, stage
+from .read import (
+    _columnar_format,
+    _compression,
+    _local_plugin,
+    read_table,
+    read_table_chunks,
+)
+from .schema import compile_schema
 
 
-def validate(  # noqa: C901
-    source: Union[str, dict],
-    source_type: Literal["package"] = "package",
-    return_tables: bool = False,
-    **options: Any,
-) -> Union[frictionless.Report, Tuple[frictionless.Report, Dict[str, pd.DataFrame]]]:
+def _merge_errors(errors: List[dict], new: List[dict]) -> List[dict]:
     """
-    Validate a Tabular Data Package.
+    Merge errors found in a table chunk into those found in previous chunks.
 
-    This is a wrapper of :func:`frictionless.validate`:
-    https://frictionlessdata.io/tooling/python/api-reference/#frictionless-validate
+    Errors for the same field, constraint, or key are combined into one error listing
+    the unique values of both (up to :data:`options.max_values`), and counting the
+    invalid rows of both. The number of distinct values is exact unless values
+    were left out of either error, in which case it is a lower bound.
 
     Arguments:
-        source: Path to, or content of, a Tabular Data Package descriptor.
-        source_type: Souce type (currently limited to "package").
-        return_tables: Whether to return the tables read and parsed during validation.
-        **options: Optional arguments to :func:`frictionless.validate_package` and
-            :func:`frictionless.validate_table`.
+        errors: Errors from previous chunks.
+        new: Errors from the current chunk.
 
-    Raises:
-        NotImplementedError: Source type not supported.
+    Returns:
+        Merged errors.
+    """
+    for e in new:
+        match = None
+        for previous in errors:
+            if all(
+                e.get(k) == previous.get(k)
+                for k in ("code", "fieldName", "constraintName", "uniqueKey")
+            ):
+                match = previous
+                break
+        if match is None:
+            errors.append(e)
+        elif "values" in e:
+            values = match["values"] + e["values"]
+            if values and isinstance(values[0], list):
+                values = pd.DataFrame(values).drop_duplicates().values.tolist()
+            else:
+                values = pd.Series(values, dtype=object).unique().tolist()
+            # Values left out of either error may be distinct from all others
+            complete = all(len(x["values"]) == x["valueCount"] for x in (match, e))
+            match["valueCount"] = (
+                len(values)
+                if complete
+                else max(len(values), match["valueCount"], e["valueCount"])
+            )
+            match["rowCount"] += e["rowCount"]
+            if "rowNumbers" in e:
+                match["rowNumbers"] = _cap_row_numbers(
+                    match["rowNumbers"] + e["rowNumbers"]
+                )
+            match["values"] = values[: OPTIONS.max_values]
+    return errors
+
+
+# Order in which field constraints are checked (see :func:`check.check_constraints`)
+_CONSTRAINT_ORDER = (
+    "required",
+    "unique",
+    "minLength",
+    "maxLength",
+    "minimum",
+    "maximum",
+    "pattern",
+    "enum",
+)
+
+
+def _sort_errors(errors: List[dict], schema: dict) -> List[dict]:
+    """
+    Sort table errors in the order they are found when reading a table in full.
+
+    Errors for fields come first, in field order and then constraint order,
+    followed by errors for unique keys, in key order. Other errors keep their order.
+
+    Arguments:
+        errors: Table errors.
+        schema: Table schema, normalized by :func:`validate`.
 
     Returns:
-        An error report and (if `return_tables=True`) the tables.
+        Sorted errors.
+
+    Examples:
+        >>> schema = {'fields': [{'name': 'x'}, {'name': 'y'}], 'uniqueKeys': []}
+        >>> errors = [
+        ...     {'fieldName': 'y', 'constraintName': 'required'},
+        ...     {'fieldName': 'x', 'constraintName': 'enum'},
+        ...     {'fieldName': 'x', 'constraintName': 'unique'},
+        ... ]
+        >>> [(e['fieldName'], e['constraintName'])
+        ...  for e in _sort_errors(errors, schema)]
+        [('x', 'unique'), ('x', 'enum'), ('y', 'required')]
+    """
+    names = [field["name"] for field in schema.get("fields", [])]
+    keys = [_as_list(key) for key in schema.get("uniqueKeys", [])]
+
+    def order(e: dict) -> Tuple[int, int, int]:
+        if e.get("fieldName") in names:
+            constraint = e.get("constraintName")
+            rank = (
+                _CONSTRAINT_ORDER.index(constraint)
+                if constraint in _CONSTRAINT_ORDER
+                else -1
+            )
+            return 0, names.index(e["fieldName"]), rank
+        if "uniqueKey" in e and list(e["uniqueKey"]) in keys:
+            return 1, keys.index(list(e["uniqueKey"])), 0
+        return 2, 0, 0
+
+    return sorted(errors, key=order)
+
+
+def _read_archive_descriptor(path: str) -> Optional[Tuple[dict, str]]:
+    """
+    Read a Data Package descriptor from a zip archive.
+
+    The descriptor (`datapackage.json`) is read from the root of the archive or,
+    if not there, the shallowest folder that has one. Resource paths are then
+    relative to the descriptor within the archive (see :func:`read._split_archive`),
+    so that files are read from the archive without extracting them.
+
+    Arguments:
+        path: Path to zip archive.
+
+    Returns:
+        Descriptor and its base path (e.g. `data.zip/folder`),
+        or `None` if the archive has no descriptor.
+    """
+    with zipfile.ZipFile(path) as zip:
+        names = [
+            name
+            for name in zip.namelist()
+            if posixpath.basename(name) == "datapackage.json"
+        ]
+        if not names:
+            return None
+        name = min(names, key=lambda name: name.count("/"))
+        descriptor = json.loads(zip.read(name))
+    folder = posixpath.dirname(name)
+    return descriptor, os.path.join(path, folder) if folder else path
+
+
+def _declare_compression(resources: List[dict]) -> bool:
+    """
+    Declare compressions that frictionless does not detect from file extensions.
+
+    Frictionless only detects gzip and zip compression from the path, so resources
+    with a path like `data.csv.bz2` are given a `compression` ("bz2") and, if
+    missing, a `format` ("csv"). Resources with multiple paths are only given a
+    `compression` if all paths share the same compressed file extension.
+
+    Arguments:
+        resources: Data Resource descriptors, updated in place.
+
+    Returns:
+        Whether any resource was updated.
+
+    Examples:
+        >>> resources = [{'path': ['a.csv.xz', 'b.csv.xz']}, {'path': ['a.xz', 'b']}]
+        >>> _declare_compression(resources)
+        True
+        >>> resources
+        [{'path': ['a.csv.xz', 'b.csv.xz'], 'compression': 'xz', 'format': 'csv'},
+         {'path': ['a.xz', 'b']}]
+    """
+    updated = False
+    for resource in resources:
+        path = resource.get("path")
+        if "compression" in resource or not path:
+            continue
+        paths = [path] if isinstance(path, str) else path
+        extensions = {os.path.splitext(p)[1] for p in paths}
+        if len(extensions) > 1:
+            continue
+        if _compression({}, paths[0]) in ("bz2", "xz", "zstd"):
+            root, extension = os.path.splitext(paths[0])
+            resource["compression"] = extension[1:]
+            resource.setdefault("format", os.path.splitext(root)[1][1:] or "csv")
+            updated = True
+    return updated
+
+
+def _normalize_resources(resources: List[dict]) -> None:  # noqa: C901
+    """
+    Standardize and remove duplicate key constraints of Tabular Data Resources.
+
+    See the README (De-duplication of key constraints) for the transformation.
+
+    Arguments:
+        resources: Tabular Data Resource descriptors, updated in place.
     """
-    if source_type != "package":
-        raise NotImplementedError(f"source_type {source_type} not supported")
-    # Start clock
-    start = time.time()
-    # Initialize report
-    options = {
-        # Non-header rows are checked with pandas (limit_rows=0 not permitted)
-        "query": frictionless.Query(limit_rows=1),
-        "skip_errors": ["#body"],
-        # Foreign key checks are performed with pandas
-        "nolookup": True,
-        # Use existing schema rather than inferring one from a data sample
-        "noinfer": True,
-        # Multiprocessing not worth overhead for metadata and header checks
-        "nopool": True,
-        **options,
-    }
-    report = frictionless.validate(source=source, source_type=source_type, **options)
-    # Load resource descriptors (report descriptors missing resource name)
-    resources = frictionless.Package(source).get("resources", [])
     names = [resource["name"] for resource in resources]
     # Standardize format of resource schema attributes
     for resource in resources:
@@ -114,72 +289,937 @@ def validate(  # noqa: C901
                 field["constraints"]["required"] = True
             if field["name"] in unique:
                 field["constraints"]["unique"] = True
-    # Read and parse tables
-    dfs = {}
-    for i, resource in enumerate(resources):
-        table_start = time.time()
-        # Table body is not checked if table failed initial check
-        if not report["tables"][i]["valid"]:
-            continue
-        # Read table
-        # Pull resolved relative paths from report
-        paths = _as_list(report["tables"][i].get("path", ""))
-        result = read_table(resource, path=paths)
+
+
+def _unique_keys(schema: dict) -> List[List[str]]:
+    """Unique keys of a table schema normalized by :func:`validate`."""
+    return [
+        [field["name"]]
+        for field in schema.get("fields", [])
+        if field.get("constraints", {}).get("unique")
+    ] + [_as_list(key) for key in schema.get("uniqueKeys", [])]
+
+
+def _index_table(df: pd.DataFrame, schema: dict) -> dict:
+    """
+    Index the keys of a table, for checking foreign keys without the table.
+
+    Unlike the index built by :func:`_check_table_chunks`, unique keys are indexed
+    by their values (see :func:`check._index_key`) rather than their hashes,
+    so that foreign keys are checked exactly.
+
+    Arguments:
+        df: Table.
+        schema: Table schema, normalized by :func:`validate`.
+
+    Returns:
+        Key index, as returned by :func:`_check_table_chunks`.
+    """
+    unique = {tuple(key): _index_key(df[key]) for key in _unique_keys(schema)}
+    foreign = []
+    for foreignKey in schema.get("foreignKeys", []):
+        x = df[_as_list(foreignKey["fields"])].dropna()
+        codes, uniques = pd.factorize(_factorize_key(x, list(x.columns)))
+        counts = np.bincount(codes, minlength=len(uniques))
+        foreign.append((foreignKey, x[~_find_duplicates(x, list(x.columns))], counts))
+    return {"unique": unique, "foreign": foreign}
+
+
+def _check_table_chunks(  # noqa: C901
+    resource: dict,
+    path: List[str],
+    chunksize: int,
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+    budget: "_ErrorBudget" = None,
+    stats: dict = None,
+) -> Tuple[List[dict], int, Optional[dict]]:
+    """
+    Read, parse, and check a table in chunks.
+
+    Only one chunk is held in memory at a time.
+    Across chunks, only the errors found so far, the hashes of unique keys (as
+    sorted runs of unique hashes, see :func:`check._update_key_hashes`), and the
+    distinct values (and their number of rows) of foreign keys are kept. If any
+    unique key hashes repeat, the rows with those hashes are read again and
+    compared by value (see :func:`_check_key_duplicates`), so that hash collisions
+    are not reported as duplicates.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor, normalized by :func:`validate`.
+        path: Path(s) to files to read.
+        chunksize: Maximum number of rows per chunk.
+        engine: Parser engine (see :func:`read.read_table`).
+        row_numbers: Whether to list the rows of invalid values (see :func:`validate`).
+        budget: Error budget. Once spent, no more chunks are read.
+        stats: If set, the time and memory taken by each stage are added to it
+            (see :func:`profiling.stage`), summed over chunks.
+
+    Returns:
+        Errors, the number of rows, and (if the table was read and parsed without
+        errors) an index of its keys for use by :func:`_check_foreign_key_index`.
+    """
+    budget = budget or _ErrorBudget()
+    schema = resource.get("schema", {})
+    unique_keys = _unique_keys(schema)
+    foreign_keys = schema.get("foreignKeys", [])
+    # Sorted runs of unique hashes (see check._update_key_hashes)
+    seen = {tuple(key): [np.array([], dtype=np.uint64)] for key in unique_keys}
+    # Unique key hashes seen more than once
+    repeats = {tuple(key): [] for key in unique_keys}
+    seen_foreign = [[np.array([], dtype=np.uint64)] for _ in foreign_keys]
+    counts_foreign = [[np.array([], dtype=np.int64)] for _ in foreign_keys]
+    values_foreign = [[] for _ in foreign_keys]
+    errors, rows, parsed = [], 0, True
+    compiled = compile_schema(schema)
+    for chunk in read_table_chunks(
+        resource,
+        path=path,
+        chunksize=chunksize,
+        engine=engine,
+        row_numbers=row_numbers,
+        stats=stats,
+    ):
+        if isinstance(chunk, list):
+            return errors + chunk, rows, None
+        if budget.remaining(errors) == 0:
+            # Table was not read in full, so its keys cannot be indexed
+            return errors, rows, None
+        rows += len(chunk)
+        result = parse_table(
+            chunk,
+            schema=compiled,
+            error_limit=budget.remaining(errors),
+            fail_fast=budget.fail_fast,
+            stats=stats,
+        )
         if isinstance(result, list):
-            report["tables"][i]["errors"] += result
+            parsed = False
+            errors = _merge_errors(errors, result)
+        if not parsed:
+            # Keep reading to collect type errors from all chunks
+            continue
+        new = []
+        for field in compiled.fields:
+            if budget.remaining(errors + new) == 0:
+                break
+            constraints = {k: v for k, v in field.constraints.items() if k != "unique"}
+            with stage("constraints", field.name, stats=stats, data=result[field.name]):
+                new += _check_field_constraints(
+                    result[field.name],
+                    field.name,
+                    fail_fast=budget.fail_fast,
+                    **constraints,
+                )
+        # Field hashes shared by unique keys
+        hashes = {}
+        for key in unique_keys:
+            # Single-field keys are field constraints (unique)
+            name = "constraints" if len(key) == 1 else "uniqueKeys"
+            with stage(name, ",".join(key), stats=stats, data=result, columns=key):
+                key_hashes = _hash_key(result, key, hashes)
+                repeated = _update_key_hashes(seen[tuple(key)], key_hashes)
+                if repeated.any():
+                    repeats[tuple(key)].append(np.unique(key_hashes[repeated]))
+        for j, foreignKey in enumerate(foreign_keys):
+            fields = _as_list(foreignKey["fields"])
+            with stage(
+                "foreignKeys",
+                ",".join(fields),
+                stats=stats,
+                data=result,
+                columns=fields,
+            ):
+                x = result[fields].dropna()
+                repeated = _update_key_hashes(
+                    seen_foreign[j], _hash_key(x, fields), counts_foreign[j]
+                )
+                values_foreign[j].append(x[~repeated])
+        errors = _merge_errors(errors, new)
+    if not parsed:
+        # As when reading in full, constraints are not checked if parsing fails
+        return [e for e in errors if e["code"] == "type-error"], rows, None
+    repeats = {
+        key: np.unique(np.concatenate(hashes))
+        for key, hashes in repeats.items()
+        if hashes
+    }
+    if repeats and budget.remaining(errors) != 0:
+        new = _check_key_duplicates(
+            resource, path, repeats, chunksize, engine, row_numbers, stats
+        )
+        errors += new[: budget.remaining(errors)]
+    errors = _sort_errors(errors, schema)
+    for runs in seen.values():
+        _merge_key_hashes(runs)
+    unique = {key: runs[0] for key, runs in seen.items()}
+    foreign = []
+    for j, foreignKey in enumerate(foreign_keys):
+        if not values_foreign[j]:
+            foreign.append((foreignKey, None, None))
             continue
-        # Parse table
-        report["tables"][i]["scope"] += ["type-error"]
-        result = parse_table(result, schema=resource.get("schema", {}))
+        x = pd.concat(values_foreign[j])
+        _merge_key_hashes(seen_foreign[j], counts_foreign[j])
+        i = np.searchsorted(seen_foreign[j][0], _hash_key(x, list(x.columns)))
+        foreign.append((foreignKey, x, counts_foreign[j][0][i]))
+    return errors, rows, {"unique": unique, "foreign": foreign}
+
+
+def _check_key_duplicates(
+    resource: dict,
+    path: List[str],
+    repeats: Dict[Tuple[str, ...], np.ndarray],
+    chunksize: int,
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+    stats: dict = None,
+) -> List[Union[ConstraintError, UniqueKeyError]]:
+    """
+    Check unique keys for duplicates among the rows with repeated key hashes.
+
+    The table is read again in chunks, and only key fields are parsed. Rows whose
+    key hashes are among those repeated are kept and compared by value, as when
+    reading a table in full (see :func:`check.check_unique_keys`).
+
+    Arguments:
+        resource: Tabular Data Resource descriptor, normalized by :func:`validate`.
+            The table is expected to have been read and parsed without errors.
+        path: Path(s) to files to read.
+        repeats: Sorted unique hashes repeated in the table, by unique key.
+        chunksize: Maximum number of rows per chunk.
+        engine: Parser engine (see :func:`read.read_table`).
+        row_numbers: Whether to list the rows of invalid values (see :func:`validate`).
+        stats: If set, the time and memory taken by each stage are added to it
+            (see :func:`profiling.stage`), summed over chunks.
+
+    Returns:
+        A list of errors.
+    """
+    names = {name for key in repeats for name in key}
+    fields = [f for f in resource["schema"]["fields"] if f["name"] in names]
+    compiled = compile_schema({"fields": fields})
+    candidates = {key: [] for key in repeats}
+    for chunk in read_table_chunks(
+        resource,
+        path=path,
+        chunksize=chunksize,
+        engine=engine,
+        row_numbers=row_numbers,
+        stats=stats,
+    ):
+        if isinstance(chunk, list):
+            # Table has changed since it was first read
+            return []
+        result = parse_table(chunk, schema=compiled, stats=stats)
         if isinstance(result, list):
-            report["tables"][i]["errors"] += result
+            return []
+        # Field hashes shared by unique keys
+        hashes = {}
+        for key, repeated in repeats.items():
+            key_hashes = _hash_key(result, list(key), hashes)
+            i = np.minimum(np.searchsorted(repeated, key_hashes), len(repeated) - 1)
+            candidates[key].append(result[list(key)][repeated[i] == key_hashes])
+    errors = []
+    for key, chunks in candidates.items():
+        name = "constraints" if len(key) == 1 else "uniqueKeys"
+        with stage(name, ",".join(key), stats=stats):
+            x = pd.concat(chunks)
+            invalid = _find_duplicates(x, list(key))
+            if not invalid.any():
+                continue
+            if len(key) == 1:
+                errors.append(
+                    ConstraintError(
+                        fieldName=key[0],
+                        constraintName="unique",
+                        constraintValue=True,
+                        **_summarize_values(x[key[0]][invalid]),
+                    )
+                )
+            else:
+                errors.append(
+                    UniqueKeyError(
+                        uniqueKey=list(key),
+                        **_summarize_values(x[invalid]),
+                    )
+                )
+    return errors
+
+
+def _reference_key(foreignKey: dict) -> Tuple[str, Tuple[str, ...]]:
+    """Foreign table name and key field names of a foreign key."""
+    reference = foreignKey["reference"]
+    return reference["resource"], tuple(_as_list(reference["fields"]))
+
+
+def _check_foreign_key_index(
+    name: str, indexes: Dict[str, dict], stats: dict = None
+) -> List[ForeignKeyError]:
+    """
+    Check table foreign keys against the key indexes of tables read in chunks or cached.
+
+    Arguments:
+        name: Table name.
+        indexes: Key indexes by table name, as returned by :func:`_check_table_chunks`.
+        stats: If set, the time and memory taken to check each key are added to it
+            (see :func:`check.check_foreign_keys`).
+
+    Returns:
+        A list of errors.
+    """
+    errors = []
+    for foreignKey, x, counts in indexes[name]["foreign"]:
+        parent_name = foreignKey["reference"]["resource"] or name
+        if parent_name not in indexes or x is None or not len(x):
             continue
-        # Check field constraints and table keys
-        report["tables"][i]["scope"] += [
-            "constraint-error",
-            "unique-error",
-            "primary-key-error",
-        ]
-        name = resource["name"]
-        dfs[name] = result
-        errors = (
-            check_constraints(dfs[name], schema=resource.get("schema", {}))
-            + check_primary_key(
+        with stage("foreignKeys", ",".join(x.columns), stats=stats, data=x):
+            pkey = tuple(_as_list(foreignKey["reference"]["fields"]))
+            y = indexes[parent_name]["unique"][pkey]
+            if isinstance(y, list):
+                # Index of key values (see :func:`_index_table`)
+                invalid = ~_isin_key(x, y)
+            else:
+                # Sorted unique key hashes (see :func:`_check_table_chunks`)
+                hashes = _hash_key(x, list(x.columns))
+                i = np.minimum(np.searchsorted(y, hashes), max(len(y) - 1, 0))
+                invalid = y[i] != hashes if len(y) else np.ones(len(x), dtype=bool)
+            if invalid.any():
+                errors.append(
+                    ForeignKeyError(
+                        reference=foreignKey["reference"]["resource"],
+                        foreignKey=foreignKey,
+                        **_summarize_values(x[invalid], weights=counts[invalid]),
+                    )
+                )
+    return errors
+
+
+class _SerialExecutor(concurrent.futures.Executor):
+    """Executor that runs each task when it is submitted."""
+
+    def submit(  # noqa: D102
+        self: "_SerialExecutor", fn: Callable, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class _ErrorBudget:
+    """
+    Number of errors which can still be found, shared by the tables of a package.
+
+    Arguments:
+        limit: Maximum number of errors (see :func:`validate`). If `None`, errors
+            are not limited.
+        fail_fast: Whether to stop checking each field at its first invalid values
+            (see :func:`validate`).
+
+    Examples:
+        >>> budget = _ErrorBudget(limit=3)
+        >>> budget.spend(2)
+        >>> budget.remaining(), budget.remaining([{}, {}])
+        (1, 0)
+        >>> _ErrorBudget().remaining() is None
+        True
+    """
+
+    def __init__(
+        self: "_ErrorBudget", limit: int = None, fail_fast: bool = False
+    ) -> None:
+        self.limit = limit
+        self.fail_fast = fail_fast
+        self.spent = 0
+        self.lock = threading.Lock()
+
+    def remaining(self: "_ErrorBudget", errors: List[dict] = ()) -> Optional[int]:
+        """Number of errors which can still be found, besides `errors`."""
+        if self.limit is None:
+            return None
+        return max(self.limit - self.spent - len(errors), 0)
+
+    def spend(self: "_ErrorBudget", n: int) -> None:
+        """Count errors found."""
+        with self.lock:
+            self.spent += n
+
+
+def _locate_rows(errors: List[dict], path: List[str]) -> None:
+    """
+    Replace the file numbers of the rows listed in errors with file paths.
+
+    Arguments:
+        errors: Errors, updated in place (see :func:`errors._summarize_values`).
+        path: Path(s) to the files of the table.
+    """
+    for e in errors:
+        if "rowNumbers" in e:
+            e["rowNumbers"] = [[path[file], *rows] for file, *rows in e["rowNumbers"]]
+
+
+def _check_table(
+    resource: dict,
+    path: List[str],
+    chunksize: int = None,
+    cache: str = None,
+    cache_by: Literal["content", "stat"] = "content",
+    engine: Literal["c", "pyarrow"] = "c",
+    workers: int = None,
+    row_numbers: bool = False,
+    budget: _ErrorBudget = None,
+    stats: dict = None,
+) -> dict:
+    """
+    Read, parse, and check a table, except for its foreign keys.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor, normalized by :func:`validate`.
+        path: Path(s) to files to read.
+        chunksize: Maximum number of rows per chunk (see :func:`validate`).
+        cache: Directory of cached results (see :func:`validate`).
+        cache_by: Whether to identify files by content or by size and modification
+            time (see :func:`validate`).
+        engine: Parser engine (see :func:`read.read_table`).
+        workers: Maximum number of threads used to read the files of the table
+            (see :func:`read.read_table`).
+        row_numbers: Whether to list the rows of invalid values (see :func:`validate`).
+        budget: Error budget, spent by the errors found. If already spent, the table
+            is not read.
+        stats: If set, the time and memory taken by each stage (`read`, and by field
+            or key, `parse`, `constraints`, and `uniqueKeys`) are added to it
+            (see :func:`profiling.stage`). Nothing is measured for cached results.
+
+    Returns:
+        Errors (`errors`), error codes checked (`scope`), time taken (`time`), and
+        if the table was read and parsed without errors, the number of rows
+        (`rows`) and either the table (`table`) or, if read in chunks or with a
+        cache, an index of its keys (`index`, see :func:`_check_table_chunks`).
+    """
+    start = time.time()
+    key = (
+        hash_table(
+            resource,
+            path,
+            by=cache_by,
+            chunksize=chunksize,
+            engine=engine,
+            row_numbers=row_numbers,
+        )
+        if cache
+        else None
+    )
+    if key:
+        result = load_result(cache, key)
+        if result is not None:
+            _locate_rows(result["errors"], path)
+            result.update(table=None, time=time.time() - start)
+            return result
+    budget = budget or _ErrorBudget()
+    with resource_scope(resource.get("name")):
+        result = _read_and_check_table(
+            resource, path, chunksize, engine, workers, row_numbers, budget, stats
+        )
+    budget.spend(len(result["errors"]))
+    if key:
+        if result["table"] is not None:
+            result["index"] = _index_table(result["table"], resource["schema"])
+            result["table"] = None
+        # Rows are saved by file number, since the files may have moved when read
+        save_result(
+            cache, key, {k: result[k] for k in ("errors", "scope", "rows", "index")}
+        )
+    _locate_rows(result["errors"], path)
+    result["time"] = time.time() - start
+    return result
+
+
+def _read_and_check_table(
+    resource: dict,
+    path: List[str],
+    chunksize: int = None,
+    engine: Literal["c", "pyarrow"] = "c",
+    workers: int = None,
+    row_numbers: bool = False,
+    budget: _ErrorBudget = None,
+    stats: dict = None,
+) -> dict:
+    """
+    Read, parse, and check a table, except for its foreign keys.
+
+    See :func:`_check_table`, which wraps this function with a cache.
+    """
+    start = time.time()
+    result = {"errors": [], "scope": [], "rows": None, "table": None, "index": None}
+    if budget and budget.remaining() == 0:
+        result["time"] = time.time() - start
+        return result
+    schema = resource.get("schema", {})
+    key_scope = ["constraint-error", "unique-error", "primary-key-error"]
+    if chunksize:
+        result["scope"] += ["type-error"]
+        errors, rows, index = _check_table_chunks(
+            resource, path, chunksize, engine, row_numbers, budget, stats
+        )
+        result["errors"] += errors
+        if index is not None:
+            result["scope"] += key_scope
+            result.update(rows=rows, index=index)
+        result["time"] = time.time() - start
+        return result
+    df = read_table(
+        resource,
+        path=path,
+        engine=engine,
+        workers=workers,
+        row_numbers=row_numbers,
+        stats=stats,
+    )
+    if isinstance(df, list):
+        result["errors"] += df
+        result["time"] = time.time() - start
+        return result
+    result["scope"] += ["type-error"]
+    return _parse_and_check_table(df, schema, result, start, budget, stats)
+
+
+def _parse_and_check_table(
+    df: pd.DataFrame,
+    schema: dict,
+    result: dict,
+    start: float,
+    budget: _ErrorBudget = None,
+    stats: dict = None,
+) -> dict:
+    """
+    Parse and check a table, except for its foreign keys.
+
+    Arguments:
+        df: Table, as read by :func:`read.read_table`.
+        schema: Table schema, normalized by :func:`validate`.
+        result: Result (see :func:`_check_table`), updated in place.
+        start: Time the table started being read.
+        budget: Error budget. Once spent, the remaining checks are skipped.
+        stats: Stage measurements, updated in place (see :func:`_check_table`).
+
+    Returns:
+        The result.
+    """
+    budget = budget or _ErrorBudget()
+    compiled = compile_schema(schema)
+    df = parse_table(
+        df,
+        schema=compiled,
+        error_limit=budget.remaining(),
+        fail_fast=budget.fail_fast,
+        stats=stats,
+    )
+    if isinstance(df, list):
+        result["errors"] += df
+        result["time"] = time.time() - start
+        return result
+    result["scope"] += ["constraint-error", "unique-error", "primary-key-error"]
+    # Field codes shared by field constraints, the primary key, and unique keys
+    codes = {}
+    result["errors"] += check_constraints(
+        df,
+        schema=compiled,
+        codes=codes,
+        error_limit=budget.remaining(),
+        fail_fast=budget.fail_fast,
+        stats=stats,
+    )
+    if budget.remaining(result["errors"]) != 0:
+        result["errors"] += check_primary_key(
+            df,
+            schema.get("primaryKey", []),
+            skip_required=True,
+            skip_single=True,
+            codes=codes,
+        )
+    if budget.remaining(result["errors"]) != 0:
+        result["errors"] += check_unique_keys(
+            df,
+            schema.get("uniqueKeys", []),
+            skip_single=True,
+            codes=codes,
+            stats=stats,
+        )
+    result.update(rows=len(df), table=df, time=time.time() - start)
+    return result
+
+
+def _infer_column(x: pd.Series) -> pd.Series:
+    """
+    Convert a column of Python objects to a more specific data type.
+
+    Columns of strings are left to be parsed. Columns of Python numbers, booleans,
+    datetimes, and dates are converted to the matching pandas data type, so that
+    they are checked by data type rather than parsed (see :func:`parse._check_typed`).
+    Other objects are converted to strings, as if written to and read from a file.
+    Categorical columns are first decoded to the values of their categories
+    (see :func:`parse._decode_categories`).
+
+    Arguments:
+        x: Column values.
+
+    Returns:
+        Column values.
+
+    Examples:
+        >>> import datetime
+        >>> _infer_column(pd.Series([1, None], dtype=object)).dtype
+        dtype('float64')
+        >>> _infer_column(pd.Series([datetime.date(2020, 1, 1)])).dtype
+        dtype('<M8[ns]')
+        >>> _infer_column(pd.Series([1, 'a', None])).tolist()
+        ['1', 'a', None]
+        >>> _infer_column(pd.Series([True, None], dtype='category')).dtype
+        BooleanDtype
+    """
+    if isinstance(x.dtype, pd.CategoricalDtype):
+        x = _decode_categories(x)
+    if not pd.api.types.is_object_dtype(x.dtype):
+        return x
+    inferred = pd.api.types.infer_dtype(x, skipna=True)
+    if inferred in ("string", "empty"):
+        return x
+    if inferred == "boolean":
+        return x.astype("boolean")
+    if inferred == "date":
+        return pd.to_datetime(x)
+    y = x.infer_objects()
+    if not pd.api.types.is_object_dtype(y.dtype):
+        return y
+    return x.where(x.isna(), x.astype(str))
+
+
+def _check_frame(
+    resource: dict,
+    df: pd.DataFrame,
+    budget: _ErrorBudget = None,
+    stats: dict = None,
+) -> dict:
+    """
+    Parse and check a table already in memory, except for its foreign keys.
+
+    The table is not modified. Columns of Python objects are first converted
+    to a more specific data type, where possible (see :func:`_infer_column`).
+
+    Arguments:
+        resource: Tabular Data Resource descriptor, normalized by :func:`validate`.
+        df: Table.
+        budget: Error budget, spent by the errors found (see :func:`_check_table`).
+        stats: Stage measurements, updated in place (see :func:`_check_table`).
+
+    Returns:
+        Result, as returned by :func:`_check_table`.
+    """
+    start = time.time()
+    result = {
+        "errors": [],
+        "scope": ["type-error"],
+        "rows": None,
+        "table": None,
+        "index": None,
+    }
+    schema = resource.get("schema", {})
+    names = [field["name"] for field in schema.get("fields", [])]
+    df = pd.DataFrame({name: _infer_column(df[name]) for name in names}, copy=False)
+    budget = budget or _ErrorBudget()
+    with resource_scope(resource.get("name")):
+        result = _parse_and_check_table(df, schema, result, start, budget, stats)
+    budget.spend(len(result["errors"]))
+    return result
+
+
+def _check_table_foreign_keys(
+    resource: dict,
+    dfs: Dict[str, pd.DataFrame],
+    indexes: Dict[str, dict],
+    key_indexes: Optional[dict],
+    path: List[str] = None,
+    budget: _ErrorBudget = None,
+    stats: dict = None,
+) -> Tuple[List[dict], float]:
+    """
+    Check table foreign keys.
+
+    Arguments:
+        resource: Tabular Data Resource descriptor, normalized by :func:`validate`.
+        dfs: Tables by name.
+        indexes: Key indexes of tables read in chunks, by name
+            (see :func:`_check_table_chunks`).
+        key_indexes: Indexes of foreign table keys (see :func:`check_foreign_keys`).
+        path: Path(s) to the files of the table, to locate the rows of invalid values
+            (see :func:`_locate_rows`).
+        budget: Error budget, spent by the errors found.
+        stats: If set, the time and memory taken to check each foreign key
+            (`foreignKeys`) are added to it (see :func:`check.check_foreign_keys`).
+
+    Returns:
+        Errors and time taken.
+    """
+    start = time.time()
+    name = resource["name"]
+    with resource_scope(name):
+        if name in indexes:
+            errors = _check_foreign_key_index(name, indexes, stats)
+        else:
+            errors = check_foreign_keys(
                 dfs[name],
-                resource.get("schema", {}).get("primaryKey", []),
-                skip_required=True,
-                skip_single=True,
+                resource.get("schema", {}).get("foreignKeys", []),
+                references=dfs,
+                constraint=None,
+                indexes=key_indexes,
+                stats=stats,
             )
-            + check_unique_keys(
-                dfs[name],
-                resource.get("schema", {}).get("uniqueKeys", []),
-                skip_single=True,
+    if path and name not in indexes:
+        _locate_rows(errors, path)
+    if budget:
+        budget.spend(len(errors))
+    return errors, time.time() - start
+
+
+def _check_tables(  # noqa: C901
+    resources: List[dict],
+    report: frictionless.Report,
+    chunksize: int = None,
+    workers: int = None,
+    cache: str = None,
+    cache_by: Literal["content", "stat"] = "content",
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+    frames: Dict[str, pd.DataFrame] = None,
+    budget: _ErrorBudget = None,
+    profile: bool = False,
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, dict]]:
+    """
+    Check the tables of a package and add their errors to a report.
+
+    Each table is read, parsed, and checked (see :func:`_check_table`).
+    The foreign keys of a table are checked once the table and the foreign tables it
+    references have been checked. Indexes of foreign table keys referenced by more
+    than one foreign key are built once, and released once no longer needed.
+
+    Arguments:
+        resources: Tabular Data Resource descriptors, normalized by :func:`validate`.
+        report: Report of the initial (header) checks, updated in place.
+        chunksize: Maximum number of rows per chunk (see :func:`validate`).
+        workers: Maximum number of threads used to check tables concurrently,
+            and to read the files of each table concurrently.
+            If `None`, tables and files are read one at a time.
+        cache: Directory of cached results (see :func:`validate`).
+        cache_by: Whether to identify files by content or by size and modification
+            time (see :func:`validate`).
+        engine: Parser engine (see :func:`read.read_table`).
+        row_numbers: Whether to list the rows of invalid values (see :func:`validate`).
+        frames: Tables already in memory, by name, checked instead of reading
+            files (see :func:`validate_frames`).
+        budget: Error budget, shared by all tables. Once spent, no more tables are
+            read and no more foreign keys are checked.
+        profile: Whether to add the time and memory taken by each stage to the
+            table stats (`stages`, see :func:`_check_table`).
+
+    Returns:
+        Tables and (if read in chunks or with a cache) key indexes of tables,
+        by name.
+    """
+    budget = budget or _ErrorBudget()
+    stages = {i: {} if profile else None for i in range(len(resources))}
+    names = [resource["name"] for resource in resources]
+    foreign_keys = [
+        resource.get("schema", {}).get("foreignKeys", []) for resource in resources
+    ]
+    # Table body is not checked if table failed initial check
+    candidates = [i for i in range(len(resources)) if report["tables"][i]["valid"]]
+    parents = {
+        i: {
+            names.index(foreignKey["reference"]["resource"])
+            for foreignKey in foreign_keys[i]
+            if foreignKey["reference"]["resource"]
+        }
+        & set(candidates)
+        for i in candidates
+    }
+    key_uses = collections.Counter(
+        _reference_key(foreignKey)
+        for i in candidates
+        for foreignKey in foreign_keys[i]
+        if foreignKey["reference"]["resource"]
+    )
+    dfs, indexes, key_indexes = {}, {}, {}
+    checked, waiting, indexing = set(), set(candidates), set()
+    pending = {}
+    executor = (
+        concurrent.futures.ThreadPoolExecutor(workers) if workers else _SerialExecutor()
+    )
+
+    def release(i: int) -> None:
+        for foreignKey in foreign_keys[i]:
+            if foreignKey["reference"]["resource"]:
+                key = _reference_key(foreignKey)
+                key_uses[key] -= 1
+                if not key_uses[key]:
+                    key_indexes.pop(key, None)
+
+    with executor:
+        for i in candidates:
+            if frames is not None:
+                future = executor.submit(
+                    _check_frame, resources[i], frames[names[i]], budget, stages[i]
+                )
+                pending[future] = "table", i
+                continue
+            # Pull resolved relative paths from report
+            path = _as_list(report["tables"][i].get("path", ""))
+            future = executor.submit(
+                _check_table,
+                resources[i],
+                path,
+                chunksize,
+                cache,
+                cache_by,
+                engine,
+                workers,
+                row_numbers,
+                budget,
+                stages[i],
             )
-        )
-        report["tables"][i]["errors"] += errors
-        report["tables"][i]["stats"]["rows"] = len(dfs[name])
-        # Remove row limit used for initial report
-        report["tables"][i]["query"] = {}
-        report["tables"][i]["time"] += time.time() - table_start
-    # Check foreign keys
-    for i, resource in enumerate(resources):
-        table_start = time.time()
-        name = resource["name"]
-        if name not in dfs:
-            # Skip check if table was invalid
-            continue
-        errors = check_foreign_keys(
-            dfs[name],
-            resource.get("schema", {}).get("foreignKeys", []),
-            references=dfs,
-            constraint=None,
-        )
-        report["tables"][i]["errors"] += errors
-        report["tables"][i]["time"] += time.time() - table_start
-        report["tables"][i]["scope"] += ["foreign-key-error"]
-    # Update report
+            pending[future] = "table", i
+        while pending:
+            finished, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in finished:
+                stage, i = pending.pop(future)
+                if stage == "index":
+                    if key_uses[i]:
+                        key_indexes[i] = future.result()
+                    continue
+                table = report["tables"][i]
+                if stage == "table":
+                    result = future.result()
+                    table["errors"] += result["errors"]
+                    table["scope"] += result["scope"]
+                    table["time"] += result["time"]
+                    if result["rows"] is not None:
+                        table["stats"]["rows"] = result["rows"]
+                        # Remove row limit used for initial report
+                        table["query"] = {}
+                    if result["table"] is not None:
+                        dfs[names[i]] = result["table"]
+                    elif result["index"] is not None:
+                        indexes[names[i]] = result["index"]
+                    else:
+                        waiting.discard(i)
+                        release(i)
+                    checked.add(i)
+                else:
+                    errors, seconds = future.result()
+                    table["errors"] += errors
+                    table["time"] += seconds
+                    table["scope"] += ["foreign-key-error"]
+                    release(i)
+            # Index foreign table keys used more than once
+            for key, uses in key_uses.items():
+                if uses > 1 and key not in indexing and key[0] in dfs:
+                    indexing.add(key)
+                    future = executor.submit(_index_key, dfs[key[0]][list(key[1])])
+                    pending[future] = "index", key
+            # Check foreign keys once foreign tables are checked and indexed
+            for i in sorted(waiting):
+                keys = [_reference_key(foreignKey) for foreignKey in foreign_keys[i]]
+                shared = [key for key in keys if key[0] and key_uses[key] > 1]
+                if (
+                    i in checked
+                    and parents[i] <= checked
+                    and all(key in key_indexes or key[0] not in dfs for key in shared)
+                ):
+                    waiting.discard(i)
+                    if budget.remaining() == 0:
+                        release(i)
+                        continue
+                    future = executor.submit(
+                        _check_table_foreign_keys,
+                        resources[i],
+                        dfs,
+                        indexes,
+                        key_indexes if shared else None,
+                        _as_list(report["tables"][i].get("path", "")),
+                        budget,
+                        stages[i],
+                    )
+                    pending[future] = "foreign", i
+    if profile:
+        for i in candidates:
+            report["tables"][i]["stats"]["stages"] = stages[i]
+    return dfs, indexes
+
+
+def _error_budget(
+    report: frictionless.Report, error_limit: int = None, fail_fast: bool = False
+) -> _ErrorBudget:
+    """
+    Start an error budget, spent by the errors of the initial (header) checks.
+
+    Arguments:
+        report: Report of the initial checks.
+        error_limit: Maximum number of errors (see :func:`validate`).
+        fail_fast: Whether to stop checking each field at its first invalid values.
+
+    Raises:
+        ValueError: Error limit is less than 1.
+
+    Returns:
+        The error budget.
+    """
+    if error_limit is not None and error_limit < 1:
+        raise ValueError(f"Error limit must be at least 1: {error_limit}")
+    budget = _ErrorBudget(limit=error_limit, fail_fast=fail_fast)
+    budget.spend(
+        len(report["errors"]) + sum(len(table["errors"]) for table in report["tables"])
+    )
+    return budget
+
+
+@contextlib.contextmanager
+def _tracing_memory(trace: bool = True) -> Iterator[None]:
+    """
+    Trace memory allocations with :mod:`tracemalloc`, unless already tracing.
+
+    Arguments:
+        trace: Whether to trace memory allocations.
+    """
+    start = trace and not tracemalloc.is_tracing()
+    if start:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if start:
+            tracemalloc.stop()
+
+
+def _update_report(
+    report: frictionless.Report, start: float, error_limit: int = None
+) -> None:
+    """
+    Update the error counts, validity, and time taken of a report.
+
+    Arguments:
+        report: Report, updated in place.
+        start: Time validation started.
+        error_limit: If set, only the first this many errors are kept: package
+            errors first, then table errors in table order.
+    """
+    if error_limit is not None:
+        remaining = max(error_limit - len(report["errors"]), 0)
+        report["errors"] = report["errors"][:error_limit]
+        for table in report["tables"]:
+            table["errors"] = table["errors"][:remaining]
+            remaining -= len(table["errors"])
     table_errors = 0
-    for i, table in enumerate(report["tables"]):
+    for table in report["tables"]:
         nerrors = len(table["errors"])
         table["stats"]["errors"] = nerrors
         table["valid"] = nerrors == 0
@@ -188,7 +1228,265 @@ def validate(  # noqa: C901
     report["stats"]["errors"] = total_errors
     report["valid"] = not total_errors
     report["time"] = time.time() - start
+
+
+def validate(  # noqa: C901
+    source: Union[str, dict],
+    source_type: Literal["package"] = "package",
+    return_tables: bool = False,
+    chunksize: int = None,
+    workers: int = None,
+    cache: str = None,
+    cache_by: Literal["content", "stat"] = "content",
+    engine: Literal["c", "pyarrow"] = "c",
+    row_numbers: bool = False,
+    error_limit: int = None,
+    fail_fast: bool = False,
+    profile: bool = False,
+    **options: Any,
+) -> Union[frictionless.Report, Tuple[frictionless.Report, Dict[str, pd.DataFrame]]]:
+    """
+    Validate a Tabular Data Package.
+
+    This is a wrapper of :func:`frictionless.validate`:
+    https://frictionlessdata.io/tooling/python/api-reference/#frictionless-validate
+
+    Arguments:
+        source: Path to, or content of, a Tabular Data Package descriptor,
+            or path to a zip archive containing one (`datapackage.json`).
+            Files are then read directly from the archive.
+        source_type: Souce type (currently limited to "package").
+        return_tables: Whether to return the tables read and parsed during validation.
+        chunksize: If set, tables are read, parsed, and checked in chunks of at most
+            this many rows, keeping only key hashes, distinct foreign key values,
+            and errors between chunks. This bounds memory use, but is incompatible
+            with `return_tables=True`. Rows whose unique key hashes repeat are read
+            again to compare their values, so duplicates are found exactly.
+            Foreign keys are matched to the keys of a table read in chunks by their
+            64-bit hashes, so a hash collision (most unlikely, with a probability
+            of about n^2 / 2^65 for n distinct key values) would hide a missing
+            reference.
+        workers: If set, tables are read, parsed, and checked concurrently in up to
+            this many threads. The foreign keys of a table are checked as soon as
+            the tables they reference are ready. Tables with more than one file
+            (`path`) also read their files concurrently in up to this many threads.
+            The report is the same as with `workers=None`, except for the time taken.
+        cache: If set, the results of reading, parsing, and checking each table
+            (errors, number of rows, and an index of key values or, if read in
+            chunks, of key hashes) are saved to this directory. Tables whose files,
+            descriptor, and schema are unchanged since are then not read again, and
+            their foreign keys are checked against the key indexes.
+            This is incompatible with `return_tables=True`.
+            Cached results are pickled, so only use a directory you trust.
+        cache_by: Whether to identify unchanged files by their content ("content")
+            or, faster but less safe, by their size and modification time ("stat").
+        engine: Parser engine used to read tables (see :func:`read.read_table`).
+            With "pyarrow", tables are read with multiple threads and held as
+            Arrow-backed strings until parsed.
+        row_numbers: Whether to list the rows of type, constraint, and key errors
+            (`rowNumbers`), as ranges `[path, first, last]` of row numbers in each
+            file (starting at 1 for the first row after the header), limited to
+            :data:`options.max_values` rows. Returned tables are then indexed by
+            file number and row number (see :func:`read.read_table`). Rows are not
+            listed for foreign key errors found in chunks or with a cache.
+        error_limit: If set (at least 1), validation stops once this many errors
+            have been found: no more fields are parsed or checked, no more tables
+            (or chunks) are read, and no more foreign keys are checked. The report
+            lists at most this many errors. With `workers`, which errors are found
+            first may vary. Incompatible with `cache`.
+        fail_fast: Whether to stop checking each field at its first invalid values.
+            Values are then parsed in blocks of increasing size, and errors list
+            only the invalid values found before stopping (see
+            :func:`parse.parse_field`). Incompatible with `cache`.
+        profile: Whether to add the wall time and memory taken by each stage of
+            checking a table to its stats (`stages`): `read`, and by field or key,
+            `parse`, `constraints`, `uniqueKeys`, and `foreignKeys`. Memory is
+            traced with :mod:`tracemalloc` (started if not already), which slows
+            validation down. See :func:`profiling.stage` for what is measured.
+            Memory is best measured with `workers=None`.
+        **options: Optional arguments to :func:`frictionless.validate_package` and
+            :func:`frictionless.validate_table`.
+
+    Raises:
+        NotImplementedError: Source type not supported.
+        ValueError: Cannot return tables when reading in chunks or with a cache,
+            or limit errors with a cache.
+
+    Returns:
+        An error report and (if `return_tables=True`) the tables.
+    """
+    if source_type != "package":
+        raise NotImplementedError(f"source_type {source_type} not supported")
+    if chunksize and return_tables:
+        raise ValueError("Cannot return tables when reading in chunks (chunksize)")
+    if cache and return_tables:
+        raise ValueError("Cannot return tables when using a cache (cache)")
+    if cache and (error_limit is not None or fail_fast):
+        raise ValueError("Cannot limit errors when using a cache (cache)")
+    # Start clock
+    start = time.time()
+    # Initialize report
+    options = {
+        # Non-header rows are checked with pandas (limit_rows=0 not permitted)
+        "query": frictionless.Query(limit_rows=1),
+        "skip_errors": ["#body"],
+        # Foreign key checks are performed with pandas
+        "nolookup": True,
+        # Use existing schema rather than inferring one from a data sample
+        "noinfer": True,
+        # Multiprocessing not worth overhead for metadata and header checks
+        "nopool": True,
+        **options,
+    }
+    if (
+        isinstance(source, str)
+        and source.lower().endswith(".zip")
+        and zipfile.is_zipfile(source)
+    ):
+        archive = _read_archive_descriptor(source)
+        if archive:
+            source, options["basepath"] = archive
+    package = frictionless.Package(source, basepath=options.get("basepath"))
+    descriptor = package.to_dict()
+    if _declare_compression(descriptor.get("resources", [])):
+        source = descriptor
+        options["basepath"] = package.basepath
+    with _local_plugin():
+        report = frictionless.validate(
+            source=source, source_type=source_type, **options
+        )
+    # Load resource descriptors (report descriptors missing resource name)
+    resources = frictionless.Package(source, basepath=options.get("basepath")).get(
+        "resources", []
+    )
+    # Columnar formats are not read by frictionless, so their fields are checked on read
+    for resource, table in zip(resources, report["tables"]):
+        if _columnar_format(resource, _as_list(table.get("path", ""))):
+            table["errors"] = [
+                e for e in table["errors"] if e["code"] != "format-error"
+            ]
+            table["valid"] = not table["errors"]
+    _normalize_resources(resources)
+    budget = _error_budget(report, error_limit, fail_fast)
+    with _tracing_memory(profile):
+        dfs, indexes = _check_tables(
+            resources,
+            report,
+            chunksize,
+            workers,
+            cache,
+            cache_by,
+            engine,
+            row_numbers,
+            budget=budget,
+            profile=profile,
+        )
+    _update_report(report, start, error_limit)
     # Return report
     if return_tables:
         return report, dfs
     return report
+
+
+# Resource properties describing files, dropped when checking tables in memory
+_FILE_PROPERTIES = (
+    "path",
+    "scheme",
+    "format",
+    "hashing",
+    "encoding",
+    "mediatype",
+    "compression",
+    "compressionPath",
+    "control",
+    "dialect",
+    "query",
+    "stats",
+    "bytes",
+    "hash",
+)
+
+
+def validate_frames(
+    source: Union[str, dict],
+    frames: Dict[str, pd.DataFrame],
+    return_tables: bool = False,
+    workers: int = None,
+    error_limit: int = None,
+    fail_fast: bool = False,
+    profile: bool = False,
+    **options: Any,
+) -> Union[frictionless.Report, Tuple[frictionless.Report, Dict[str, pd.DataFrame]]]:
+    """
+    Validate tables already in memory against a Tabular Data Package.
+
+    Tables are checked as by :func:`validate`, but without reading any files.
+    The header checks of :func:`frictionless.validate` are run on the column names
+    of each table, and columns with a data type other than strings are checked by
+    data type rather than parsed (see :func:`parse._check_typed`). Columns of Python
+    objects (or categorical columns of Python objects) are first converted to a more
+    specific data type, where possible. The tables are not modified.
+
+    Arguments:
+        source: Path to, or content of, a Tabular Data Package descriptor.
+            Resource file properties (e.g. `path`, `dialect`) are ignored.
+        frames: Tables by resource name, one for each resource of the package.
+        return_tables: Whether to return the tables parsed during validation.
+        workers: If set, tables are parsed and checked concurrently in up to
+            this many threads (see :func:`validate`).
+        error_limit: Maximum number of errors (see :func:`validate`).
+        fail_fast: Whether to stop checking each field at its first invalid values
+            (see :func:`validate`).
+        profile: Whether to add the time and memory taken by each stage to the
+            table stats (see :func:`validate`).
+        **options: Optional arguments to :func:`frictionless.validate_package`.
+
+    Raises:
+        ValueError: Tables missing for, or not in, the package resources.
+
+    Returns:
+        An error report and (if `return_tables=True`) the tables.
+    """
+    start = time.time()
+    options = {
+        # Same as validate, but the header is the only row
+        "query": frictionless.Query(limit_rows=1),
+        "skip_errors": ["#body"],
+        "nolookup": True,
+        "noinfer": True,
+        "nopool": True,
+        **options,
+    }
+    descriptor = frictionless.Package(
+        source, basepath=options.get("basepath")
+    ).to_dict()
+    resources = descriptor.get("resources", [])
+    names = [resource["name"] for resource in resources]
+    missing = [name for name in names if name not in frames]
+    if missing:
+        raise ValueError(f"Tables missing for resources: {missing}")
+    extra = [name for name in frames if name not in names]
+    if extra:
+        raise ValueError(f"Tables not in package: {extra}")
+    for resource in resources:
+        for key in _FILE_PROPERTIES:
+            resource.pop(key, None)
+        # Inline data with only a header, checked by frictionless
+        resource["data"] = [[str(name) for name in frames[resource["name"]].columns]]
+    report = frictionless.validate(source=descriptor, source_type="package", **options)
+    resources = frictionless.Package(descriptor).get("resources", [])
+    _normalize_resources(resources)
+    budget = _error_budget(report, error_limit, fail_fast)
+    with _tracing_memory(profile):
+        dfs, _ = _check_tables(
+            resources,
+            report,
+            workers=workers,
+            frames=frames,
+            budget=budget,
+            profile=profile,
+        )
+    _update_report(report, start, error_limit)
+    if return_tables:
+        return report, dfs
+    return report
@@ -1,6 +1,7 @@
 """Tests for the parse module."""
 import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -14,6 +15,7 @@ from goodtables_pandas.parse import (
     parse_integer,
     parse_number,
     parse_string,
+    parse_table,
     parse_year,
 )
 
@@ -154,9 +156,12 @@ def test_rejects_invalid_binary() -> None:
             "YW55IGNh=",  # incorrect padding
             "YW55IGNhcm5h==",  # incorrect padding
             "YW55IGNhcm.?",  # invalid characters
+            "YW55IG=h",  # padding before end
+            "YW5=YW55",  # padding in middle
+            "YW55Ié==",  # non-ascii characters
         ]
     )
-    error = parse_string(x, format="email")
+    error = parse_string(x, format="binary")
     pd.testing.assert_series_equal(x, pd.Series(error["values"]))
 
 
@@ -189,10 +194,9 @@ def test_rejects_invalid_uuid() -> None:
     pd.testing.assert_series_equal(x, pd.Series(error["values"]))
 
 
-@pytest.mark.parametrize("raise_first", [True, False])
-def test_parses_valid_number(raise_first: bool) -> None:
+@pytest.mark.parametrize("fail_fast", [True, False])
+def test_parses_valid_number(fail_fast: bool) -> None:
     """It parses valid numbers."""
-    OPTIONS.raise_first_invalid_number = raise_first
     df = pd.DataFrame(
         [
             ("nan", float("nan")),
@@ -233,7 +237,8 @@ def test_parses_valid_number(raise_first: bool) -> None:
             ("1e23", 1e23),
         ]
     )
-    pd.testing.assert_series_equal(parse_number(df[0]), df[1], check_names=False)
+    parsed = parse_field(df[0], type="number", fail_fast=fail_fast)
+    pd.testing.assert_series_equal(parsed, df[1], check_names=False)
 
 
 def test_rejects_invalid_number() -> None:
@@ -243,6 +248,21 @@ def test_rejects_invalid_number() -> None:
     pd.testing.assert_series_equal(x, pd.Series(error["values"]))
 
 
+@pytest.mark.parametrize("bareNumber", [True, False])
+def test_rejects_all_invalid_numbers_among_many(bareNumber: bool) -> None:
+    """It rejects every invalid number, however sparse, in a long series."""
+    x = pd.Series([str(i / 10) for i in range(200000)], dtype=object)
+    x[[5, 70000, 70001, 199999]] = ["x", "1.5.2", "1e2e3", "nan inf"]
+    x[[6, 7]] = float("nan")
+    error = parse_number(x, bareNumber=bareNumber)
+    assert error["values"] == ["x", "1.5.2", "1e2e3", "nan inf"]
+    x[[5, 70000, 70001, 199999]] = ["0.5", "7000", "-inf", "nan"]
+    parsed = parse_number(x, bareNumber=bareNumber)
+    assert parsed.dtype == "float64"
+    assert parsed.isna().sum() == 3
+    assert parsed[[5, 70000, 70001]].tolist() == [0.5, 7000, float("-inf")]
+
+
 def test_parses_valid_number_with_custom_characters() -> None:
     """It parses valid numbers with custom group and decimal separators."""
     df = pd.DataFrame(
@@ -277,6 +297,9 @@ def test_parses_valid_number_with_custom_characters() -> None:
     )
     parsed = parse_number(df[0], decimalChar="..", groupChar=",,")
     pd.testing.assert_series_equal(parsed, df[1], check_names=False)
+    x = pd.Series(["1 234,5", float("nan"), "1,2,3"])
+    error = parse_number(x, decimalChar=",", groupChar=" ")
+    assert error["values"] == ["1,2,3"]
 
 
 def test_parses_valid_number_with_text() -> None:
@@ -322,12 +345,11 @@ def test_rejects_ambiguous_number_with_text() -> None:
     pd.testing.assert_series_equal(x, pd.Series(error["values"]))
 
 
-@pytest.mark.parametrize("raise_first", [True, False])
-def test_parses_valid_integer(raise_first: bool) -> None:
+@pytest.mark.parametrize("fail_fast", [True, False])
+def test_parses_valid_integer(fail_fast: bool) -> None:
     """It parses valid integers."""
-    OPTIONS.raise_first_invalid_integer = raise_first
     df = pd.DataFrame([("1", 1), ("+1", 1), ("-1", -1), ("001", 1), ("1234", 1234)])
-    parsed = parse_integer(df[0])
+    parsed = parse_field(df[0], type="integer", fail_fast=fail_fast)
     pd.testing.assert_series_equal(parsed, df[1].astype("Int64"), check_names=False)
 
 
@@ -349,6 +371,74 @@ def test_rejects_invalid_integer() -> None:
     pd.testing.assert_series_equal(x, pd.Series(error["values"]))
 
 
+@pytest.mark.parametrize("bareNumber", [True, False])
+def test_rejects_all_invalid_integers_among_many(bareNumber: bool) -> None:
+    """It rejects every invalid integer, however sparse, in a long series."""
+    x = pd.Series([str(i) for i in range(200000)], dtype=object)
+    x[[5, 70000, 70001, 199999]] = ["x", "1.5", "1e2", "y"]
+    x[[6, 7]] = float("nan")
+    error = parse_integer(x, bareNumber=bareNumber)
+    assert error["values"] == ["x", "1.5", "1e2", "y"]
+    x[[5, 70000, 70001, 199999]] = ["5", "70000", "+70001", "-1"]
+    parsed = parse_integer(x, bareNumber=bareNumber)
+    assert parsed.dtype == "Int64"
+    assert parsed.isna().sum() == 2
+    assert parsed[[5, 70001, 199999]].tolist() == [5, 70001, -1]
+
+
+def test_rejects_integer_out_of_range() -> None:
+    """It rejects integers that do not fit in 64 bits."""
+    x = pd.Series(["1", "9223372036854775807", "9223372036854775808"])
+    error = parse_integer(x)
+    assert error["values"] == ["9223372036854775808"]
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        pd.Series([1.0, 1e20, -1e20, None]),
+        pd.Series([1, 2**63, 2**64 - 1], dtype="uint64"),
+    ],
+)
+def test_rejects_typed_integer_out_of_range(x: pd.Series) -> None:
+    """It rejects typed integers that do not fit in 64 bits."""
+    error = parse_field(x, type="integer")
+    assert error["code"] == "type-error"
+    assert error["values"] == x[1:].dropna().tolist()
+    assert parse_field(x[:1], type="integer").tolist() == [1]
+
+
+@pytest.mark.parametrize(
+    "values, field, expected",
+    [
+        (["1", None, "1"], {"type": "integer"}, [1, pd.NA, 1]),
+        ([1, None, 2**62 + 1], {"type": "integer"}, [1, pd.NA, 2**62 + 1]),
+        ([1.5, None], {"type": "number"}, [1.5, np.nan]),
+        (["a", None], {"type": "string"}, ["a", np.nan]),
+        (
+            pd.to_datetime(["2020-01-01", None]),
+            {"type": "date"},
+            [pd.Timestamp("2020-01-01"), pd.NaT],
+        ),
+    ],
+)
+def test_parses_categorical_values(values: list, field: dict, expected: list) -> None:
+    """It checks categorical values as the values of their categories."""
+    x = pd.Series(values, dtype="category")
+    parsed = parse_field(x, **field)
+    assert isinstance(parsed, pd.Series)
+    pd.testing.assert_series_equal(
+        parsed.astype(object), pd.Series(expected, dtype=object), check_names=False
+    )
+
+
+def test_rejects_invalid_categorical_values() -> None:
+    """It reports invalid categorical values as the values of their categories."""
+    error = parse_field(pd.Series(["1", "x", "x"], dtype="category"), type="integer")
+    assert error["values"] == ["x"]
+    assert error["rowCount"] == 2
+
+
 def test_parses_valid_integer_with_text() -> None:
     """It parses valid integers with leading and trailing text."""
     df = pd.DataFrame(
@@ -561,7 +651,8 @@ def test_parses_valid_geopoint() -> None:
         ]
     )
     parsed = parse_geopoint(df[0])
-    pd.testing.assert_series_equal(parsed, df[1], check_names=False)
+    expected = df[1].astype("geopoint")
+    pd.testing.assert_series_equal(parsed, expected, check_names=False)
 
 
 def test_rejects_invalid_geopoint() -> None:
@@ -595,7 +686,8 @@ def test_parses_valid_geopoint_array() -> None:
         ]
     )
     parsed = parse_geopoint(df[0], format="array")
-    pd.testing.assert_series_equal(parsed, df[1], check_names=False)
+    expected = df[1].astype("geopoint")
+    pd.testing.assert_series_equal(parsed, expected, check_names=False)
 
 
 def test_rejects_invalid_geopoint_array() -> None:
@@ -637,7 +729,8 @@ def test_parses_valid_geopoint_object() -> None:
         ]
     )
     parsed = parse_geopoint(df[0], format="object")
-    pd.testing.assert_series_equal(parsed, df[1], check_names=False)
+    expected = df[1].astype("geopoint")
+    pd.testing.assert_series_equal(parsed, expected, check_names=False)
 
 
 def test_rejects_invalid_geopoint_object() -> None:
@@ -659,6 +752,25 @@ def test_rejects_invalid_geopoint_object() -> None:
     pd.testing.assert_series_equal(x, pd.Series(error["values"]))
 
 
+def test_parses_geopoints_with_line_breaks() -> None:
+    """It parses geopoints containing line breaks like any other geopoint."""
+    x = pd.Series(["[0,\n1]", "[2, 3]", None, "[4,\n\n5]"])
+    expected = pd.Series([(0.0, 1.0), (2.0, 3.0), None, (4.0, 5.0)], dtype="geopoint")
+    pd.testing.assert_series_equal(parse_geopoint(x, format="array"), expected)
+    error = parse_geopoint(x, format="default")
+    assert error["values"] == ["[0,\n1]", "[2, 3]", "[4,\n\n5]"]
+
+
+def test_compares_parsed_geopoints() -> None:
+    """It compares parsed geopoints by value, distinct from null."""
+    x = parse_geopoint(pd.Series(["0, 1", None, "-0, 1", "nan, 1", "nan, 1", None]))
+    assert x.duplicated().tolist() == [False, False, True, False, True, True]
+    assert x.isin([(0.0, 1.0)]).tolist() == [True, False, True, False, False, False]
+    hashes = pd.util.hash_pandas_object(x, index=False)
+    assert hashes.duplicated().tolist() == x.duplicated().tolist()
+    assert x.nunique(dropna=False) == 3
+
+
 @pytest.mark.parametrize(
     "x, field, dtype",
     [
@@ -693,9 +805,9 @@ def test_rejects_invalid_geopoint_object() -> None:
             "datetime64[ns]",
         ),
         ("2020", {"type": "year"}, "Int64"),
-        ("0, 1", {"type": "geopoint"}, "O"),
-        ("[0, 1]", {"type": "geopoint", "format": "array"}, "O"),
-        ('{"lon": 0, "lat": 1}', {"type": "geopoint", "format": "object"}, "O"),
+        ("0, 1", {"type": "geopoint"}, "geopoint"),
+        ("[0, 1]", {"type": "geopoint", "format": "array"}, "geopoint"),
+        ('{"lon": 0, "lat": 1}', {"type": "geopoint", "format": "object"}, "geopoint"),
     ],
 )
 def test_propagates_null_and_maintains_dtype(x: str, field: str, dtype: str) -> None:
@@ -711,3 +823,87 @@ def test_propagates_null_and_maintains_dtype(x: str, field: str, dtype: str) ->
     assert isinstance(parsed, pd.Series)
     assert parsed[1:].isna().all()
     assert parsed.dtype == dtype
+
+
+@pytest.mark.parametrize(
+    "values, field",
+    [
+        (["a@z.com", "b@z.com"], {"type": "string", "format": "email"}),
+        (["a@z.com", "b@z"], {"type": "string", "format": "email"}),
+        (["1.5", "-inf"], {"type": "number"}),
+        (["1", "x", "2"], {"type": "integer"}),
+        (["true", "0"], {"type": "boolean"}),
+        (["2020-12-31", "2020-12-32"], {"type": "date"}),
+        (["2020-12-31T00:00:00Z"], {"type": "datetime"}),
+        (["0, 1", "2, 3"], {"type": "geopoint"}),
+    ],
+)
+def test_parses_unique_values_only(values: list, field: dict) -> None:
+    """It parses unique values and broadcasts the result to all values."""
+    x = pd.Series((values + [float("nan")]) * 5000, dtype=object).iloc[::-1]
+    expected = parse_field(x, factorize=False, **field)
+    for factorize in (True, None):
+        parsed = parse_field(x, factorize=factorize, **field)
+        if isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(parsed, expected)
+        else:
+            assert parsed["values"] == expected["values"]
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_parses_table_with_workers(workers: int) -> None:
+    """It parses fields concurrently and returns errors in field order."""
+    df = pd.DataFrame(
+        {"x": ["1", "2"], "y": ["a", "b"], "z": ["true", "false"], "w": ["1.5", "x"]},
+        dtype=object,
+    )
+    schema = {
+        "fields": [
+            {"name": "x", "type": "integer"},
+            {"name": "y", "type": "integer"},
+            {"name": "z", "type": "boolean"},
+            {"name": "w", "type": "number"},
+        ]
+    }
+    errors = parse_table(df.copy(), schema=schema, workers=workers)
+    assert [error["fieldName"] for error in errors] == ["y", "w"]
+    schema["fields"] = [schema["fields"][0], schema["fields"][2]]
+    parsed = parse_table(df.copy(), schema=schema, workers=workers)
+    assert parsed["x"].tolist() == [1, 2]
+    assert parsed["z"].tolist() == [True, False]
+
+
+@pytest.mark.parametrize("type", ["integer", "date", "geopoint", "string"])
+def test_stops_parsing_at_first_invalid_values(type: str) -> None:
+    """It stops parsing at the first block of invalid values with fail_fast."""
+    valid = {
+        "integer": "1",
+        "date": "2020-01-01",
+        "geopoint": "1, 2",
+        "string": "x@y.z",
+    }
+    field = {"format": "email"} if type == "string" else {}
+    x = pd.Series([valid[type]] * 5000, dtype=object)
+    x[[10, 4000]] = ["a", "b"]
+    error = parse_field(x, type=type, **field)
+    assert error["values"] == ["a", "b"]
+    error = parse_field(x, type=type, fail_fast=True, **field)
+    assert error["values"] == ["a"]
+    assert error["rowCount"] == 1
+    x[[10, 4000]] = valid[type]
+    parsed = parse_field(x, type=type, fail_fast=True, **field)
+    pd.testing.assert_series_equal(parsed, parse_field(x, type=type, **field))
+
+
+@pytest.mark.parametrize("type", ["integer", "number"])
+def test_stops_parsing_with_deprecated_options(
+    type: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It stops parsing at the first invalid values with deprecated options."""
+    x = pd.Series(["1"] * 5000, dtype=object)
+    x[[10, 4000]] = ["a", "b"]
+    monkeypatch.setattr(OPTIONS, f"raise_first_invalid_{type}", True)
+    with pytest.warns(DeprecationWarning):
+        error = parse_field(x, type=type)
+    assert error["values"] == ["a"]
+    assert parse_field(x, type="string").equals(x)
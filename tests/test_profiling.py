@@ -0,0 +1,78 @@
+"""Tests for the profiling module."""
+import json
+from pathlib import Path
+import tracemalloc
+from typing import List
+
+import pytest
+
+from goodtables_pandas import profiling, validate
+from .test_validate import package  # noqa: F401
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_calls_hooks_around_stages(package: str, chunksize: int) -> None:  # noqa: F811
+    """It calls hooks at the start and end of each stage of validation."""
+    events: List[dict] = []
+    profiling.add_hook(events.append)
+    try:
+        validate(package, chunksize=chunksize)
+    finally:
+        profiling.remove_hook(events.append)
+    starts = [e for e in events if e["event"] == "stage_start"]
+    ends = [e for e in events if e["event"] == "stage_end"]
+    assert len(starts) == len(ends)
+    stages = {(e["resource"], e["stage"], e["field"]) for e in ends}
+    assert ("parent", "read", None) in stages
+    assert ("parent", "parse", "x") in stages
+    assert ("parent", "constraints", "x") in stages
+    assert ("parent", "uniqueKeys", "id,code") in stages
+    assert ("child", "foreignKeys", "id,code") in stages
+    read = [
+        e
+        for e in ends
+        if e["stage"] == "read" and e["resource"] == "parent" and e["rows"]
+    ]
+    # In chunks, rows with repeated key hashes are read again to compare values
+    assert sum(e["rows"] for e in read) == (10 if chunksize else 5)
+    assert all(e["bytes"] > 0 for e in read)
+    # Hooks are no longer called once removed
+    validate(package)
+    assert len(events) == len(starts) + len(ends)
+
+
+def test_measures_peak_memory() -> None:
+    """It measures the peak memory allocated during a stage, even once freed."""
+    stats: dict = {}
+    tracemalloc.start()
+    try:
+        with profiling.stage("parse", "x", stats=stats):
+            x = bytearray(10**7)
+            del x
+    finally:
+        tracemalloc.stop()
+    measures = stats["parse"]["x"]
+    assert measures["peak"] >= 10**7
+    assert measures["allocated"] < 10**6
+    assert measures["time"] >= 0
+
+
+def test_writes_chrome_trace(package: str, tmp_path: Path) -> None:  # noqa: F811
+    """It writes stage events as Chrome trace events."""
+    path = tmp_path / "trace.json"
+    with profiling.ChromeTrace(str(path)):
+        validate(package, workers=2)
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {e["ph"] for e in events} == {"B", "E"}
+    assert "parse parent.x" in {e["name"] for e in events}
+    # Begin and end events are nested within each thread
+    for thread in {e["tid"] for e in events}:
+        open = []
+        for e in sorted(
+            (e for e in events if e["tid"] == thread), key=lambda e: e["ts"]
+        ):
+            if e["ph"] == "B":
+                open.append(e["name"])
+            else:
+                assert open.pop() == e["name"]
+        assert not open
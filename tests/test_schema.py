@@ -0,0 +1,67 @@
+"""Tests for the schema module."""
+import pandas as pd
+import pytest
+
+from goodtables_pandas.check import check_constraints
+import goodtables_pandas.options as OPTIONS
+from goodtables_pandas.parse import parse_table
+from goodtables_pandas.schema import compile_schema
+
+SCHEMA = {
+    "fields": [
+        {"name": "x", "type": "integer", "constraints": {"minimum": "0"}},
+        {
+            "name": "y",
+            "type": "date",
+            "constraints": {"maximum": "2020-01-31", "enum": ["2020-01-01", "x"]},
+        },
+        {"name": "z", "type": "string", "constraints": {"pattern": "[a-z]+"}},
+    ],
+    "primaryKey": "x",
+}
+
+
+def test_caches_compiled_schema_by_content() -> None:
+    """It returns the same compiled schema for schemas with the same content."""
+    compiled = compile_schema(SCHEMA)
+    same = compile_schema({**SCHEMA, "fields": list(reversed(SCHEMA["fields"]))[::-1]})
+    assert same is compiled
+    assert hash(same) == hash(compiled)
+    assert compile_schema(compiled) is compiled
+    other = compile_schema({**SCHEMA, "primaryKey": "y"})
+    assert other is not compiled and other != compiled
+    assert compiled.schema["primaryKey"] == ["x"]
+    assert SCHEMA["primaryKey"] == "x"
+
+
+def test_limits_compiled_schema_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It drops the least recently used compiled schemas once the cache is full."""
+    monkeypatch.setattr(OPTIONS, "schema_cache_size", 2)
+    schemas = [{**SCHEMA, "primaryKey": name} for name in ("x", "y", "z")]
+    compiled = [compile_schema(schema) for schema in schemas[:2]]
+    assert compile_schema(schemas[0]) is compiled[0]
+    compile_schema(schemas[2])
+    assert compile_schema(schemas[0]) is compiled[0]
+    assert compile_schema(schemas[1]) is not compiled[1]
+
+
+def test_parses_and_checks_with_compiled_schema() -> None:
+    """It parses and checks a table the same with a schema or its compiled form."""
+    df = pd.DataFrame(
+        {"x": ["1", "-1"], "y": ["2020-01-01", "2020-02-01"], "z": ["a", "A"]},
+        dtype=object,
+    )
+    results = []
+    for schema in (SCHEMA, compile_schema(SCHEMA)):
+        parsed = parse_table(df.copy(), schema=schema)
+        errors = check_constraints(parsed, schema=schema)
+        results.append((parsed, [dict(e) for e in errors]))
+    pd.testing.assert_frame_equal(results[0][0], results[1][0])
+    assert results[0][1] == results[1][1]
+    names = [(e["fieldName"], e["constraintName"]) for e in results[1][1]]
+    assert names == [
+        ("x", "minimum"),
+        ("y", "maximum"),
+        ("y", "enum"),
+        ("z", "pattern"),
+    ]
@@ -0,0 +1,981 @@
+"""Tests for the validate module."""
+import bz2
+import datetime
+import gzip
+import json
+import lzma
+import os
+from pathlib import Path
+import sys
+from typing import Any, Dict, List
+import zipfile
+
+import frictionless
+import numpy as np
+import pandas as pd
+import pytest
+
+from goodtables_pandas import validate, validate_frames
+from goodtables_pandas.cache import hash_table
+import goodtables_pandas.options as OPTIONS
+
+
+def write_package(path: Path, resources: List[dict], tables: Dict[str, str]) -> str:
+    """Write a data package (descriptor and csv files) to a directory."""
+    for resource in resources:
+        resource.setdefault("path", resource["name"] + ".csv")
+        resource.setdefault("profile", "tabular-data-resource")
+    for name, text in tables.items():
+        (path / (name + ".csv")).write_text(text)
+    descriptor = path / "datapackage.json"
+    descriptor.write_text(json.dumps({"resources": resources}))
+    return str(descriptor)
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> str:
+    """Data package with type, constraint, and key errors."""
+    resources = [
+        {
+            "name": "parent",
+            "schema": {
+                "fields": [
+                    {"name": "id", "type": "integer"},
+                    {"name": "code", "type": "string"},
+                    {"name": "x", "type": "number", "constraints": {"maximum": 4}},
+                ],
+                "primaryKey": "id",
+                "uniqueKeys": [["id", "code"]],
+            },
+        },
+        {
+            "name": "child",
+            "schema": {
+                "fields": [
+                    {"name": "id", "type": "integer"},
+                    {"name": "code", "type": "string"},
+                ],
+                "foreignKeys": [
+                    {
+                        "fields": ["id", "code"],
+                        "reference": {"resource": "parent", "fields": ["id", "code"]},
+                    },
+                    {
+                        "fields": "id",
+                        "reference": {"resource": "parent", "fields": "id"},
+                    },
+                ],
+            },
+        },
+        {
+            "name": "typed",
+            "schema": {"fields": [{"name": "x", "type": "integer"}]},
+        },
+    ]
+    tables = {
+        "parent": "id,code,x\n1,a,1\n2,a,2\n2,b,5\n3,c,6\n1,a,1\n",
+        "child": "id,code\n1,a\n2,b\n,z\n4,a\n3,a\n4,a\n",
+        "typed": "x\n1\ny\n2\nz\ny\n",
+    }
+    return write_package(tmp_path, resources, tables)
+
+
+def summarize(report: dict) -> List[list]:
+    """Summarize table errors by code, field or key, and sorted values."""
+    return [
+        sorted(
+            (
+                e["code"],
+                e.get("fieldName") or str(e.get("uniqueKey") or e.get("foreignKey")),
+                sorted(str(v) for v in e["values"]),
+            )
+            for e in table["errors"]
+        )
+        for table in report["tables"]
+    ]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 4, 1000])
+def test_validates_in_chunks(package: str, chunksize: int) -> None:
+    """It reports the same errors when reading tables in chunks."""
+    expected = validate(package)
+    report = validate(package, chunksize=chunksize)
+    assert summarize(report) == summarize(expected)
+    assert report["stats"]["errors"] == expected["stats"]["errors"] == 6
+    for table, expected_table in zip(report["tables"], expected["tables"]):
+        assert table["stats"]["rows"] == expected_table["stats"]["rows"]
+        assert table["scope"] == expected_table["scope"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_compares_repeated_key_hashes_in_chunks(
+    package: str, monkeypatch: pytest.MonkeyPatch, chunksize: int
+) -> None:
+    """It compares rows with repeated key hashes by value when reading in chunks."""
+    expected = validate(package)
+    # All key values hash equal
+    monkeypatch.setattr(
+        sys.modules["goodtables_pandas.check"],
+        "_hash_column",
+        lambda x: np.zeros(len(x), dtype=np.uint64),
+    )
+    report = validate(package, chunksize=chunksize, row_numbers=True)
+    # Foreign keys of tables read in chunks are still matched by hash
+    assert summarize(report)[0] == summarize(expected)[0]
+    table = report["tables"][0]
+    errors = {e.get("fieldName"): e for e in table["errors"]}
+    assert errors["id"]["rowNumbers"] == [[table["path"], 3, 3], [table["path"], 5, 5]]
+
+
+def test_rejects_return_tables_in_chunks(package: str) -> None:
+    """It cannot return tables when reading in chunks."""
+    with pytest.raises(ValueError):
+        validate(package, chunksize=2, return_tables=True)
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 3])
+def test_finds_duplicate_keys_with_nulls(tmp_path: Path, chunksize: int) -> None:
+    """It finds duplicate keys, treating nulls as equal and -0 as 0."""
+    resources = [
+        {
+            "name": "table",
+            "schema": {
+                "fields": [
+                    {"name": "x", "type": "number"},
+                    {"name": "y", "type": "string"},
+                    {"name": "z", "type": "integer"},
+                ],
+                "primaryKey": ["x", "z"],
+                "uniqueKeys": [["x", "y"], ["y", "x", "z"]],
+            },
+        }
+    ]
+    tables = {"table": "x,y,z\n0,a,1\n-0,a,2\n,b,1\n,b,1\n1,,\n1,,\n"}
+    path = write_package(tmp_path, resources, tables)
+    report = validate(path, chunksize=chunksize)
+    assert summarize(report) == [
+        [
+            ("constraint-error", "x", ["nan"]),
+            ("constraint-error", "z", ["nan"]),
+            (
+                "unique-key-error",
+                "['x', 'y']",
+                ["[-0.0, 'a']", "[1.0, nan]", "[nan, 'b']"],
+            ),
+            ("unique-key-error", "['x', 'z']", ["[1.0, <NA>]", "[nan, 1]"]),
+            (
+                "unique-key-error",
+                "['y', 'x', 'z']",
+                ["['b', nan, 1]", "[nan, 1.0, <NA>]"],
+            ),
+        ]
+    ]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_checks_field_constraints(tmp_path: Path, chunksize: int) -> None:
+    """It checks field constraints, listing each invalid value once."""
+    constraints = {
+        "required": True,
+        "unique": True,
+        "minLength": 2,
+        "maxLength": 3,
+        "pattern": "[a-z]+",
+        "enum": ["ab", "abc", "abcd", "x"],
+    }
+    resources = [
+        {
+            "name": "table",
+            "schema": {
+                "fields": [
+                    {"name": "s", "type": "string", "constraints": constraints},
+                    {
+                        "name": "i",
+                        "type": "integer",
+                        "constraints": {"minimum": 0, "maximum": "2"},
+                    },
+                ]
+            },
+        }
+    ]
+    tables = {"table": "s,i\nab,0\nx,-1\nabcd,3\nab,3\n,\nAB,-1\n"}
+    path = write_package(tmp_path, resources, tables)
+    report = validate(path, chunksize=chunksize)
+    errors = report["tables"][0]["errors"]
+    assert sorted((e["fieldName"], e["constraintName"]) for e in errors) == [
+        ("i", "maximum"),
+        ("i", "minimum"),
+        ("s", "enum"),
+        ("s", "maxLength"),
+        ("s", "minLength"),
+        ("s", "pattern"),
+        ("s", "required"),
+        ("s", "unique"),
+    ]
+    assert summarize(report) == [
+        [
+            ("constraint-error", "i", ["-1"]),
+            ("constraint-error", "i", ["3"]),
+            ("constraint-error", "s", ["AB"]),
+            ("constraint-error", "s", ["AB"]),
+            ("constraint-error", "s", ["ab"]),
+            ("constraint-error", "s", ["abcd"]),
+            ("constraint-error", "s", ["nan"]),
+            ("constraint-error", "s", ["x"]),
+        ]
+    ]
+
+
+def test_finds_composite_foreign_keys_among_nulls(tmp_path: Path) -> None:
+    """It finds composite foreign keys by whole key, ignoring partial matches."""
+    resources = [
+        {
+            "name": "parent",
+            "schema": {
+                "fields": [
+                    {"name": "code", "type": "string"},
+                    {"name": "n", "type": "integer"},
+                ]
+            },
+        },
+        {
+            "name": "child",
+            "schema": {
+                "fields": [
+                    {"name": "code", "type": "string"},
+                    {"name": "n", "type": "integer"},
+                ],
+                "foreignKeys": [
+                    {
+                        "fields": ["code", "n"],
+                        "reference": {"resource": "parent", "fields": ["code", "n"]},
+                    }
+                ],
+            },
+        },
+    ]
+    tables = {
+        "parent": "code,n\ny,\n,2\nx,\nx,1\n",
+        "child": "code,n\nx,2\nx,1\nx,\n,2\ny,-1\n",
+    }
+    report = validate(write_package(tmp_path, resources, tables))
+    assert summarize(report)[1] == [
+        (
+            "foreign-key-error",
+            str(resources[1]["schema"]["foreignKeys"][0]),
+            ["['x', 2]", "['y', -1]"],
+        )
+    ]
+
+
+def test_checks_foreign_keys_sharing_a_reference(tmp_path: Path) -> None:
+    """It checks foreign keys of several tables referencing the same key."""
+    fields = [{"name": "id", "type": "integer"}, {"name": "parent", "type": "integer"}]
+    foreignKeys = [
+        {"fields": "id", "reference": {"resource": "dim", "fields": "id"}},
+        {"fields": "parent", "reference": {"resource": "", "fields": "id"}},
+    ]
+    resources = [
+        {"name": "dim", "schema": {"fields": fields[:1]}},
+        {"name": "a", "schema": {"fields": fields, "foreignKeys": foreignKeys}},
+        {"name": "b", "schema": {"fields": fields, "foreignKeys": foreignKeys[:1]}},
+        {"name": "c", "schema": {"fields": fields, "foreignKeys": foreignKeys[:1]}},
+    ]
+    tables = {
+        "dim": "id\n1\n2\n",
+        "a": "id,parent\n1,\n2,1\n3,4\n",
+        "b": "id,parent\n1,\n1,\n",
+        "c": "id,parent\n4,\n2,\n4,\n",
+    }
+    report = validate(write_package(tmp_path, resources, tables))
+    assert [[e["values"] for e in table["errors"]] for table in report["tables"]] == [
+        [],
+        [[[3]], [[4]]],
+        [],
+        [[[4]]],
+    ]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_checks_foreign_keys_across_numeric_types(
+    tmp_path: Path, chunksize: int
+) -> None:
+    """It matches whole numbers in a foreign key to integers in the reference."""
+    resources = [
+        {"name": "parent", "schema": {"fields": [{"name": "id", "type": "integer"}]}},
+        {
+            "name": "child",
+            "schema": {
+                "fields": [{"name": "id", "type": "number"}],
+                "foreignKeys": [
+                    {
+                        "fields": "id",
+                        "reference": {"resource": "parent", "fields": "id"},
+                    }
+                ],
+            },
+        },
+    ]
+    tables = {"parent": "id\n1\n2\n3\n", "child": "id\n1.0\n2\n3.0\n3.5\n"}
+    path = write_package(tmp_path, resources, tables)
+    report = validate(path, chunksize=chunksize)
+    errors = report["tables"][1]["errors"]
+    assert [(e["code"], e["values"]) for e in errors] == [
+        ("foreign-key-error", [[3.5]])
+    ]
+
+
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_orders_errors_in_chunks_as_in_full(tmp_path: Path, chunksize: int) -> None:
+    """It reports errors in the same order when reading tables in chunks."""
+    resources = [
+        {
+            "name": "table",
+            "schema": {
+                "fields": [
+                    {"name": "x", "type": "integer", "constraints": {"unique": True}},
+                    {"name": "y", "type": "string", "constraints": {"enum": ["a"]}},
+                ],
+                "uniqueKeys": [["x", "y"]],
+            },
+        }
+    ]
+    tables = {"table": "x,y\n2,a\n1,b\n1,b\n"}
+    path = write_package(tmp_path, resources, tables)
+    expected = validate(path)["tables"][0]["errors"]
+    errors = validate(path, chunksize=chunksize)["tables"][0]["errors"]
+    order = [(e["code"], e.get("fieldName"), e.get("constraintName")) for e in errors]
+    assert order == [
+        (e["code"], e.get("fieldName"), e.get("constraintName")) for e in expected
+    ]
+    assert [e["code"] for e in errors] == [
+        "constraint-error",
+        "constraint-error",
+        "unique-key-error",
+    ]
+
+
+def strip_times(report: dict) -> dict:
+    """Remove times from a report."""
+    report = json.loads(json.dumps(report, default=str))
+    report.pop("time")
+    for table in report["tables"]:
+        table.pop("time")
+    return report
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_validates_with_workers(package: str, chunksize: int) -> None:
+    """It reports the same errors when checking tables concurrently."""
+    expected = validate(package, chunksize=chunksize)
+    report = validate(package, chunksize=chunksize, workers=3)
+    assert strip_times(report) == strip_times(expected)
+
+
+@pytest.mark.parametrize("cache_by", ["content", "stat"])
+def test_validates_with_cache(
+    package: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cache_by: str
+) -> None:
+    """It reuses cached results for unchanged tables, and checks foreign keys."""
+    module = sys.modules["goodtables_pandas.validate"]
+    read_table = module.read_table
+    reads = []
+
+    def counting_read_table(resource: dict, **kwargs: Any) -> Any:
+        reads.append(resource["name"])
+        return read_table(resource, **kwargs)
+
+    monkeypatch.setattr(module, "read_table", counting_read_table)
+    cache = str(tmp_path / "cache")
+    expected = validate(package)
+    reads.clear()
+    for _ in range(2):
+        report = validate(package, cache=cache, cache_by=cache_by)
+        assert strip_times(report) == strip_times(expected)
+    assert reads == ["parent", "child", "typed"]
+    # Change child table only
+    child = Path(package).parent / "child.csv"
+    child.write_text("id,code\n1,a\n5,a\n")
+    reads.clear()
+    report = validate(package, cache=cache, cache_by=cache_by)
+    assert reads == ["child"]
+    assert strip_times(report) == strip_times(validate(package))
+    assert report["tables"][1]["stats"]["errors"] == 2
+    with pytest.raises(ValueError):
+        validate(package, cache=cache, return_tables=True)
+
+
+def test_checks_cached_foreign_keys_by_value(
+    package: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It checks foreign keys against cached tables by value rather than hash."""
+    # All key values hash equal
+    monkeypatch.setattr(
+        sys.modules["goodtables_pandas.check"],
+        "_hash_column",
+        lambda x: np.zeros(len(x), dtype=np.uint64),
+    )
+    cache = str(tmp_path / "cache")
+    expected = validate(package)
+    for _ in range(2):
+        report = validate(package, cache=cache)
+        assert strip_times(report) == strip_times(expected)
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"not a pickle", b"cmissing_module\nmissing\n."]
+)
+def test_validates_with_unreadable_cache(
+    package: str, tmp_path: Path, content: bytes
+) -> None:
+    """It checks again the tables whose cached results cannot be read."""
+    cache = tmp_path / "cache"
+    expected = validate(package)
+    validate(package, cache=str(cache))
+    files = list(cache.glob("*.pickle"))
+    for file in files:
+        file.write_bytes(content)
+    report = validate(package, cache=str(cache))
+    assert strip_times(report) == strip_times(expected)
+    assert all(file.read_bytes() != content for file in files)
+
+
+def test_hashes_table_with_options(
+    package: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It hashes tables differently for options that change how they are checked."""
+    resource = {"name": "parent", "path": "parent.csv"}
+    path = [str(Path(package).parent / "parent.csv")]
+    key = hash_table(resource, path)
+    assert hash_table(resource, path) == key
+    assert hash_table(resource, path, chunksize=2) != key
+    assert hash_table(resource, path, engine="pyarrow") != key
+    assert hash_table(resource, path, row_numbers=True) != key
+    monkeypatch.setattr(OPTIONS, "parse_unique_ratio", 0)
+    assert hash_table(resource, path) != key
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_validates_with_pyarrow(tmp_path: Path, chunksize: int) -> None:
+    """It reports the same errors when reading tables with pyarrow."""
+    pytest.importorskip("pyarrow")
+    fields = [
+        {"name": "id", "type": "integer", "constraints": {"required": True}},
+        {"name": "x", "type": "string", "constraints": {"maxLength": 3}},
+        {"name": "y", "type": "number"},
+    ]
+    resources = [
+        {"name": "plain", "schema": {"fields": fields, "primaryKey": "id"}},
+        {
+            "name": "dialect",
+            "dialect": {"delimiter": ";", "header": False, "nullSequence": "NA"},
+            "schema": {"fields": fields, "missingValues": ["", "-"]},
+        },
+        {
+            "name": "comment",
+            "dialect": {"commentChar": "#"},
+            "schema": {"fields": fields},
+        },
+    ]
+    tables = {
+        "plain": 'id,x,y\n1, a,1.5\n2,"b,cd",\n, ,3\n2,"d\ne",2\n',
+        "dialect": "1;a;-\n2; NA;2\nNA;abcd; 3\n",
+        "comment": "id,x,y\n1,a,1\n#2,b,x\n3,cdef,3\n",
+    }
+    path = write_package(tmp_path, resources, tables)
+    expected = validate(path, chunksize=chunksize)
+    report = validate(path, chunksize=chunksize, engine="pyarrow")
+    assert strip_times(report) == strip_times(expected)
+    assert report["stats"]["errors"] == 6
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+def test_skips_initial_space_with_pyarrow(tmp_path: Path, chunksize: int) -> None:
+    """It skips spaces after delimiters, but not within quotes, with pyarrow."""
+    pytest.importorskip("pyarrow")
+    fields = [
+        {"name": "id", "type": "integer"},
+        {"name": "x", "type": "string", "constraints": {"pattern": "[a-z]"}},
+    ]
+    resources = [{"name": "table", "schema": {"fields": fields}}]
+    tables = {"table": 'id,x\n1,a\n2,b\n3," b"\n4, c\n5, "d"\n'}
+    path = write_package(tmp_path, resources, tables)
+    expected = validate(path, chunksize=chunksize)
+    report = validate(path, chunksize=chunksize, engine="pyarrow")
+    assert strip_times(report) == strip_times(expected)
+    assert report["tables"][0]["errors"][0]["values"] == [" b"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 2])
+def test_reads_short_rows_with_pyarrow(tmp_path: Path, chunksize: int) -> None:
+    """It reads blank rows and rows with fewer values as they are read with c."""
+    pytest.importorskip("pyarrow")
+    fields = [{"name": "id", "type": "integer"}, {"name": "x", "type": "string"}]
+    resources = [{"name": "table", "schema": {"fields": fields}}]
+    tables = {"table": "id,x\n1,a\n\n2\n3,c\n"}
+    path = write_package(tmp_path, resources, tables)
+    expected = validate(path, chunksize=chunksize)
+    report = validate(path, chunksize=chunksize, engine="pyarrow")
+    assert strip_times(report) == strip_times(expected)
+    assert report["valid"]
+    assert report["tables"][0]["stats"]["rows"] == 4
+
+
+@pytest.mark.parametrize("chunksize", [None, 1])
+def test_reads_byte_order_mark_with_pyarrow(tmp_path: Path, chunksize: int) -> None:
+    """It ignores a byte order mark when reading tables with pyarrow."""
+    pytest.importorskip("pyarrow")
+    fields = [
+        {"name": "id", "type": "integer"},
+        {"name": "x", "type": "string", "constraints": {"maxLength": 1}},
+    ]
+    resources = [
+        {"name": "header", "schema": {"fields": fields}},
+        {
+            "name": "noheader",
+            "dialect": {"header": False},
+            "schema": {"fields": fields},
+        },
+    ]
+    tables = {"header": "\ufeffid,x\n1,a\n2,bc\n", "noheader": "\ufeff1,a\n2,bc\n"}
+    path = write_package(tmp_path, resources, tables)
+    expected = validate(path, chunksize=chunksize)
+    report = validate(path, chunksize=chunksize, engine="pyarrow")
+    assert strip_times(report) == strip_times(expected)
+    assert report["stats"]["errors"] == 2
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_validates_parquet_and_feather(tmp_path: Path, chunksize: int) -> None:
+    """It reports the same errors for typed columns as for the same values in csv."""
+    pytest.importorskip("pyarrow")
+    schema = {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "x", "type": "string", "constraints": {"pattern": "[ab]"}},
+            {"name": "y", "type": "number", "constraints": {"maximum": 5}},
+            {"name": "z", "type": "integer"},
+            {"name": "b", "type": "boolean"},
+            {"name": "d", "type": "date", "constraints": {"maximum": "2020-01-02"}},
+        ],
+        "primaryKey": "id",
+    }
+    df = pd.DataFrame(
+        {
+            "extra": [0, 0, 0, 0],
+            "id": [1, 2, 2, 3],
+            "x": ["a", "b", "c", None],
+            "y": [1.5, 2, None, 7],
+            "z": [1.0, None, 2.0, 3.0],
+            "b": pd.array([True, None, False, True], dtype="boolean"),
+            "d": pd.to_datetime(["2020-01-01", "2020-01-02", None, "2020-01-03"]),
+        }
+    )
+    df.to_parquet(tmp_path / "parquet.parquet")
+    df.to_feather(tmp_path / "feather.arrow")
+    resources = [
+        {"name": "csv", "schema": schema},
+        {"name": "parquet", "path": "parquet.parquet", "schema": schema},
+        {
+            "name": "feather",
+            "path": "feather.arrow",
+            "format": "feather",
+            "schema": schema,
+        },
+    ]
+    tables = {
+        "csv": (
+            "id,x,y,z,b,d\n1,a,1.5,1,true,2020-01-01\n2,b,2,,,2020-01-02\n"
+            "2,c,,2,false,\n3,,7,3,true,2020-01-03\n"
+        )
+    }
+    path = write_package(tmp_path, resources, tables)
+    report = validate(path, chunksize=chunksize)
+    expected, parquet, feather = summarize(report)
+    assert parquet == feather == expected
+    assert len(expected) == 4
+    assert [table["stats"]["rows"] for table in report["tables"]] == [4, 4, 4]
+
+
+def test_checks_column_types(tmp_path: Path) -> None:
+    """It checks typed columns against field types, and requires all fields."""
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"x": [1.0, 1.5], "y": [True, False], "z": ["1", "2"]})
+    df.to_parquet(tmp_path / "typed.parquet")
+    fields = [
+        {"name": "x", "type": "integer"},
+        {"name": "y", "type": "number"},
+        {"name": "z", "type": "integer"},
+    ]
+    resources = [
+        {"name": "typed", "path": "typed.parquet", "schema": {"fields": fields}},
+        {
+            "name": "missing",
+            "path": "typed.parquet",
+            "schema": {"fields": fields + [{"name": "w", "type": "string"}]},
+        },
+    ]
+    report = validate(write_package(tmp_path, resources, {}))
+    typed, missing = report["tables"]
+    assert [(e["code"], e["fieldName"]) for e in typed["errors"]] == [
+        ("type-error", "x"),
+        ("type-error", "y"),
+    ]
+    assert typed["errors"][0]["values"] == [1.5]
+    assert "bool" in typed["errors"][1]["note"]
+    assert [e["code"] for e in missing["errors"]] == ["source-error"]
+    assert "['w']" in missing["errors"][0]["note"]
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_reads_table_parts_with_workers(tmp_path: Path, engine: str) -> None:
+    """It reads the files of a table concurrently, and names a file that fails."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    fields = [{"name": "id", "type": "integer"}, {"name": "x", "type": "number"}]
+    resources = [
+        {
+            "name": "parts",
+            "path": [f"part{i}.csv" for i in range(4)],
+            "schema": {"fields": fields, "primaryKey": "id"},
+        },
+        {
+            "name": "broken",
+            "path": ["part0.csv", "broken.csv", "part1.csv"],
+            "schema": {"fields": fields},
+        },
+    ]
+    tables = {f"part{i}": f"id,x\n{i},{i}\n{i + 1},{i}.5\n" for i in range(4)}
+    tables["broken"] = "id,x\n1,1\n2,2,2\n"
+    path = write_package(tmp_path, resources, tables)
+    expected, dfs = validate(path, engine=engine, return_tables=True)
+    report, parallel_dfs = validate(path, engine=engine, workers=3, return_tables=True)
+    assert strip_times(report) == strip_times(expected)
+    pd.testing.assert_frame_equal(parallel_dfs["parts"], dfs["parts"])
+    assert dfs["parts"]["id"].tolist() == [0, 1, 1, 2, 2, 3, 3, 4]
+    assert dfs["parts"].index.tolist() == [0, 1] * 4
+    (error,) = report["tables"][0]["errors"]
+    assert (error["fieldName"], error["values"]) == ("id", [1, 2, 3])
+    (error,) = report["tables"][1]["errors"]
+    assert error["code"] == "source-error"
+    assert error["note"].startswith("Part 2 of 3 (")
+    assert "broken.csv" in error["note"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_validates_compressed_tables(
+    tmp_path: Path, engine: str, chunksize: int
+) -> None:
+    """It reads compressed tables as they are decompressed."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    schema = {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "x", "type": "string", "constraints": {"maxLength": 1}},
+        ],
+        "primaryKey": "id",
+    }
+    text = "id,x\n1,a\n2,b\n2,cd\n3,e\n"
+    compressions = {"gz": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+    try:
+        import pyarrow
+    except ImportError:
+        pass
+    else:
+        compressions["zst"] = lambda x: pyarrow.compress(x, "zstd", asbytes=True)
+    resources = [{"name": "plain", "schema": schema}]
+    for extension, compress in compressions.items():
+        (tmp_path / f"table.csv.{extension}").write_bytes(compress(text.encode()))
+        resources.append(
+            {"name": extension, "path": f"table.csv.{extension}", "schema": schema}
+        )
+    # Compression declared rather than detected from the file extension
+    (tmp_path / "table.dat").write_bytes(bz2.compress(text.encode()))
+    resources.append(
+        {
+            "name": "declared",
+            "path": "table.dat",
+            "format": "csv",
+            "compression": "bz2",
+            "schema": schema,
+        }
+    )
+    path = write_package(tmp_path, resources, {"plain": text})
+    report = validate(path, engine=engine, chunksize=chunksize)
+    expected, *compressed = summarize(report)
+    assert expected == [
+        ("constraint-error", "id", ["2"]),
+        ("constraint-error", "x", ["cd"]),
+    ]
+    assert compressed == [expected] * (len(compressions) + 1)
+    assert not any(table["valid"] for table in report["tables"])
+    # Frictionless plugin is only registered during validation
+    assert "goodtables_pandas" not in frictionless.system.plugins
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_validates_compressed_table_parts(
+    tmp_path: Path, engine: str, chunksize: int
+) -> None:
+    """It detects the compression of table parts that share a file extension."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    schema = {"fields": [{"name": "id", "type": "integer"}], "primaryKey": "id"}
+    parts = ["id\n1\n2\n", "id\n2\n3\n"]
+    compressions = {"bz2": bz2.compress, "xz": lzma.compress}
+    try:
+        import pyarrow
+    except ImportError:
+        pass
+    else:
+        compressions["zst"] = lambda x: pyarrow.compress(x, "zstd", asbytes=True)
+    resources = []
+    for extension, compress in compressions.items():
+        path = [f"{i}.csv.{extension}" for i in range(len(parts))]
+        for p, text in zip(path, parts):
+            (tmp_path / p).write_bytes(compress(text.encode()))
+        resources.append({"name": extension, "path": path, "schema": schema})
+    report = validate(
+        write_package(tmp_path, resources, {}), engine=engine, chunksize=chunksize
+    )
+    expected = [("constraint-error", "id", ["2"])]
+    assert summarize(report) == [expected] * len(compressions)
+    assert all(table["stats"]["rows"] == 4 for table in report["tables"])
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_validates_zip_package(package: str, chunksize: int) -> None:
+    """It reads a package from a zip archive, without extracting it."""
+    folder = Path(package).parent
+    archive = folder / "package.zip"
+    with zipfile.ZipFile(archive, "w") as zip:
+        names = ["datapackage.json", "parent.csv", "child.csv", "typed.csv"]
+        for i, name in enumerate(names):
+            # Files both stored as is (read through a memory map) and compressed
+            compression = zipfile.ZIP_DEFLATED if i % 2 else zipfile.ZIP_STORED
+            zip.write(folder / name, f"package/{name}", compress_type=compression)
+    expected = validate(package, chunksize=chunksize)
+    report = validate(str(archive), chunksize=chunksize)
+    assert summarize(report) == summarize(expected)
+    assert [table["path"] for table in report["tables"]] == [
+        os.path.join(str(archive), "package", f"{name}.csv")
+        for name in ("parent", "child", "typed")
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_validates_frames(package: str, workers: int) -> None:
+    """It reports the same errors for tables in memory as for files."""
+    expected = validate(package)
+    folder = os.path.dirname(package)
+    frames = {
+        name: pd.read_csv(os.path.join(folder, name + ".csv"))
+        for name in ("parent", "child", "typed")
+    }
+    report, dfs = validate_frames(package, frames, return_tables=True, workers=workers)
+    assert summarize(report) == summarize(expected)
+    assert report["stats"]["errors"] == expected["stats"]["errors"]
+    assert [table["stats"]["rows"] for table in report["tables"][:2]] == [5, 6]
+    assert dfs["child"]["id"].dtype == "Int64"
+    assert frames["child"]["id"].dtype == float
+    frames["child"] = frames["child"].rename(columns={"code": "label"})
+    report = validate_frames(package, frames)
+    assert [e["code"] for e in report["tables"][1]["errors"]] == ["incorrect-label"]
+    with pytest.raises(ValueError):
+        validate_frames(package, {"parent": frames["parent"]})
+
+
+def test_validates_categorical_frames(package: str, tmp_path: Path) -> None:
+    """It checks categorical columns as the values of their categories."""
+    expected = validate(package)
+    folder = os.path.dirname(package)
+    frames = {
+        name: pd.read_csv(os.path.join(folder, name + ".csv")).astype("category")
+        for name in ("parent", "child", "typed")
+    }
+    report = validate_frames(package, frames)
+    assert summarize(report) == summarize(expected)
+    resources = [
+        {
+            "name": "table",
+            "schema": {
+                "fields": [
+                    {"name": "b", "type": "boolean"},
+                    {"name": "d", "type": "date"},
+                ]
+            },
+        }
+    ]
+    df = pd.DataFrame(
+        {"b": [True, None, False], "d": [datetime.date(2020, 1, 1), None, "x"]}
+    ).astype("category")
+    (tmp_path / "frames").mkdir()
+    path = write_package(tmp_path / "frames", resources, {})
+    report = validate_frames(path, {"table": df})
+    assert summarize(report) == [[("type-error", "d", ["x"])]]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_caps_and_counts_invalid_values(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, chunksize: int
+) -> None:
+    """It lists the most frequent invalid values, and counts rows and values."""
+    monkeypatch.setattr(OPTIONS, "max_values", 1)
+    resources = [
+        {
+            "name": "parent",
+            "schema": {"fields": [{"name": "id", "type": "integer"}]},
+        },
+        {
+            "name": "child",
+            "schema": {
+                "fields": [
+                    {"name": "id", "type": "integer"},
+                    {"name": "x", "type": "string", "constraints": {"enum": ["a"]}},
+                ],
+                "foreignKeys": [
+                    {
+                        "fields": "id",
+                        "reference": {"resource": "parent", "fields": "id"},
+                    }
+                ],
+            },
+        },
+        {"name": "typed", "schema": {"fields": [{"name": "x", "type": "integer"}]}},
+    ]
+    tables = {
+        "parent": "id\n1\n",
+        "child": "id,x\n1,a\n2,b\n3,c\n3,c\n",
+        "typed": "x\n1\ny\nz\nz\nz\n",
+    }
+    report = validate(write_package(tmp_path, resources, tables), chunksize=chunksize)
+    summary = sorted(
+        (e["code"], e["values"], e["rowCount"], e["valueCount"])
+        for table in report["tables"]
+        for e in table["errors"]
+    )
+    assert [(code, rows, values) for code, _, rows, values in summary] == [
+        ("constraint-error", 3, 2),
+        ("foreign-key-error", 3, 2),
+        ("type-error", 4, 2),
+    ]
+    assert all(len(values) == 1 for _, values, _, _ in summary)
+    if not chunksize:
+        # Most frequent (chunks are instead listed in order)
+        assert [values for _, values, _, _ in summary] == [["c"], [[3]], ["z"]]
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_lists_rows_of_invalid_values(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, engine: str, chunksize: int
+) -> None:
+    """It lists the rows of invalid values as row ranges in each file."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(OPTIONS, "max_values", 4)
+    fields = [
+        {"name": "id", "type": "integer"},
+        {"name": "x", "type": "string", "constraints": {"enum": ["a"]}},
+    ]
+    resources = [
+        {
+            "name": "parts",
+            "path": ["part0.csv", "part1.csv"],
+            "schema": {"fields": fields, "primaryKey": "id"},
+        }
+    ]
+    tables = {
+        "part0": "id,x\n1,a\n2,b\n3,b\n4,a\n",
+        "part1": "id,x\n5,a\n1,b\n6,b\n7,b\n",
+    }
+    path = write_package(tmp_path, resources, tables)
+    report = validate(path, engine=engine, chunksize=chunksize, row_numbers=True)
+    errors = {e["fieldName"]: e for e in report["tables"][0]["errors"]}
+    files = report["tables"][0]["path"]
+    assert errors["id"]["rowNumbers"] == [[files[1], 2, 2]]
+    assert errors["x"]["rowCount"] == 5
+    assert errors["x"]["rowNumbers"] == [[files[0], 2, 3], [files[1], 2, 3]]
+    assert "rowNumbers" not in validate(path, engine=engine)["tables"][0]["errors"][0]
+
+
+def test_lists_rows_of_moved_package_from_cache(tmp_path: Path) -> None:
+    """It lists the rows of cached results in the files where the table is now."""
+    fields = [{"name": "x", "type": "integer"}]
+    resources = [{"name": "table", "schema": {"fields": fields}}]
+    (tmp_path / "old").mkdir()
+    path = write_package(tmp_path / "old", resources, {"table": "x\n1\na\n"})
+    cache = str(tmp_path / "cache")
+    validate(path, cache=cache, row_numbers=True)
+    (tmp_path / "old").rename(tmp_path / "new")
+    path = str(tmp_path / "new" / "datapackage.json")
+    report = validate(path, cache=cache, row_numbers=True)
+    table = report["tables"][0]
+    assert table["errors"][0]["rowNumbers"] == [[table["path"], 2, 2]]
+    assert Path(table["path"]).parent.name == "new"
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_stops_at_error_limit(package: str, chunksize: int) -> None:
+    """It stops checking tables once the error limit is reached."""
+    expected = validate(package, chunksize=chunksize)
+    assert expected["stats"]["errors"] == 6
+    report = validate(package, chunksize=chunksize, error_limit=1)
+    assert report["stats"]["errors"] == 1
+    assert not report["valid"]
+    assert report["tables"][0]["errors"][0] in expected["tables"][0]["errors"]
+    # Tables after the first are not read, and foreign keys are not checked
+    assert not any(table["errors"] for table in report["tables"][1:])
+    report = validate(package, chunksize=chunksize, error_limit=10, fail_fast=True)
+    assert summarize(report) == summarize(expected)
+    with pytest.raises(ValueError):
+        validate(package, error_limit=0)
+
+
+def test_stops_field_at_first_invalid_values(tmp_path: Path) -> None:
+    """It stops parsing and checking each field at its first invalid values."""
+    resources = [
+        {
+            "name": "table",
+            "schema": {
+                "fields": [
+                    {"name": "date", "type": "date"},
+                    {
+                        "name": "x",
+                        "type": "string",
+                        "constraints": {"required": True, "enum": ["a"]},
+                    },
+                ]
+            },
+        }
+    ]
+    valid = [("2020-01-01", "a")] * 2000
+    rows = valid[:10] + [("y", "")] + valid + [("z", "b")]
+    text = "date,x\n" + "".join(f"{date},{x}\n" for date, x in rows)
+    path = write_package(tmp_path, resources, {"table": text})
+    report = validate(path)
+    assert report["tables"][0]["errors"][0]["values"] == ["y", "z"]
+    report = validate(path, fail_fast=True)
+    assert [e["values"] for e in report["tables"][0]["errors"]] == [["y"]]
+    resources[0]["schema"]["fields"][0]["type"] = "string"
+    path = write_package(tmp_path, resources, {"table": text})
+    errors = validate(path, fail_fast=True)["tables"][0]["errors"]
+    assert [e["constraintName"] for e in errors] == ["required"]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_measures_stages(package: str, chunksize: int) -> None:
+    """It measures the time and memory taken by each stage of checking a table."""
+    report = validate(package, chunksize=chunksize, profile=True)
+    parent, child, _ = (table["stats"]["stages"] for table in report["tables"])
+    assert list(parent["parse"]) == list(parent["constraints"]) == ["id", "code", "x"]
+    assert list(parent["uniqueKeys"]) == ["id,code"]
+    assert list(child["foreignKeys"]) == ["id,code", "id"]
+    for stats in (parent["read"], *child["foreignKeys"].values()):
+        assert stats["time"] >= 0
+        assert "allocated" in stats
+        assert stats["peak"] >= 0
+    assert "stages" not in validate(package)["tables"][0]["stats"]